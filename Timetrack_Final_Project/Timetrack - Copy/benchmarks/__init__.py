@@ -0,0 +1 @@
+# Database benchmarks (python -m benchmarks.db_bench)
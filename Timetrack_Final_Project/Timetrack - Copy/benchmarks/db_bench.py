@@ -0,0 +1,379 @@
+# benchmarks/db_bench.py
+"""Latency benchmarks for the database layer (db_queries.__all__) at several data scales.
+
+    python -m benchmarks.db_bench run --scales 100x1,1000x1,1000x5,10000x1 --repeat 20
+    python -m benchmarks.db_bench compare benchmarks/results/before.json benchmarks/results/after.json
+
+Each scale (<employees>x<years>) is a generated database (src.utils.synthetic_data, named
+Timetrack_bench_<scale>_s<seed>) that is created on first use and reused afterwards. Every
+scale is measured in a fresh process pointed at its database with Timetrack_DB_NAME. Per
+function: one cold call (after FLUSH TABLES, so table handles and metadata are reopened; the
+InnoDB buffer pool cannot be dropped without restarting the server) and --repeat warm calls,
+reported as latency percentiles plus the connections and statements one call costs.
+"""
+from __future__ import annotations
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+RESULTS_DIR = os.path.join("benchmarks", "results")
+DEFAULT_SCALES = "100x1,1000x1,1000x5,10000x1"
+DEFAULT_REPEAT = 20
+# p50 slower than this (percent) counts as a regression in compare
+DEFAULT_THRESHOLD = 10.0
+
+# db_queries.__all__ names that are not timed, with the reason (writes would change the dataset
+# between repetitions)
+SKIPPED = {
+    'hash_password': "no database access",
+    'RAW_ATTENDANCE_COLUMNS': "constant",
+    'ATTENDANCE_STATUSES': "constant",
+    'punch_status': "no database access",
+    'add_employee': "writes",
+    'set_employee_image_path': "writes",
+    'set_employee_image_paths': "writes",
+    'insert_employees': "writes",
+    'update_employee': "writes",
+    'delete_employee': "writes",
+    'add_or_update_staff': "writes",
+    'delete_staff': "writes",
+    'employee_check_in': "writes",
+    'employee_check_out': "writes",
+    'insert_attendance_records': "writes",
+}
+
+
+def parse_scales(text: str) -> list[tuple[int, int]]:
+    scales = []
+    for part in (p.strip() for p in text.split(",") if p.strip()):
+        employees, _, years = part.lower().partition("x")
+        if not (employees.isdigit() and years.isdigit() and int(employees) > 0 and int(years) > 0):
+            raise ValueError(f"scale must look like 1000x3 (employees x years): {part!r}")
+        scales.append((int(employees), int(years)))
+    return scales
+
+
+def bench_database(employees: int, years: int, seed: int) -> str:
+    return f"Timetrack_bench_{employees}x{years}_s{seed}"
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), math.ceil(pct / 100.0 * len(sorted_values))))
+    return sorted_values[rank - 1]
+
+
+def _cases(ctx: dict) -> list[tuple[str, str, tuple]]:
+    """(label, db_queries function name, args) for every timed call."""
+    emp_id, year, month = ctx['employee_id'], ctx['year'], ctx['month']
+    last_30 = (ctx['month_start'], ctx['today'])
+    cases = [
+        ("get_all_employees", "get_all_employees", ()),
+        ("get_employee_by_id", "get_employee_by_id", (emp_id,)),
+        ("get_employee_image_paths", "get_employee_image_paths", ()),
+        ("get_employee_ids", "get_employee_ids", ()),
+        ("search_employees", "search_employees", (ctx['search'],)),
+        ("get_employees_page[first]", "get_employees_page", ()),
+        ("get_employees_page[query]", "get_employees_page", (None, 50, "name", False, ctx['search'])),
+        ("authenticate_user", "authenticate_user", ("admin", "admin123", "Admin")),
+        ("get_all_staff", "get_all_staff", ()),
+        ("get_employees_month_absences", "get_employees_month_absences", (ctx['page_ids'],)),
+        ("get_today_attendance", "get_today_attendance", ()),
+        ("get_today_stats", "get_today_stats", ()),
+        ("count_attendance_records", "count_attendance_records", last_30),
+        ("get_table_row_counts", "get_table_row_counts", ()),
+        ("iter_attendance_records", "iter_attendance_records", last_30),
+        ("get_employee_monthly_hours", "get_employee_monthly_hours", (emp_id, year)),
+        ("get_employee_yearly_hours", "get_employee_yearly_hours", (emp_id,)),
+        ("get_all_employees_hours_for_month", "get_all_employees_hours_for_month", (year, month)),
+        ("get_all_employees_hours_for_year", "get_all_employees_hours_for_year", (year,)),
+        ("get_employees_monthly_hours_bulk", "get_employees_monthly_hours_bulk", (year,)),
+        ("get_employees_yearly_hours_bulk", "get_employees_yearly_hours_bulk", ()),
+    ]
+    for period in ("daily", "weekly", "monthly", "yearly"):
+        cases.append((f"get_department_attendance[{period}]", "get_department_attendance", (period,)))
+    for period in ("month", "year"):
+        cases.append((f"get_employee_details[{period}]", "get_employee_details", (emp_id, period)))
+    return cases
+
+
+def _context() -> dict:
+    """Arguments for the cases: a mid-list active employee, this month, a page of ids."""
+    from src.database import db_queries
+    employees = sorted(db_queries.get_all_employees(), key=lambda e: e['employee_id'])
+    if not employees:
+        raise RuntimeError("The benchmark database has no active employees")
+    sample = employees[len(employees) // 2]
+    today = date.today()
+    return {
+        'employee_id': sample['employee_id'],
+        'search': sample['full_name'].split()[-1][:4],
+        'page_ids': [e['employee_id'] for e in employees[:50]],
+        'today': today,
+        'month_start': today.replace(day=1),
+        'year': today.year,
+        'month': today.month,
+    }
+
+
+def _consume(result):
+    # Generators (iter_attendance_records) only hit the database when iterated
+    if hasattr(result, '__next__'):
+        return sum(len(chunk) for chunk in result)
+    return len(result) if hasattr(result, '__len__') else 1
+
+
+def _drop_caches() -> None:
+    """Best effort 'cold' state: close cached table handles (and the query cache on MySQL 5.x)."""
+    from src.database.db_config import get_db_connection
+    conn = get_db_connection()
+    if not conn:
+        return
+    try:
+        with conn.cursor() as cursor:
+            for statement in ("FLUSH TABLES", "RESET QUERY CACHE"):
+                try:
+                    cursor.execute(statement)
+                except Exception:
+                    pass  # no RELOAD privilege / no query cache (MySQL 8)
+    finally:
+        conn.close()
+
+
+class _RoundTrips:
+    def __init__(self):
+        self.connects = 0
+        self.queries = 0
+        self.db_seconds = 0.0
+
+    def __call__(self, kind: str, statement: str, seconds: float) -> None:
+        if kind == 'connect':
+            self.connects += 1
+        elif kind == 'query':
+            self.queries += 1
+        self.db_seconds += seconds
+
+
+def measure(repeat: int = DEFAULT_REPEAT, only: Optional[list[str]] = None) -> dict:
+    """Time every case against the current database (Timetrack_DB_NAME). Runs in this process."""
+    from src.database import db_queries
+    from src.database.db_config import add_query_observer, remove_query_observer
+
+    ctx = _context()
+    results = {}
+    for label, name, args in _cases(ctx):
+        if only and not any(o in label for o in only):
+            continue
+        fn = getattr(db_queries, name)
+
+        _drop_caches()
+        trips = _RoundTrips()
+        add_query_observer(trips)
+        try:
+            start = time.perf_counter()
+            rows = _consume(fn(*args))
+            cold_ms = (time.perf_counter() - start) * 1000.0
+        finally:
+            remove_query_observer(trips)
+
+        warm = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            _consume(fn(*args))
+            warm.append((time.perf_counter() - start) * 1000.0)
+        warm.sort()
+        results[label] = {
+            'function': name,
+            'rows': rows,
+            'connects': trips.connects,
+            'queries': trips.queries,
+            'db_ms': round(trips.db_seconds * 1000.0, 3),
+            'cold_ms': round(cold_ms, 3),
+            'p50_ms': round(percentile(warm, 50), 3),
+            'p90_ms': round(percentile(warm, 90), 3),
+            'p99_ms': round(percentile(warm, 99), 3),
+            'min_ms': round(warm[0], 3) if warm else 0.0,
+            'max_ms': round(warm[-1], 3) if warm else 0.0,
+            'mean_ms': round(sum(warm) / len(warm), 3) if warm else 0.0,
+        }
+        print(f"  {label:<40} cold {cold_ms:9.2f} ms   p50 {results[label]['p50_ms']:9.2f} ms   "
+              f"p99 {results[label]['p99_ms']:9.2f} ms   {trips.connects} conn / {trips.queries} queries",
+              flush=True)
+
+    timed = {name for _label, name, _args in _cases(ctx)}
+    unclassified = sorted(set(db_queries.__all__) - timed - set(SKIPPED))
+    for name in unclassified:
+        print(f"  warning: {name} is neither benchmarked nor in SKIPPED")
+    return {'results': results, 'unclassified': unclassified, 'context': {
+        'employee_id': ctx['employee_id'], 'year': ctx['year'], 'month': ctx['month']}}
+
+
+def _dataset_info(database: str) -> Optional[dict]:
+    """Employees, punches and last punch date of a bench database, or None if it is missing."""
+    import pymysql
+    try:
+        conn = pymysql.connect(host='127.0.0.1', port=3306, user='root', password='',
+                               database=database, charset='utf8mb4')
+    except pymysql.Error:
+        return None
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM employees")
+            employees = int(cursor.fetchone()[0])
+            cursor.execute("SELECT COUNT(*), MAX(date) FROM attendance_records")
+            punches, last = cursor.fetchone()
+            return {'employees': employees, 'punches': int(punches), 'last_date': last}
+    except pymysql.Error:
+        return None
+    finally:
+        conn.close()
+
+
+def _last_weekday(day: date) -> date:
+    """The last weekday on or before `day`: synthetic_data writes no weekend punches."""
+    return day - timedelta(days=max(0, day.weekday() - 4))
+
+
+def _ensure_dataset(employees: int, years: int, seed: int, regenerate: bool) -> dict:
+    database = bench_database(employees, years, seed)
+    info = _dataset_info(database)
+    # Regenerate when missing, resized, or stale (the "today" functions need the latest punches)
+    if (regenerate or info is None or info['employees'] != employees
+            or info['last_date'] != _last_weekday(date.today())):
+        print(f"Generating {database} ...", flush=True)
+        subprocess.run([sys.executable, "-m", "src.utils.synthetic_data", "--mysql", "--database", database,
+                        "--employees", str(employees), "--years", str(years), "--seed", str(seed),
+                        "--end-date", date.today().isoformat()], check=True)
+        info = _dataset_info(database)
+        if info is None:
+            raise RuntimeError(f"Could not generate {database}")
+    return {'database': database, 'employees': info['employees'], 'punches': info['punches']}
+
+
+def run(scales: list[tuple[int, int]], repeat: int, seed: int, regenerate: bool,
+        only: Optional[list[str]], out_path: str) -> dict:
+    report = {
+        'created_at': datetime.now().isoformat(timespec="seconds"),
+        'machine': platform.node(),
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'repeat': repeat,
+        'seed': seed,
+        'skipped': SKIPPED,
+        'scales': {},
+    }
+    for employees, years in scales:
+        label = f"{employees}x{years}"
+        dataset = _ensure_dataset(employees, years, seed, regenerate)
+        print(f"Scale {label}: {dataset['employees']:,} employees, {dataset['punches']:,} punches", flush=True)
+        # A fresh process per scale: DB_NAME is read at import, and no state carries over
+        tmp_path = f"{out_path}.{label}.tmp"
+        cmd = [sys.executable, "-m", "benchmarks.db_bench", "measure", "--repeat", str(repeat), "--out", tmp_path]
+        if only:
+            cmd += ["--only", ",".join(only)]
+        subprocess.run(cmd, check=True, env={**os.environ, "Timetrack_DB_NAME": dataset['database']})
+        with open(tmp_path, encoding="utf-8") as f:
+            measured = json.load(f)
+        os.remove(tmp_path)
+        report['scales'][label] = {**dataset, **measured}
+
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {out_path}")
+    return report
+
+
+def compare(base: dict, new: dict, threshold: float = DEFAULT_THRESHOLD) -> list[str]:
+    """Print p50/p99/round-trip changes per scale and function; returns the regressions."""
+    regressions = []
+    for scale, new_scale in new['scales'].items():
+        base_scale = base['scales'].get(scale)
+        if base_scale is None:
+            print(f"\n{scale}: not in the baseline")
+            continue
+        print(f"\n{scale} ({new_scale.get('employees', 0):,} employees, {new_scale.get('punches', 0):,} punches)")
+        print(f"  {'function':<40} {'p50 base':>10} {'p50 new':>10} {'change':>8} {'p99 new':>10} {'queries':>9}")
+        for label, r in new_scale['results'].items():
+            b = base_scale['results'].get(label)
+            if b is None:
+                print(f"  {label:<40} {'-':>10} {r['p50_ms']:>10.2f} {'new':>8}")
+                continue
+            change = (r['p50_ms'] - b['p50_ms']) / b['p50_ms'] * 100.0 if b['p50_ms'] else 0.0
+            trips = f"{b['queries']}->{r['queries']}" if b['queries'] != r['queries'] else str(r['queries'])
+            flag = ""
+            if change > threshold:
+                flag = "  REGRESSION"
+                regressions.append(f"{scale} {label}: p50 {b['p50_ms']:.2f} -> {r['p50_ms']:.2f} ms ({change:+.0f}%)")
+            print(f"  {label:<40} {b['p50_ms']:>10.2f} {r['p50_ms']:>10.2f} {change:>+7.0f}% "
+                  f"{r['p99_ms']:>10.2f} {trips:>9}{flag}")
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.db_bench", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_p = commands.add_parser("run", help="generate/reuse the scale databases and time every function")
+    run_p.add_argument("--scales", default=DEFAULT_SCALES, help="comma-separated <employees>x<years> (default: %(default)s)")
+    run_p.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="warm calls per function")
+    run_p.add_argument("--seed", type=int, default=0)
+    run_p.add_argument("--regenerate", action="store_true", help="rebuild the scale databases")
+    run_p.add_argument("--only", default="", help="comma-separated substrings of function labels")
+    run_p.add_argument("--out", default=None, help="results JSON (default: benchmarks/results/<timestamp>.json)")
+    measure_p = commands.add_parser("measure", help="time the current Timetrack_DB_NAME database only")
+    measure_p.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    measure_p.add_argument("--only", default="")
+    measure_p.add_argument("--out", required=True)
+    compare_p = commands.add_parser("compare", help="compare two results files")
+    compare_p.add_argument("base")
+    compare_p.add_argument("new")
+    compare_p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                           help="p50 slowdown (%%) reported as a regression (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        with open(args.base, encoding="utf-8") as f:
+            base = json.load(f)
+        with open(args.new, encoding="utf-8") as f:
+            new = json.load(f)
+        regressions = compare(base, new, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:g}%:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        return 0
+
+    if args.repeat <= 0:
+        parser.error("--repeat must be positive")
+    only = [o.strip() for o in args.only.split(",") if o.strip()] or None
+    if args.command == "measure":
+        measured = measure(args.repeat, only)
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(measured, f, indent=2)
+        return 0
+
+    try:
+        scales = parse_scales(args.scales)
+    except ValueError as e:
+        parser.error(str(e))
+    out_path = args.out or os.path.join(RESULTS_DIR, f"{datetime.now():%Y%m%d_%H%M%S}.json")
+    try:
+        run(scales, args.repeat, args.seed, args.regenerate, only, out_path)
+    except (subprocess.CalledProcessError, RuntimeError) as e:
+        print(f"Benchmark aborted: {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,316 @@
+# benchmarks/kiosk_load.py
+"""Load test for kiosk punches: N concurrent kiosks calling employee_check_in/check_out.
+
+    python -m benchmarks.kiosk_load --kiosks 20 --employees 1000 --curve shift-start --duration 60
+    python -m benchmarks.kiosk_load --kiosks 20 --curve burst --retap-rate 0.1 --checkout
+
+Runs against Timetrack_DB_NAME (default Timetrack_bench_load, generated with synthetic_data
+when missing); today's records of the employees used are deleted first. Arrivals follow
+--curve over --duration seconds and queue for the next free kiosk, like people at the door.
+Each kiosk is a thread doing what the employee dashboard does: the punch, then (on success)
+reloading today's attendance. A share of employees tap twice on different kiosks (--retap-rate)
+to provoke double check-ins; duplicates are counted in the database afterwards.
+"""
+from __future__ import annotations
+import argparse
+import json
+import math
+import os
+import queue
+import random
+import subprocess
+import sys
+import threading
+import time
+from typing import Optional
+
+DEFAULT_DATABASE = "Timetrack_bench_load"
+CURVES = ("shift-start", "uniform", "ramp", "poisson", "burst")
+# Second taps of the same badge land this soon after the first (seconds)
+RETAP_WINDOW = 0.2
+
+
+def arrival_times(curve: str, count: int, duration: float, rng: random.Random) -> list[float]:
+    """Sorted arrival offsets (seconds from the start) for `count` people."""
+    if count <= 0:
+        return []
+    if curve == "burst":
+        times = [rng.uniform(0, 0.05) for _ in range(count)]
+    elif curve == "uniform":
+        times = [i * duration / count for i in range(count)]
+    elif curve == "ramp":
+        # Density grows linearly to the end of the window (inverse CDF of t/duration)
+        times = [duration * math.sqrt(rng.random()) for _ in range(count)]
+    elif curve == "poisson":
+        times, t = [], 0.0
+        rate = count / max(duration, 1e-6)
+        for _ in range(count):
+            t += rng.expovariate(rate)
+            times.append(min(t, duration))
+    else:
+        # shift-start: most people arrive in the minutes before the start time (60% into the window)
+        times = [min(max(rng.gauss(duration * 0.6, duration / 6.0), 0.0), duration) for _ in range(count)]
+    return sorted(times)
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(1, min(len(sorted_values), math.ceil(pct / 100.0 * len(sorted_values)))) - 1]
+
+
+class _ConnectErrors:
+    """Query observer counting failed connects per thread (check-in returns False for those too)."""
+
+    def __init__(self):
+        self.local = threading.local()
+
+    def reset(self) -> None:
+        self.local.errors = 0
+
+    def count(self) -> int:
+        return getattr(self.local, 'errors', 0)
+
+    def __call__(self, kind: str, statement: str, seconds: float) -> None:
+        if kind == 'connect_error':
+            self.local.errors = getattr(self.local, 'errors', 0) + 1
+
+
+def _kiosk(jobs: "queue.Queue", records: list, lock: threading.Lock, observer: _ConnectErrors,
+           refresh: bool, t0: float) -> None:
+    from src.database.db_queries import employee_check_in, employee_check_out, get_today_attendance
+    actions = {'check_in': employee_check_in, 'check_out': employee_check_out}
+    kiosk = threading.current_thread().name
+    while True:
+        job = jobs.get()
+        if job is None:
+            return
+        scheduled, emp_id, action = job
+        observer.reset()
+        start = time.perf_counter()
+        outcome, error = None, None
+        try:
+            outcome = bool(actions[action](emp_id))
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        end = time.perf_counter()
+        if observer.count():
+            error = error or "connection failed"
+        refresh_ms = None
+        if refresh and outcome:
+            try:
+                get_today_attendance()
+            except Exception as e:
+                error = f"refresh {type(e).__name__}: {e}"
+            refresh_ms = (time.perf_counter() - end) * 1000.0
+        with lock:
+            records.append({
+                'kiosk': kiosk, 'employee_id': emp_id, 'action': action, 'ok': outcome, 'error': error,
+                'scheduled_s': scheduled, 'start_s': start - t0, 'end_s': end - t0,
+                'latency_ms': (end - start) * 1000.0, 'wait_ms': max(0.0, (start - t0 - scheduled) * 1000.0),
+                'refresh_ms': refresh_ms,
+            })
+
+
+def run_phase(action: str, schedule: list[tuple[float, int]], kiosks: int, refresh: bool) -> list[dict]:
+    """Replay (offset, employee_id) arrivals through `kiosks` threads; returns one record per punch."""
+    from src.database.db_config import add_query_observer, remove_query_observer
+    jobs: "queue.Queue" = queue.Queue()
+    records: list[dict] = []
+    lock = threading.Lock()
+    observer = _ConnectErrors()
+    add_query_observer(observer)
+    t0 = time.perf_counter()
+    threads = [threading.Thread(target=_kiosk, name=f"kiosk-{i + 1:02d}",
+                                args=(jobs, records, lock, observer, refresh, t0), daemon=True)
+               for i in range(kiosks)]
+    for t in threads:
+        t.start()
+    try:
+        for offset, emp_id in schedule:
+            delay = offset - (time.perf_counter() - t0)
+            if delay > 0:
+                time.sleep(delay)
+            jobs.put((offset, emp_id, action))
+        for _ in threads:
+            jobs.put(None)
+        for t in threads:
+            t.join()
+    finally:
+        remove_query_observer(observer)
+    return records
+
+
+def summarize(records: list[dict]) -> dict:
+    latencies = sorted(r['latency_ms'] for r in records)
+    waits = sorted(r['wait_ms'] for r in records)
+    refreshes = sorted(r['refresh_ms'] for r in records if r['refresh_ms'] is not None)
+    ok = [r for r in records if r['ok']]
+    span = (max(r['end_s'] for r in records) - min(r['start_s'] for r in records)) if records else 0.0
+    per_second: dict[int, int] = {}
+    for r in ok:
+        per_second[int(r['end_s'])] = per_second.get(int(r['end_s']), 0) + 1
+    errors: dict[str, int] = {}
+    for r in records:
+        if r['error']:
+            errors[r['error']] = errors.get(r['error'], 0) + 1
+
+    def stats(values: list[float]) -> dict:
+        return {'p50_ms': round(percentile(values, 50), 2), 'p90_ms': round(percentile(values, 90), 2),
+                'p99_ms': round(percentile(values, 99), 2), 'max_ms': round(values[-1], 2) if values else 0.0}
+
+    return {
+        'attempts': len(records),
+        'succeeded': len(ok),
+        'refused': sum(1 for r in records if r['ok'] is False and not r['error']),
+        'errors': sum(errors.values()),
+        'error_kinds': errors,
+        'elapsed_s': round(span, 3),
+        'throughput_per_s': round(len(ok) / span, 1) if span > 0 else 0.0,
+        'peak_per_s': max(per_second.values()) if per_second else 0,
+        'latency': stats(latencies),
+        'queue_wait': stats(waits),
+        'refresh': stats(refreshes),
+    }
+
+
+def _prepare(database: str, employees: int, seed: int) -> list[int]:
+    """Make sure the database has enough employees; clear their records for today."""
+    from src.database.db_config import get_db_connection
+    from src.database.db_queries import get_all_employees
+    ids = sorted(e['employee_id'] for e in get_all_employees())
+    if len(ids) < employees:
+        print(f"Generating {database} with {employees} employees ...", flush=True)
+        subprocess.run([sys.executable, "-m", "src.utils.synthetic_data", "--mysql", "--database", database,
+                        "--employees", str(employees), "--years", "0.1", "--seed", str(seed),
+                        "--inactive-rate", "0"], check=True)
+        ids = sorted(e['employee_id'] for e in get_all_employees())
+        if len(ids) < employees:
+            raise RuntimeError(f"{database} has only {len(ids)} active employees")
+    ids = ids[:employees]
+    conn = get_db_connection()
+    if not conn:
+        raise RuntimeError(f"Cannot connect to {database}")
+    try:
+        with conn.cursor() as cursor:
+            placeholders = ", ".join(["%s"] * len(ids))
+            cursor.execute(
+                f"DELETE FROM attendance_records WHERE date = CURDATE() AND employee_id IN ({placeholders})", ids
+            )
+        conn.commit()
+    finally:
+        conn.close()
+    return ids
+
+
+def count_duplicates(employee_ids: list[int]) -> dict:
+    """Employees with more than one check-in row today, the extra rows, and up to 10 of their ids.
+
+    A double check-out overwrites time_out and leaves no row behind, so it is not counted here.
+    """
+    from src.database.db_config import get_db_connection
+    conn = get_db_connection()
+    if not conn:
+        raise RuntimeError("Database connection failed")
+    try:
+        with conn.cursor() as cursor:
+            placeholders = ", ".join(["%s"] * len(employee_ids))
+            cursor.execute(
+                f"""
+                SELECT employee_id, COUNT(*) AS n FROM attendance_records
+                WHERE date = CURDATE() AND time_in IS NOT NULL AND employee_id IN ({placeholders})
+                GROUP BY employee_id HAVING COUNT(*) > 1
+                """,
+                employee_ids
+            )
+            rows = cursor.fetchall() or []
+            return {'employees': len(rows), 'extra_rows': sum(int(r['n']) - 1 for r in rows),
+                    'sample': [int(r['employee_id']) for r in rows[:10]]}
+    finally:
+        conn.close()
+
+
+def _schedule(ids: list[int], curve: str, duration: float, retap_rate: float,
+              rng: random.Random) -> list[tuple[float, int]]:
+    order = ids[:]
+    rng.shuffle(order)
+    schedule = list(zip(arrival_times(curve, len(order), duration, rng), order))
+    # Impatient second taps of the same badge, almost at once, on whichever kiosk is free
+    retaps = [(t + rng.uniform(0, RETAP_WINDOW), emp) for t, emp in schedule if rng.random() < retap_rate]
+    return sorted(schedule + retaps)
+
+
+def _print_summary(action: str, s: dict) -> None:
+    print(f"\n{action}: {s['succeeded']:,}/{s['attempts']:,} succeeded, {s['refused']:,} refused, "
+          f"{s['errors']:,} error(s) in {s['elapsed_s']:.1f} s")
+    print(f"  throughput {s['throughput_per_s']:.1f} punches/s (peak {s['peak_per_s']} in one second)")
+    for name in ("latency", "queue_wait", "refresh"):
+        st = s[name]
+        print(f"  {name:<11} p50 {st['p50_ms']:8.1f} ms   p90 {st['p90_ms']:8.1f} ms   "
+              f"p99 {st['p99_ms']:8.1f} ms   max {st['max_ms']:8.1f} ms")
+    for error, n in sorted(s['error_kinds'].items(), key=lambda kv: -kv[1]):
+        print(f"  {n:>6} x {error}")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.kiosk_load", description=__doc__.splitlines()[0])
+    parser.add_argument("--kiosks", type=int, default=20)
+    parser.add_argument("--employees", type=int, default=500, help="people arriving (one check-in each)")
+    parser.add_argument("--curve", choices=CURVES, default="shift-start")
+    parser.add_argument("--duration", type=float, default=30.0, help="arrival window in seconds")
+    parser.add_argument("--retap-rate", type=float, default=0.05, help="share of people who tap twice")
+    parser.add_argument("--checkout", action="store_true", help="run a check-out phase with the same curve")
+    parser.add_argument("--no-refresh", dest="refresh", action="store_false",
+                        help="skip the today's-attendance reload after each successful punch")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", default=None, help="also write the summary (and every punch) to this file")
+    parser.add_argument("--force", action="store_true", help="allow running against the app's own database")
+    args = parser.parse_args(argv)
+    if args.kiosks <= 0 or args.employees <= 0 or args.duration < 0:
+        parser.error("--kiosks and --employees must be positive, --duration not negative")
+    if not 0.0 <= args.retap_rate <= 1.0:
+        parser.error("--retap-rate must be between 0 and 1")
+
+    database = os.environ.setdefault("Timetrack_DB_NAME", DEFAULT_DATABASE)
+    from src.database.db_config import is_app_database
+    if is_app_database(database) and not args.force:
+        parser.error("Timetrack_DB_NAME is the app's database (today's records would be deleted); pass --force")
+
+    rng = random.Random(args.seed)
+    try:
+        ids = _prepare(database, args.employees, args.seed)
+    except (RuntimeError, subprocess.CalledProcessError) as e:
+        print(f"Cannot prepare {database}: {e}")
+        return 1
+    print(f"{database}: {len(ids):,} employees, {args.kiosks} kiosks, curve {args.curve} over {args.duration:g} s, "
+          f"retap rate {args.retap_rate:g}", flush=True)
+
+    report = {'database': database, 'parameters': {k: v for k, v in vars(args).items() if k != "json"},
+              'phases': {}}
+    records_by_phase = {}
+    phases = ["check_in"] + (["check_out"] if args.checkout else [])
+    for action in phases:
+        schedule = _schedule(ids, args.curve, args.duration, args.retap_rate, rng)
+        records = run_phase(action, schedule, args.kiosks, args.refresh)
+        summary = summarize(records)
+        report['phases'][action] = summary
+        records_by_phase[action] = records
+        _print_summary(action, summary)
+
+    duplicates = count_duplicates(ids)
+    report['duplicates'] = duplicates
+    if duplicates['employees']:
+        print(f"\nDUPLICATE CHECK-INS: {duplicates['employees']} employee(s), {duplicates['extra_rows']} extra row(s) "
+              f"(e.g. {', '.join(map(str, duplicates['sample']))})")
+    else:
+        print("\nNo duplicate check-ins.")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({**report, 'punches': records_by_phase}, f, indent=2)
+        print(f"Report written to {args.json}")
+    return 1 if duplicates['employees'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,20 @@
 # main.py
+import time
+_T0 = time.perf_counter()  # process start reference for the startup timings
+
 import sys
 import os
 import traceback
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QTimer
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "0").strip() in {"1", "true", "True", "yes", "on"}
+
+
+def _print_import_report(profiler, since: int, title: str):
+    print(profiler.report(since=since, title=title))
 
 
 def main():
@@ -11,18 +23,95 @@ def main():
         # Add the current directory to Python path
         sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-        from src.database.db_setup import create_database_and_tables
-        from src.screens.employee_dashboard import AttendanceDashboard
-
-        print("Initializing database...")
-        create_database_and_tables()
+        # Startup profiling mode: per-module import-time tree printed once the window is up
+        profiler = None
+        if _env_flag("Timetrack_PROFILE_IMPORTS"):
+            from src.utils.import_profiler import start_import_profiler
+            profiler = start_import_profiler()
 
         print("Starting application...")
-        app = QApplication(sys.argv)
+        # QApplication subclasses for the diagnostics; both override notify() cooperatively
+        app_classes, app_kwargs = [], {}
+        if _env_flag("Timetrack_TRACE"):
+            # Trace spans from UI actions down to SQL; Chrome trace JSON saved on exit
+            from src.utils.tracing import TracingApplication
+            app_classes.append(TracingApplication)
+        if _env_flag("Timetrack_PROFILE_SLOTS"):
+            # Per-interaction profiles of slow slots (threshold overridable in ms)
+            from src.utils.slot_profiler import ProfilingApplication
+            from src.config import SLOT_PROFILE_THRESHOLD_MS
+            app_classes.append(ProfilingApplication)
+            app_kwargs["threshold_ms"] = float(os.environ.get("Timetrack_PROFILE_SLOW_MS", SLOT_PROFILE_THRESHOLD_MS))
+        if len(app_classes) > 1:
+            # Tracing outermost: each root span contains the profiled interaction
+            print("Tracing and slot profiling are both on; span times include cProfile overhead")
+            app_class = type("TracingProfilingApplication", tuple(app_classes), {})
+        else:
+            app_class = app_classes[0] if app_classes else QApplication
+        app = app_class(sys.argv, **app_kwargs)
+
+        if _env_flag("Timetrack_WATCH_STALLS"):
+            # Logs GUI-thread stalls with the blocking call site; per-location summary on exit
+            from src.utils.stall_watchdog import StallWatchdog
+            from src.config import STALL_THRESHOLD_MS
+            watchdog = StallWatchdog(float(os.environ.get("Timetrack_STALL_MS", STALL_THRESHOLD_MS)), parent=app)
+            watchdog.start()
+            app.aboutToQuit.connect(watchdog.stop)
+
+        if _env_flag("Timetrack_METRICS"):
+            # Prometheus text on localhost plus the DB latency indicator in the dashboards
+            from src.utils.metrics import start_metrics, stop_metrics
+            from src.config import METRICS_PORT
+            if start_metrics(int(os.environ.get("Timetrack_METRICS_PORT", METRICS_PORT))) is not None:
+                app.aboutToQuit.connect(stop_metrics)
+
+        from src.utils.startup import StartupPipeline, StartupMetrics
+        from src.screens.startup_splash import StartupSplash
+
+        # Splash first; DB initialization and the first data load run in the background
+        metrics = StartupMetrics(_T0, app)
+        splash = StartupSplash()
+        metrics.watch_first_paint(splash, "first paint")
+        splash.show()
+
+        pipeline = StartupPipeline(app)
+        windows = []
+
+        def _report_interactive():
+            metrics.mark("interactive")
+            print(metrics.report())
+            if profiler is not None:
+                _print_import_report(profiler, 0, "Startup imports")
+                startup_mark.append(profiler.mark())
+
+        def _open_dashboard(data):
+            from src.screens.employee_dashboard import AttendanceDashboard
+            metrics.mark("data loaded")
+            # Show the main employee dashboard
+            window = AttendanceDashboard(initial_attendance=data.get('attendance'))
+            windows.append(window)
+            metrics.watch_first_paint(window, "dashboard paint", then=_report_interactive)
+            window.showMaximized()
+            splash.close()
+
+        def _on_failed(message):
+            print(f"Startup failed: {message}")
+            splash.show_error(message)
+
+        pipeline.progress.connect(splash.set_progress)
+        pipeline.finished.connect(_open_dashboard)
+        pipeline.failed.connect(_on_failed)
+        splash.retry_requested.connect(pipeline.start)
+        splash.quit_requested.connect(app.quit)
+        print("Initializing database...")
+        # Start once the event loop runs so the splash paints before any DB work
+        QTimer.singleShot(0, pipeline.start)
 
-        # Show the main employee dashboard
-        window = AttendanceDashboard()
-        window.showMaximized()
+        startup_mark = []
+        if profiler is not None:
+            # Modules loaded lazily by tabs/dialogs during the session
+            app.aboutToQuit.connect(lambda: _print_import_report(
+                profiler, startup_mark[0] if startup_mark else 0, "Imports after startup"))
 
         # Run the application
         sys.exit(app.exec())
@@ -34,4 +123,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
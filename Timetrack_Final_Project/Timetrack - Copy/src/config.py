@@ -3,9 +3,61 @@
 
 ATTENDANCE_REFRESH_MS = 3000
 REPORTS_REFRESH_MS = 10000
+# The individual hours table aggregates every employee's month/year, so it refreshes less often
+INDIV_HOURS_REFRESH_MS = 60000
 INDIV_SEARCH_DEBOUNCE_MS = 300
+EMPLOYEE_SEARCH_DEBOUNCE_MS = 300
 TIME_TICK_MS = 1000
 
+# Refresh scheduler (src/utils/refresh_scheduler.py)
+SCHEDULER_COALESCE_MS = 250       # jobs due within this window run in the same tick
+SCHEDULER_TICK_BUDGET = 6         # cost units run per tick before deferring the rest
+SCHEDULER_IDLE_AFTER_MS = 120000  # no mouse/keyboard input for this long counts as idle
+SCHEDULER_IDLE_BACKOFF = 4        # interval multiplier while idle
+
+# Dashboard pages are built on first sidebar visit; when > 0, pages not visited yet are
+# prefetched (one per event-loop turn) this long after the dashboard opens. 0 = no prefetch
+PAGE_PREFETCH_DELAY_MS = 0
+
+# Employee Management table: rows fetched per page while scrolling
+EMPLOYEE_PAGE_SIZE = 50
+
+# Employee photo thumbnails (src/utils/thumbnails.py): files keyed by source path + mtime,
+# plus a bounded in-memory QPixmapCache layer
+THUMBNAIL_CACHE_DIR = "assets/.cache/thumbnails"
+THUMBNAIL_MEMORY_CACHE_KB = 10240
+
+# Employee photo ingest (src/utils/image_ingest.py): photos are resized, re-encoded as JPEG
+# and stored by content hash
+EMPLOYEE_IMAGE_DIR = "assets/employees"
+IMAGE_MAX_DIMENSION = 800
+IMAGE_JPEG_QUALITY = 85
+IMAGE_INGEST_WORKERS = 0  # processes for bulk imports; 0 = one per CPU
+
+# Bulk CSV import (src/utils/bulk_import.py): rows validated and written per transaction
+IMPORT_BATCH_SIZE = 5000
+
+# Slot profiling (src/utils/slot_profiler.py, Timetrack_PROFILE_SLOTS=1): interactions slower
+# than this are saved as one cProfile file each
+SLOT_PROFILE_THRESHOLD_MS = 100
+SLOT_PROFILE_DIR = "profiles"
+
+# Event-loop stall watchdog (src/utils/stall_watchdog.py, Timetrack_WATCH_STALLS=1): the GUI
+# thread's stack is sampled when the heartbeat is late by more than the threshold
+STALL_THRESHOLD_MS = 200
+STALL_HEARTBEAT_MS = 50
+STALL_LOG_FILE = "profiles/stalls.log"
+
+# Metrics exporter (src/utils/metrics.py, Timetrack_METRICS=1): Prometheus text on localhost
+METRICS_PORT = 9464
+METRICS_ROW_COUNT_TTL_S = 60  # table row counts are re-queried at most this often
+METRICS_INDICATOR_MS = 2000  # header DB latency indicator refresh
+
+# Trace spans (src/utils/tracing.py, Timetrack_TRACE=1): Chrome trace-event JSON files
+TRACE_DIR = "profiles"
+TRACE_MAX_EVENTS = 200000  # ring buffer; the oldest spans are dropped first
+TRACE_MIN_SPAN_MS = 1.0  # shorter spans without children are not kept
+
 # Time/date formats
 TIME_DISPLAY_FORMAT = "hh:mm:ss AP"
 DATE_DISPLAY_FORMAT = "MMMM d, yyyy"
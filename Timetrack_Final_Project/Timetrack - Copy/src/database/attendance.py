@@ -1,9 +1,9 @@
 # src/database/attendance.py
 from __future__ import annotations
-from typing import Optional
+from typing import Iterator, Optional
 from datetime import datetime, date, timedelta
 
-from .db_config import get_db_connection
+from .db_config import get_db_connection, StreamingCursor
 
 
 # --- Helper function for counting weekdays ---
@@ -25,6 +25,15 @@ def _count_weekdays(start: date, end: date) -> int:
 
 # --- Attendance operations ---
 
+ATTENDANCE_STATUSES = ('Present', 'Late', 'Absent')
+
+
+def punch_status(check_in: datetime) -> str:
+    """'Late' after 08:15 on the check-in day, else 'Present'."""
+    late_threshold = check_in.replace(hour=8, minute=15, second=0, microsecond=0)
+    return 'Late' if check_in > late_threshold else 'Present'
+
+
 def employee_check_in(employee_id: int) -> bool:
     """Handle employee check-in, compute status, and insert record if not already checked in."""
     conn = get_db_connection()
@@ -46,9 +55,7 @@ def employee_check_in(employee_id: int) -> bool:
             if cursor.fetchone():
                 return False # Already checked in today
             check_in = datetime.now()
-            start_time = check_in.replace(hour=8, minute=0, second=0, microsecond=0)
-            late_threshold = start_time.replace(minute=15)
-            status = 'Late' if check_in > late_threshold else 'Present'
+            status = punch_status(check_in)
             cursor.execute(
                 """
                 INSERT INTO attendance_records (employee_id, time_in, status, date)
@@ -212,6 +219,63 @@ def get_employee_details(employee_id: int, period: str = 'month') -> dict:
         conn.close()
 
 
+def get_employees_month_absences(employee_ids: list[int]) -> dict[int, dict]:
+    """Batch version of the 'month' absences/leave credits from get_employee_details.
+
+    Returns {employee_id: {'absences': int, 'leave_credits': int}} for ACTIVE employees,
+    using a single query for the whole list instead of one connection per employee.
+    """
+    ids = [int(i) for i in employee_ids or []]
+    if not ids:
+        return {}
+    conn = get_db_connection()
+    if not conn:
+        return {}
+    try:
+        with conn.cursor() as cursor:
+            placeholders = ", ".join(["%s"] * len(ids))
+            # Same window as get_employee_details: the last 30 days, but never before the hire date
+            # (or the first attendance record when created_at is missing)
+            cursor.execute(
+                f"""
+                SELECT s.employee_id, s.leave_credits, s.effective_start,
+                       COUNT(DISTINCT a.date) AS attended_days
+                FROM (
+                    SELECT e.employee_id, e.leave_credits,
+                           GREATEST(
+                               DATE_SUB(CURDATE(), INTERVAL 30 DAY),
+                               COALESCE(
+                                   DATE(e.created_at),
+                                   (SELECT MIN(x.date) FROM attendance_records x WHERE x.employee_id = e.employee_id),
+                                   CURDATE()
+                               )
+                           ) AS effective_start
+                    FROM employees e
+                    WHERE e.is_active = TRUE AND e.employee_id IN ({placeholders})
+                ) s
+                LEFT JOIN attendance_records a
+                  ON a.employee_id = s.employee_id AND a.date >= s.effective_start
+                GROUP BY s.employee_id, s.leave_credits, s.effective_start
+                """,
+                ids
+            )
+            today = date.today()
+            result = {}
+            for r in cursor.fetchall() or []:
+                effective_start = r['effective_start']
+                if hasattr(effective_start, 'date'):
+                    effective_start = effective_start.date()
+                working_days = _count_weekdays(effective_start, today)
+                attended_days = int(r.get('attended_days') or 0)
+                result[int(r['employee_id'])] = {
+                    'absences': max(0, working_days - attended_days),
+                    'leave_credits': r.get('leave_credits') if r.get('leave_credits') is not None else 15,
+                }
+            return result
+    finally:
+        conn.close()
+
+
 def get_department_attendance(period: str = 'daily') -> list[dict]:
     conn = get_db_connection()
     if not conn:
@@ -260,6 +324,7 @@ def get_today_attendance() -> list[dict]:
             cursor.execute(
                 """
                 SELECT e.employee_id, e.full_name,
+                       a.record_id,
                        a.time_in AS check_in,
                        a.time_out AS check_out,
                        a.status
@@ -267,6 +332,7 @@ def get_today_attendance() -> list[dict]:
                 LEFT JOIN attendance_records a
                   ON e.employee_id = a.employee_id AND a.date = CURDATE()
                 WHERE e.is_active = TRUE
+                ORDER BY e.employee_id, a.record_id
                 """
             )
             attendance = cursor.fetchall() or []
@@ -283,6 +349,149 @@ def get_today_attendance() -> list[dict]:
         conn.close()
 
 
+# Column order of iter_attendance_records rows
+RAW_ATTENDANCE_COLUMNS = (
+    'record_id', 'employee_id', 'full_name', 'department', 'date',
+    'time_in', 'time_out', 'status', 'hours_worked',
+)
+
+
+def count_attendance_records(start_date: date, end_date: date) -> int:
+    """Number of attendance rows dated start_date..end_date (inclusive)."""
+    conn = get_db_connection()
+    if not conn:
+        return 0
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT COUNT(*) AS n FROM attendance_records WHERE date BETWEEN %s AND %s",
+                (start_date, end_date)
+            )
+            return int((cursor.fetchone() or {}).get('n') or 0)
+    finally:
+        conn.close()
+
+
+def get_table_row_counts() -> dict:
+    """Row counts for health metrics: employees (all/active), staff users, punches (all/today)."""
+    conn = get_db_connection()
+    if not conn:
+        return {}
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT
+                    (SELECT COUNT(*) FROM employees) AS employees,
+                    (SELECT COUNT(*) FROM employees WHERE is_active = TRUE) AS employees_active,
+                    (SELECT COUNT(*) FROM staff_users) AS staff_users,
+                    (SELECT COUNT(*) FROM attendance_records) AS attendance_records,
+                    (SELECT COUNT(*) FROM attendance_records WHERE date = CURDATE()) AS attendance_today
+                """
+            )
+            row = cursor.fetchone() or {}
+            return {name: int(value or 0) for name, value in row.items()}
+    except Exception as e:
+        print(f"Error counting table rows: {e}")
+        return {}
+    finally:
+        conn.close()
+
+
+def iter_attendance_records(start_date: date, end_date: date, chunk_size: int = 5000) -> Iterator[list[tuple]]:
+    """Yield raw punches dated start_date..end_date in chunks of tuples (RAW_ATTENDANCE_COLUMNS).
+
+    Rows come from an unbuffered server-side cursor, so memory stays at one chunk however
+    large the range is. Closing the generator early drops the connection without draining
+    the remaining rows. Raises RuntimeError when the database is unreachable, so an export
+    cannot mistake it for an empty range.
+    """
+    conn = get_db_connection()
+    if not conn:
+        raise RuntimeError("Database connection failed")
+    cursor = conn.cursor(StreamingCursor)
+    finished = False
+    try:
+        cursor.execute(
+            """
+            SELECT a.record_id, a.employee_id, e.full_name, e.department, a.date,
+                   a.time_in, a.time_out, a.status,
+                   ROUND(TIMESTAMPDIFF(SECOND, a.time_in, a.time_out) / 3600, 2) AS hours_worked
+            FROM attendance_records a
+            JOIN employees e ON e.employee_id = a.employee_id
+            WHERE a.date BETWEEN %s AND %s
+            ORDER BY a.date, a.employee_id, a.record_id
+            """,
+            (start_date, end_date)
+        )
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                finished = True
+                break
+            yield list(rows)
+    finally:
+        try:
+            if finished:
+                cursor.close()
+            # An unfinished unbuffered result would be read to the end by cursor.close()
+            conn.close()
+        except Exception:
+            pass
+
+
+def insert_attendance_records(rows: list[tuple]) -> dict:
+    """Insert many punches in one transaction (bulk import of historical records).
+
+    rows are (employee_id, time_in, time_out, status, date). A row is skipped as a duplicate
+    when the employee already has a record on that date, in the database or earlier in
+    `rows` (one record per employee per day, as at the kiosk). Raises on failure after
+    rolling back. Returns {'inserted': n, 'duplicates': [indexes into rows]}.
+    """
+    if not rows:
+        return {'inserted': 0, 'duplicates': []}
+    conn = get_db_connection()
+    if not conn:
+        raise RuntimeError("Database connection failed")
+    try:
+        with conn.cursor() as cursor:
+            # One lookup for the whole batch instead of one per row
+            ids = sorted({r[0] for r in rows})
+            placeholders = ", ".join(["%s"] * len(ids))
+            cursor.execute(
+                f"""
+                SELECT DISTINCT employee_id, date FROM attendance_records
+                WHERE date BETWEEN %s AND %s AND employee_id IN ({placeholders})
+                """,
+                [min(r[4] for r in rows), max(r[4] for r in rows), *ids]
+            )
+            seen = {(int(r['employee_id']), r['date']) for r in cursor.fetchall() or []}
+            fresh, duplicates = [], []
+            for i, row in enumerate(rows):
+                key = (row[0], row[4])
+                if key in seen:
+                    duplicates.append(i)
+                    continue
+                seen.add(key)
+                fresh.append(row)
+            inserted = 0
+            if fresh:
+                inserted = cursor.executemany(
+                    """
+                    INSERT INTO attendance_records (employee_id, time_in, time_out, status, date)
+                    VALUES (%s, %s, %s, %s, %s)
+                    """,
+                    fresh
+                )
+            conn.commit()
+            return {'inserted': int(inserted or 0), 'duplicates': duplicates}
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
 def get_today_stats(for_date: Optional[date] = None) -> dict:
     if for_date is None:
         for_date = date.today()
@@ -568,3 +777,114 @@ def get_employee_yearly_hours(employee_id: str) -> list[dict]:
             return rows
     finally:
         conn.close()
+
+
+def _bulk_employee_filter(employee_ids: Optional[list[int]]) -> tuple[str, list]:
+    if not employee_ids:
+        return "", []
+    return f" AND e.employee_id IN ({', '.join(['%s'] * len(employee_ids))})", [int(i) for i in employee_ids]
+
+
+def get_employees_monthly_hours_bulk(year: int, employee_ids: Optional[list[int]] = None) -> dict[int, list[dict]]:
+    """get_employee_monthly_hours for many employees at once: {employee_id: rows}.
+
+    One grouped query for everyone (active employees, or just employee_ids); the expected
+    working days per month are computed here instead of one query per employee and month.
+    """
+    conn = get_db_connection()
+    if not conn:
+        return {}
+    try:
+        with conn.cursor() as cursor:
+            where, params = _bulk_employee_filter(employee_ids)
+            cursor.execute(
+                f"""
+                SELECT
+                    a.employee_id,
+                    MONTH(a.date) AS month,
+                    ROUND(SUM(TIMESTAMPDIFF(MINUTE, a.time_in, IFNULL(a.time_out, NOW()))/60.0), 2) AS hours,
+                    COUNT(DISTINCT CASE WHEN a.status IN ('Present', 'Late') THEN a.date END) AS worked_days,
+                    COUNT(DISTINCT a.date) AS attended_days,
+                    ROUND(SUM(CASE
+                        WHEN TIMESTAMPDIFF(MINUTE, a.time_in, IFNULL(a.time_out, NOW()))/60.0 > 8
+                        THEN TIMESTAMPDIFF(MINUTE, a.time_in, IFNULL(a.time_out, NOW()))/60.0 - 8
+                        ELSE 0
+                    END), 2) AS overtime
+                FROM attendance_records a
+                JOIN employees e ON e.employee_id = a.employee_id
+                WHERE e.is_active = TRUE AND a.date BETWEEN %s AND %s{where}
+                GROUP BY a.employee_id, MONTH(a.date)
+                ORDER BY a.employee_id, month
+                """,
+                [date(year, 1, 1), date(year, 12, 31), *params]
+            )
+            rows = cursor.fetchall() or []
+    finally:
+        conn.close()
+
+    today = date.today()
+    working_days = {}
+    result: dict[int, list[dict]] = {}
+    for r in rows:
+        month = int(r['month'])
+        if month not in working_days:
+            month_start = date(year, month, 1)
+            month_end = (date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)) - timedelta(days=1)
+            working_days[month] = _count_weekdays(month_start, min(month_end, today))
+        attended_days = int(r.pop('attended_days') or 0)
+        r['hours'] = r['hours'] or 0
+        r['absences'] = max(0, working_days[month] - attended_days)
+        r['worked_days'] = r['worked_days'] or 0
+        r['expected_days'] = working_days[month]
+        r['overtime'] = r['overtime'] or 0
+        result.setdefault(int(r.pop('employee_id')), []).append(r)
+    return result
+
+
+def get_employees_yearly_hours_bulk(employee_ids: Optional[list[int]] = None) -> dict[int, list[dict]]:
+    """get_employee_yearly_hours for many employees at once: {employee_id: rows} (one query)."""
+    conn = get_db_connection()
+    if not conn:
+        return {}
+    try:
+        with conn.cursor() as cursor:
+            where, params = _bulk_employee_filter(employee_ids)
+            cursor.execute(
+                f"""
+                SELECT a.employee_id, e.created_at, YEAR(a.date) AS year,
+                       ROUND(SUM(TIMESTAMPDIFF(MINUTE, a.time_in, IFNULL(a.time_out, NOW()))/60.0), 2) AS hours,
+                       COUNT(DISTINCT CASE WHEN a.status IN ('Present', 'Late') THEN a.date END) AS worked_days,
+                       COUNT(DISTINCT a.date) AS attended_days,
+                       ROUND(SUM(CASE
+                        WHEN TIMESTAMPDIFF(MINUTE, a.time_in, IFNULL(a.time_out, NOW()))/60.0 > 8
+                        THEN TIMESTAMPDIFF(MINUTE, a.time_in, IFNULL(a.time_out, NOW()))/60.0 - 8
+                        ELSE 0
+                       END), 2) AS overtime
+                FROM attendance_records a
+                JOIN employees e ON e.employee_id = a.employee_id
+                WHERE e.is_active = TRUE{where}
+                GROUP BY a.employee_id, e.created_at, YEAR(a.date)
+                ORDER BY a.employee_id, year
+                """,
+                params
+            )
+            rows = cursor.fetchall() or []
+    finally:
+        conn.close()
+
+    today = date.today()
+    result: dict[int, list[dict]] = {}
+    for r in rows:
+        y = int(r['year'])
+        created_at = r.pop('created_at')
+        year_start = date(y, 1, 1)
+        hire_date = created_at.date() if created_at else year_start
+        expected_days = _count_weekdays(max(year_start, hire_date), min(date(y, 12, 31), today))
+        attended_days = int(r.pop('attended_days') or 0)
+        r['hours'] = r.get('hours', 0) or 0
+        r['worked_days'] = r.get('worked_days', 0) or 0
+        r['expected_days'] = expected_days
+        r['absences'] = max(0, int(expected_days) - attended_days)
+        r['overtime'] = r.get('overtime', 0) or 0
+        result.setdefault(int(r.pop('employee_id')), []).append(r)
+    return result
@@ -1,13 +1,68 @@
 # db_config.py
+import os
+import time
 import pymysql
-from pymysql.cursors import DictCursor
+from pymysql.cursors import DictCursor, SSCursor
+
+APP_DB_NAME = 'Timetrack'
+# Timetrack_DB_NAME points the app and tools at another database (e.g. a generated benchmark dataset)
+DB_NAME = os.environ.get('Timetrack_DB_NAME', APP_DB_NAME)
+
+
+def is_app_database(name):
+    """True if `name` is the app's real database (MySQL on Windows ignores the case of names)."""
+    return name.lower() == APP_DB_NAME.lower()
+
+# Callbacks fn(kind, statement, seconds) for every connect ('connect', or 'connect_error' when
+# it fails) and statement sent ('query'); used by benchmarks and diagnostics. Empty in normal runs.
+_query_observers = []
+
+
+def add_query_observer(fn):
+    _query_observers.append(fn)
+
+
+def remove_query_observer(fn):
+    try:
+        _query_observers.remove(fn)
+    except ValueError:
+        pass
+
+
+def _notify(kind, statement, seconds):
+    for fn in list(_query_observers):
+        try:
+            fn(kind, statement, seconds)
+        except Exception as e:
+            print(f"Query observer failed: {e}")
+
+
+class _ObservedMixin:
+    # pymysql's executemany funnels every statement it sends through execute()
+    def execute(self, query, args=None):
+        if not _query_observers:
+            return super().execute(query, args)
+        start = time.perf_counter()
+        try:
+            return super().execute(query, args)
+        finally:
+            _notify('query', query, time.perf_counter() - start)
+
+
+class ObservedDictCursor(_ObservedMixin, DictCursor):
+    """Default cursor of get_db_connection (dict rows)."""
+
+
+class StreamingCursor(_ObservedMixin, SSCursor):
+    """Unbuffered tuple cursor for large result sets: conn.cursor(StreamingCursor)."""
 
-DB_NAME = 'Timetrack'
 
 def get_db_connection():
     """
     Establishes and returns a connection to the MySQL database using XAMPP defaults.
     """
+    start = time.perf_counter()
+    connection = None
     try:
         connection = pymysql.connect(
             host='127.0.0.1',
@@ -16,9 +71,13 @@ def get_db_connection():
             password='',
             database=DB_NAME,
             charset='utf8mb4',
-            cursorclass=DictCursor
+            cursorclass=ObservedDictCursor
         )
         return connection
     except pymysql.Error as e:
         print(f"Error connecting to MySQL: {e}")
-        return None
\ No newline at end of file
+        return None
+    finally:
+        if _query_observers:
+            _notify('connect' if connection is not None else 'connect_error', DB_NAME,
+                    time.perf_counter() - start)
@@ -15,9 +15,14 @@ from .employees import (
     get_employee_by_id,
     add_employee,
     set_employee_image_path,
+    set_employee_image_paths,
+    get_employee_image_paths,
+    get_employee_ids,
+    insert_employees,
     update_employee,
     delete_employee,
     search_employees,
+    get_employees_page,
 )
 
 from .auth import (
@@ -31,13 +36,23 @@ from .attendance import (
     employee_check_in,
     employee_check_out,
     get_employee_details,
+    get_employees_month_absences,
     get_department_attendance,
     get_today_attendance,
     get_today_stats,
+    count_attendance_records,
+    get_table_row_counts,
+    iter_attendance_records,
+    insert_attendance_records,
+    punch_status,
+    ATTENDANCE_STATUSES,
+    RAW_ATTENDANCE_COLUMNS,
     get_employee_monthly_hours,
     get_all_employees_hours_for_month,
     get_all_employees_hours_for_year,
     get_employee_yearly_hours,
+    get_employees_monthly_hours_bulk,
+    get_employees_yearly_hours_bulk,
 )
 
 __all__ = [
@@ -45,11 +60,16 @@ __all__ = [
     'hash_password',
     # employees
     'get_all_employees', 'get_employee_by_id', 'add_employee', 'set_employee_image_path',
-    'update_employee', 'delete_employee', 'search_employees',
+    'set_employee_image_paths', 'get_employee_image_paths', 'get_employee_ids', 'insert_employees',
+    'update_employee', 'delete_employee', 'search_employees', 'get_employees_page',
     # auth
     'authenticate_user', 'add_or_update_staff', 'get_all_staff', 'delete_staff',
     # attendance
-    'employee_check_in', 'employee_check_out', 'get_employee_details', 'get_department_attendance',
+    'employee_check_in', 'employee_check_out', 'get_employee_details', 'get_employees_month_absences',
+    'get_department_attendance',
     'get_today_attendance', 'get_today_stats', 'get_employee_monthly_hours',
+    'count_attendance_records', 'get_table_row_counts', 'iter_attendance_records', 'RAW_ATTENDANCE_COLUMNS',
+    'insert_attendance_records', 'punch_status', 'ATTENDANCE_STATUSES',
     'get_all_employees_hours_for_month', 'get_all_employees_hours_for_year', 'get_employee_yearly_hours',
+    'get_employees_monthly_hours_bulk', 'get_employees_yearly_hours_bulk',
 ]
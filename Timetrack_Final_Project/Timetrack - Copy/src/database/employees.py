@@ -87,6 +87,89 @@ def set_employee_image_path(employee_id: int, image_path: str) -> bool:
         conn.close()
 
 
+def set_employee_image_paths(paths: list[tuple[int, str]]) -> int:
+    """Batch form of set_employee_image_path; paths are (employee_id, image_path) pairs.
+    Returns the number of rows updated."""
+    if not paths:
+        return 0
+    conn = get_db_connection()
+    if not conn:
+        return 0
+    try:
+        with conn.cursor() as cursor:
+            updated = cursor.executemany(
+                "UPDATE employees SET image_path = %s WHERE employee_id = %s",
+                [(image_path, employee_id) for employee_id, image_path in paths]
+            )
+            conn.commit()
+            return int(updated or 0)
+    except Exception:
+        conn.rollback()
+        return 0
+    finally:
+        conn.close()
+
+
+def get_employee_image_paths() -> list[dict]:
+    """employee_id and image_path of every employee (active or not) that has a photo."""
+    conn = get_db_connection()
+    if not conn:
+        return []
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT employee_id, image_path FROM employees "
+                "WHERE image_path IS NOT NULL AND image_path <> ''"
+            )
+            return cursor.fetchall() or []
+    finally:
+        conn.close()
+
+
+def get_employee_ids() -> set[int]:
+    """Ids of every employee, active or not (used to validate imported punches)."""
+    conn = get_db_connection()
+    if not conn:
+        return set()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT employee_id FROM employees")
+            return {int(r['employee_id']) for r in cursor.fetchall() or []}
+    finally:
+        conn.close()
+
+
+def insert_employees(rows: list[tuple]) -> int:
+    """Insert many employees in one transaction (bulk import).
+
+    rows are (employee_id or None, full_name, position, department, leave_credits, is_active);
+    a None id lets AUTO_INCREMENT assign one. Raises on failure after rolling back, so a
+    batch is either fully written or not at all. Returns the number of rows inserted.
+    """
+    if not rows:
+        return 0
+    conn = get_db_connection()
+    if not conn:
+        raise RuntimeError("Database connection failed")
+    try:
+        with conn.cursor() as cursor:
+            # executemany folds this into multi-row INSERT statements
+            inserted = cursor.executemany(
+                """
+                INSERT INTO employees (employee_id, full_name, position, department, leave_credits, is_active, created_at)
+                VALUES (%s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
+                """,
+                rows
+            )
+            conn.commit()
+            return int(inserted or 0)
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
 def update_employee(employee_id: int, full_name: str, position: str,
                     department: str, image_path: Optional[str] = None,
                     leave_credits: Optional[int] = None) -> None:
@@ -155,4 +238,55 @@ def search_employees(query: str, limit: int = 50) -> list[dict]:
             )
             return cursor.fetchall() or []
     finally:
-        conn.close()
\ No newline at end of file
+        conn.close()
+
+def get_employees_page(after: Optional[tuple] = None, limit: int = 50, order_by: str = "name",
+                       descending: bool = False, query: str = "") -> list[dict]:
+    """Fetch one keyset-paginated page of ACTIVE employees.
+
+    order_by: 'name' (full_name, employee_id) or 'id' (employee_id).
+    after: sort key of the last row of the previous page, i.e. (full_name, employee_id)
+           or (employee_id,); None for the first page.
+    query: optional substring filter on id, name, position or department.
+    """
+    conn = get_db_connection()
+    if not conn:
+        return []
+    try:
+        with conn.cursor() as cursor:
+            where = ["is_active = TRUE"]
+            params: list[Any] = []
+            q = (query or "").strip()
+            if q:
+                like = f"%{q}%"
+                where.append(
+                    "(full_name LIKE %s OR position LIKE %s OR department LIKE %s"
+                    " OR CAST(employee_id AS CHAR) LIKE %s)"
+                )
+                params.extend([like, like, like, like])
+            op = "<" if descending else ">"
+            direction = "DESC" if descending else "ASC"
+            if order_by == "id":
+                if after:
+                    where.append(f"employee_id {op} %s")
+                    params.append(after[-1])
+                order_clause = f"employee_id {direction}"
+            else:
+                if after:
+                    where.append(f"(full_name {op} %s OR (full_name = %s AND employee_id {op} %s))")
+                    params.extend([after[0], after[0], after[1]])
+                order_clause = f"full_name {direction}, employee_id {direction}"
+            params.append(int(limit))
+            cursor.execute(
+                f"""
+                SELECT employee_id, full_name, position, department, image_path, leave_credits, created_at
+                FROM employees
+                WHERE {' AND '.join(where)}
+                ORDER BY {order_clause}
+                LIMIT %s
+                """,
+                params
+            )
+            return cursor.fetchall() or []
+    finally:
+        conn.close()
@@ -0,0 +1,245 @@
+# migrations.py
+"""
+Ordered schema migrations. Each entry is (version, description, function(cursor));
+db_setup.create_database_and_tables() applies the ones above the version recorded in
+the `schema_version` table, in order, and records each one once it succeeds.
+
+Migrations 1-9 reproduce the checks the old bootstrap ran on every launch, so databases
+created before `schema_version` existed are adopted safely: every step is idempotent.
+Append new migrations at the end with the next version number; never renumber.
+"""
+from __future__ import annotations
+import random
+from datetime import datetime, timedelta
+
+from .db_config import DB_NAME
+
+
+def _column_exists(cur, table: str, column: str) -> bool:
+    cur.execute(
+        """
+        SELECT COUNT(*) FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND COLUMN_NAME = %s
+        """,
+        (DB_NAME, table, column)
+    )
+    return (cur.fetchone() or (0,))[0] > 0
+
+
+def _index_exists(cur, table: str, index: str) -> bool:
+    cur.execute(
+        """
+        SELECT COUNT(*) FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND INDEX_NAME = %s
+        """,
+        (DB_NAME, table, index)
+    )
+    return (cur.fetchone() or (0,))[0] > 0
+
+
+def create_base_tables(cur):
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS employees (
+            employee_id INT PRIMARY KEY AUTO_INCREMENT,
+            full_name VARCHAR(100) NOT NULL,
+            position VARCHAR(50) NOT NULL,
+            department VARCHAR(50) NOT NULL,
+            image_path VARCHAR(255),
+            leave_credits INT DEFAULT 15,
+            is_active BOOLEAN DEFAULT TRUE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_employee_id (employee_id),
+            INDEX idx_is_active (is_active),
+            INDEX idx_created_at (created_at)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """)
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS attendance_records (
+            record_id INT AUTO_INCREMENT PRIMARY KEY,
+            employee_id INT NOT NULL,
+            time_in DATETIME,
+            time_out DATETIME,
+            status ENUM('Present', 'Late', 'Absent') NOT NULL DEFAULT 'Absent',
+            date DATE NOT NULL,
+            FOREIGN KEY (employee_id) REFERENCES employees(employee_id) ON DELETE CASCADE,
+            INDEX idx_date (date),
+            INDEX idx_employee_date (employee_id, date)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """)
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS staff_users (
+            username VARCHAR(50) PRIMARY KEY,
+            full_name VARCHAR(100) NOT NULL,
+            role ENUM('Admin', 'Staff') NOT NULL,
+            position VARCHAR(50) NOT NULL,
+            password_hash VARCHAR(64) NOT NULL,
+            is_active BOOLEAN DEFAULT TRUE,
+            INDEX idx_username (username),
+            INDEX idx_is_active (is_active)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """)
+
+
+def rename_attendance_columns(cur):
+    # Old schemas used check_in/check_out
+    if _column_exists(cur, 'attendance_records', 'check_in') and not _column_exists(cur, 'attendance_records', 'time_in'):
+        cur.execute("ALTER TABLE attendance_records CHANGE COLUMN check_in time_in DATETIME")
+    if _column_exists(cur, 'attendance_records', 'check_out') and not _column_exists(cur, 'attendance_records', 'time_out'):
+        cur.execute("ALTER TABLE attendance_records CHANGE COLUMN check_out time_out DATETIME")
+
+
+def copy_legacy_data(cur):
+    """No-op, kept so existing databases keep their version numbers.
+
+    It copied employees, staff and attendance from the old 'Timetrack' schema into an empty
+    DB_NAME. The app's database has had that same name ever since, so there is nothing to
+    copy from, and databases chosen with Timetrack_DB_NAME must never get the real data.
+    """
+
+
+def add_employee_columns(cur):
+    if not _column_exists(cur, 'employees', 'leave_credits'):
+        cur.execute("ALTER TABLE employees ADD COLUMN leave_credits INT DEFAULT 15")
+    if not _column_exists(cur, 'employees', 'is_active'):
+        cur.execute("ALTER TABLE employees ADD COLUMN is_active BOOLEAN DEFAULT TRUE")
+        cur.execute("CREATE INDEX idx_is_active ON employees(is_active)")
+    if not _column_exists(cur, 'employees', 'created_at'):
+        cur.execute("ALTER TABLE employees ADD COLUMN created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP")
+        cur.execute("CREATE INDEX idx_created_at ON employees(created_at)")
+        cur.execute("UPDATE employees SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL")
+
+
+def add_employee_name_index(cur):
+    # Backs the keyset-paginated Employee Management list (get_employees_page)
+    if not _index_exists(cur, 'employees', 'idx_active_name'):
+        cur.execute("CREATE INDEX idx_active_name ON employees(is_active, full_name, employee_id)")
+
+
+def add_staff_is_active(cur):
+    if not _column_exists(cur, 'staff_users', 'is_active'):
+        cur.execute("ALTER TABLE staff_users ADD COLUMN is_active BOOLEAN DEFAULT TRUE")
+        cur.execute("CREATE INDEX idx_staff_is_active ON staff_users(is_active)")
+
+
+def create_default_admin(cur):
+    from .utils import hash_password
+    cur.execute("SELECT COUNT(*) FROM staff_users WHERE username = 'admin'")
+    if (cur.fetchone() or (0,))[0] == 0:
+        cur.execute(
+            """
+            INSERT INTO staff_users (username, full_name, role, position, password_hash, is_active)
+            VALUES (%s, %s, %s, %s, %s, TRUE)
+            """,
+            ('admin', 'Administrator', 'Admin', 'Administrator', hash_password('admin123'))
+        )
+
+
+def raise_employee_id_start(cur):
+    # Employee IDs start at 10000
+    cur.execute("SELECT COALESCE(MAX(employee_id), 9999) + 1 FROM employees")
+    next_val = (cur.fetchone() or (10000,))[0]
+    next_val = max(int(next_val or 10000), 10000)
+    cur.execute(f"ALTER TABLE employees AUTO_INCREMENT = {int(next_val)}")
+
+
+def seed_sample_data(cur):
+    """Sample employees plus today's and the last 30 days' attendance, for an empty database."""
+    cur.execute("SELECT COUNT(*) FROM employees")
+    if cur.fetchone()[0] != 0:
+        return
+
+    print("Seeding sample employee data...")
+    sample_employees = [
+        ('John Smith', 'Software Engineer', 'IT', 'assets/employees/#10000.jpg', 15),
+        ('Jane Doe', 'Project Manager', 'IT', 'assets/employees/#10001.jpg', 15),
+        ('Mike Johnson', 'HR Manager', 'HR', 'assets/employees/#10002.jpg', 15),
+        ('Sarah Williams', 'Marketing Specialist', 'Marketing', 'assets/employees/#10003.jpg', 15),
+        ('David Brown', 'Sales Manager', 'Sales', 'assets/employees/#10004.jpg', 15),
+        ('Emily Davis', 'Accountant', 'Finance', 'assets/employees/#10005.jpg', 15),
+        ('Robert Wilson', 'Operations Manager', 'Operations', None, 15),
+        ('Lisa Anderson', 'Customer Service Rep', 'Support', None, 15),
+        ('James Taylor', 'Software Developer', 'IT', None, 15),
+        ('Jennifer Martinez', 'Business Analyst', 'IT', None, 15),
+    ]
+    cur.executemany(
+        """
+        INSERT INTO employees (full_name, position, department, image_path, leave_credits)
+        VALUES (%s, %s, %s, %s, %s)
+        """,
+        sample_employees
+    )
+
+    cur.execute("SELECT employee_id FROM employees ORDER BY employee_id")
+    employee_ids = [row[0] for row in cur.fetchall()]
+
+    today = datetime.now().date()
+    today_str = today.strftime('%Y-%m-%d')
+
+    print("Seeding sample attendance data for today...")
+    attendance_data = []
+    for i, emp_id in enumerate(employee_ids[:8]):  # First 8 employees have attendance
+        if i < 5:  # First 5 are present (on time)
+            time_in = datetime.combine(today, datetime.strptime('08:00', '%H:%M').time())
+            time_out = datetime.combine(today, datetime.strptime('17:00', '%H:%M').time()) if i < 3 else None
+            status = 'Present'
+        elif i < 7:  # Next 2 are late
+            time_in = datetime.combine(today, datetime.strptime('09:15', '%H:%M').time())
+            time_out = None
+            status = 'Late'
+        else:  # Last one checked in late but checked out
+            time_in = datetime.combine(today, datetime.strptime('09:30', '%H:%M').time())
+            time_out = datetime.combine(today, datetime.strptime('17:00', '%H:%M').time())
+            status = 'Late'
+        attendance_data.append((emp_id, time_in, time_out, status, today_str))
+
+    cur.executemany(
+        """
+        INSERT INTO attendance_records (employee_id, time_in, time_out, status, date)
+        VALUES (%s, %s, %s, %s, %s)
+        """,
+        attendance_data
+    )
+
+    print("Seeding historical attendance data...")
+    historical_data = []
+    for days_ago in range(1, 31):  # Last 30 days
+        past_date = today - timedelta(days=days_ago)
+        if past_date.weekday() < 5:  # Only weekdays
+            past_date_str = past_date.strftime('%Y-%m-%d')
+            for emp_id in employee_ids[:7]:  # First 7 employees have regular attendance
+                rand = random.random()
+                if rand < 0.85:  # 85% present on time
+                    time_in = datetime.combine(past_date, datetime.strptime('08:00', '%H:%M').time())
+                    time_out = datetime.combine(past_date, datetime.strptime('17:00', '%H:%M').time())
+                    historical_data.append((emp_id, time_in, time_out, 'Present', past_date_str))
+                elif rand < 0.95:  # 10% late
+                    time_in = datetime.combine(past_date, datetime.strptime('09:00', '%H:%M').time())
+                    time_out = datetime.combine(past_date, datetime.strptime('17:00', '%H:%M').time())
+                    historical_data.append((emp_id, time_in, time_out, 'Late', past_date_str))
+                # 5% absent (no record)
+
+    if historical_data:
+        cur.executemany(
+            """
+            INSERT INTO attendance_records (employee_id, time_in, time_out, status, date)
+            VALUES (%s, %s, %s, %s, %s)
+            """,
+            historical_data
+        )
+
+    print(f"Seeded {len(sample_employees)} employees and attendance records.")
+
+
+MIGRATIONS = [
+    (1, "create employees, attendance_records and staff_users", create_base_tables),
+    (2, "rename attendance check_in/check_out to time_in/time_out", rename_attendance_columns),
+    (3, "copy data from the legacy database", copy_legacy_data),
+    (4, "add employees leave_credits/is_active/created_at", add_employee_columns),
+    (5, "add employees idx_active_name index", add_employee_name_index),
+    (6, "add staff_users is_active", add_staff_is_active),
+    (7, "create default admin account", create_default_admin),
+    (8, "start employee ids at 10000", raise_employee_id_start),
+    (9, "seed sample data into an empty database", seed_sample_data),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
@@ -4,7 +4,12 @@ from PyQt6.QtWidgets import (
     QPushButton, QFileDialog, QWidget, QMessageBox
 )
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont, QPixmap
+from PyQt6.QtGui import QFont
+
+from ..utils.thumbnails import ensure_thumbnail, get_avatar_pixmap
+
+# Preview box size in px
+PREVIEW_SIZE = 140
 
 class AddEmployeeModal(QDialog):
     employee_added = pyqtSignal(dict)
@@ -53,7 +58,7 @@ class AddEmployeeModal(QDialog):
         # Use default system font to avoid font issues
         img_lbl.setFont(QFont())
         self._img_box = QLabel()
-        self._img_box.setFixedSize(140, 140)
+        self._img_box.setFixedSize(PREVIEW_SIZE, PREVIEW_SIZE)
         self._img_box.setStyleSheet("background:white;border:1px dashed #cbd5e1;border-radius:8px; color:#9ca3af;")
         self._img_box.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._img_box.setText("Select")
@@ -133,11 +138,7 @@ class AddEmployeeModal(QDialog):
                 allowed = {".png", ".jpg", ".jpeg"}
                 ext = os.path.splitext(path)[1].lower()
                 if os.path.isfile(path) and ext in allowed:
-                    pm = QPixmap(path)
-                    if not pm.isNull():
-                        pm = pm.scaled(140, 140, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                        self._img_box.setPixmap(pm)
-                        self._img_box.setText("")
+                    if self._show_preview(path):
                         self._selected_image_path = path
                     else:
                         self._img_box.setText("Image failed to load")
@@ -149,16 +150,21 @@ class AddEmployeeModal(QDialog):
     def _pick_image(self):
         path, _ = QFileDialog.getOpenFileName(self, "Select Image", "", "Images (*.png *.jpg *.jpeg)")
         if path:
-            pm = QPixmap(path)
-            if not pm.isNull():
-                pm = pm.scaled(140, 140, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                self._img_box.setPixmap(pm)
-                self._img_box.setText("")
+            if self._show_preview(path):
                 self._selected_image_path = path
             else:
                 self._img_box.setText("Image failed to load")
                 self._selected_image_path = None
 
+    def _show_preview(self, path: str) -> bool:
+        """Show the cached thumbnail of path; False when it cannot be decoded."""
+        dpr = self.devicePixelRatioF()
+        if ensure_thumbnail(path, round(PREVIEW_SIZE * dpr)) is None:
+            return False
+        self._img_box.setPixmap(get_avatar_pixmap(path, PREVIEW_SIZE, dpr=dpr))
+        self._img_box.setText("")
+        return True
+
     def _submit(self):
         name = self._name[1].text().strip()
         dept = self._dept[1].text().strip()
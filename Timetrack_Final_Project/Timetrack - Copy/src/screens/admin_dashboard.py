@@ -3,11 +3,11 @@ from PyQt6.QtWidgets import QWidget, QMessageBox, QHBoxLayout, QPushButton, QTab
     QVBoxLayout, QLineEdit, QInputDialog
 from PyQt6.QtCore import Qt
 from .base_dashboard import DashboardBase
-from .add_employee_modal import AddEmployeeModal
-from .add_staff_modal import AddStaffModal
-from ..database.db_queries import get_all_staff, add_or_update_staff, delete_staff, update_employee, delete_employee, add_employee, set_employee_image_path
-import os
-import shutil
+from ..database.db_queries import get_all_staff, add_or_update_staff, delete_staff, update_employee, delete_employee, add_employee
+from ..utils.lazy_import import lazy_callable
+
+AddEmployeeModal = lazy_callable(".add_employee_modal", "AddEmployeeModal", __package__)
+AddStaffModal = lazy_callable(".add_staff_modal", "AddStaffModal", __package__)
 
 
 class AdminDashboard(DashboardBase):
@@ -23,11 +23,12 @@ class AdminDashboard(DashboardBase):
         except Exception:
             pass
 
-        # Setup staff accounts page
-        self._setup_staff_accounts_tab()
+        # Staff accounts page is built on first visit like the common pages
+        self.register_page("staff_accounts", self._setup_staff_accounts_tab, 3)
 
+    def on_page_built(self, name, page):
         # Wire Add Employee button in Employee Management view
-        if hasattr(self, 'add_emp_btn'):
+        if name == "employee_management":
             self.add_emp_btn.clicked.connect(self.handle_add_employee)
 
     def _on_sidebar_item_clicked(self, item):
@@ -106,7 +107,7 @@ class AdminDashboard(DashboardBase):
         self.load_staff_table()
 
         staff_layout.addWidget(self.staff_table)
-        self.main_content.addWidget(self.staff_accounts_page)
+        return self.staff_accounts_page
 
     def load_staff_table(self):
         staff = get_all_staff()
@@ -239,18 +240,6 @@ class AdminDashboard(DashboardBase):
         elif index == 4:
             self.handle_logout()
 
-    def switch_tab(self, tab_name):
-        """Override to support staff_accounts tab"""
-        if tab_name == "staff_accounts":
-            if self.current_tab == tab_name:
-                return
-            self.current_tab = tab_name
-            self.main_content.setCurrentWidget(self.staff_accounts_page)
-            self.sidebar.setCurrentRow(3)
-            self.reports_refresh_timer.stop()
-        else:
-            super().switch_tab(tab_name)
-
     def handle_logout(self):
         """Handle logout - return to employee dashboard"""
         from .employee_dashboard import AttendanceDashboard
@@ -271,16 +260,8 @@ class AdminDashboard(DashboardBase):
             img = data.get('image_path')
             new_id = add_employee(name, pos, dept)
             if new_id and img:
-                # Copy asset into assets/employees/#<id>.<ext>
-                ext = os.path.splitext(img)[1].lower() or '.jpg'
-                dest_dir = os.path.join('assets', 'employees')
-                os.makedirs(dest_dir, exist_ok=True)
-                dest_path = os.path.join(dest_dir, f"#{new_id}{ext}")
-                try:
-                    shutil.copyfile(img, dest_path)
-                    set_employee_image_path(new_id, dest_path)
-                except Exception as e:
-                    print(f"Failed to copy image: {e}")
+                # Resized and stored by content hash in the background
+                self.store_employee_photo(new_id, img)
             self.load_employee_table()
             QMessageBox.information(self, "Success", "Employee added successfully!")
         except Exception as e:
@@ -300,20 +281,10 @@ class AdminDashboard(DashboardBase):
             pos = data['position']
             dept = data['department']
             img = data.get('image_path')
+            update_employee(emp_id, name, pos, dept)
             if img:
-                # Copy new image and update path
-                ext = os.path.splitext(img)[1].lower() or '.jpg'
-                dest_dir = os.path.join('assets', 'employees')
-                os.makedirs(dest_dir, exist_ok=True)
-                dest_path = os.path.join(dest_dir, f"#{emp_id}{ext}")
-                try:
-                    shutil.copyfile(img, dest_path)
-                    update_employee(emp_id, name, pos, dept, image_path=dest_path)
-                except Exception as e:
-                    print(f"Failed to copy/update image: {e}")
-                    update_employee(emp_id, name, pos, dept)
-            else:
-                update_employee(emp_id, name, pos, dept)
+                # Resized and stored by content hash in the background
+                self.store_employee_photo(emp_id, img)
             self.load_employee_table()
             QMessageBox.information(self, "Success", "Employee updated successfully!")
         except Exception as e:
@@ -0,0 +1,165 @@
+# screens/attendance_export_modal.py
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QFrame, QLabel, QPushButton, QWidget,
+    QMessageBox, QDateEdit, QProgressBar, QFileDialog
+)
+from PyQt6.QtCore import Qt, QDate
+from PyQt6.QtGui import QFont
+
+from ..utils.export_helpers import export_attendance_records_csv
+from ..utils.workers import Worker, start_worker
+
+
+class AttendanceExportModal(QDialog):
+    """Export raw attendance punches for a date range to CSV.
+
+    The export streams from the database on a worker thread; the dialog shows progress and
+    can cancel it (the partial file is removed).
+    """
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self.setModal(True)
+        self.setWindowTitle("Export Raw Attendance")
+        self.setFixedSize(480, 300)
+        self._worker: Worker | None = None
+        self._path = ""
+        self._build_ui()
+
+    def _build_ui(self):
+        root = QVBoxLayout(self)
+        root.setContentsMargins(18, 18, 18, 18)
+        root.setSpacing(12)
+
+        card = QFrame()
+        card.setStyleSheet("QFrame { background:#f8fafc; border:1px solid #e5e7eb; border-radius:10px; }")
+        v = QVBoxLayout(card)
+        v.setContentsMargins(18, 18, 18, 18)
+        v.setSpacing(14)
+
+        header_label = QLabel("Raw attendance punches (CSV)")
+        header_label.setFont(QFont("Inter", 12, QFont.Weight.Bold))
+        header_label.setStyleSheet("color: #374151; border: none;")
+        header_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        v.addWidget(header_label)
+
+        today = QDate.currentDate()
+        range_row = QHBoxLayout()
+        self.start_edit = self._date_edit(QDate(today.year(), today.month(), 1))
+        self.end_edit = self._date_edit(today)
+        for text, edit in (("From", self.start_edit), ("To", self.end_edit)):
+            label = QLabel(text)
+            label.setStyleSheet("border: none;")
+            range_row.addWidget(label)
+            range_row.addWidget(edit, 1)
+        v.addLayout(range_row)
+
+        self.progress = QProgressBar()
+        self.progress.setFixedHeight(10)
+        self.progress.setTextVisible(False)
+        self.progress.setStyleSheet("""
+            QProgressBar { background-color: #e5e7eb; border: none; border-radius: 5px; }
+            QProgressBar::chunk { background-color: #a78bfa; border-radius: 5px; }
+        """)
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("color: #64748b; border: none;")
+        v.addWidget(self.progress)
+        v.addWidget(self.status_label)
+        v.addStretch()
+
+        actions = QHBoxLayout()
+        actions.addStretch()
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.setStyleSheet("QPushButton{background:#94a3b8;color:white;padding:10px 14px;border-radius:10px;font-weight:bold}")
+        self.export_btn = QPushButton("Export CSV")
+        self.export_btn.setStyleSheet("QPushButton{background:#10b981;color:white;padding:10px 14px;border-radius:10px;font-weight:bold}")
+        self.cancel_btn.clicked.connect(self._cancel)
+        self.export_btn.clicked.connect(self._start_export)
+        actions.addWidget(self.cancel_btn)
+        actions.addSpacing(8)
+        actions.addWidget(self.export_btn)
+
+        v.addLayout(actions)
+        root.addWidget(card)
+
+    def _date_edit(self, value: QDate) -> QDateEdit:
+        edit = QDateEdit(value)
+        edit.setCalendarPopup(True)
+        edit.setDisplayFormat("yyyy-MM-dd")
+        edit.setFixedHeight(36)
+        edit.setStyleSheet("QDateEdit{background:white;border:2px solid #e5e7eb;border-radius:8px;padding:4px 8px;}")
+        return edit
+
+    def _start_export(self):
+        start = self.start_edit.date().toPyDate()
+        end = self.end_edit.date().toPyDate()
+        if start > end:
+            QMessageBox.warning(self, "Invalid Range", "The start date must be on or before the end date.")
+            return
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Export Raw Attendance", f"attendance_{start:%Y%m%d}_{end:%Y%m%d}.csv", "CSV Files (*.csv)"
+        )
+        if not path:
+            return
+        self._path = path
+
+        def _run(worker):
+            return export_attendance_records_csv(
+                path, start, end, progress=worker.report_progress, is_cancelled=worker.is_cancelled
+            )
+
+        self._worker = Worker(_run, pass_worker=True)
+        self._worker.signals.progress.connect(self._on_progress)
+        self._worker.signals.finished.connect(self._on_finished)
+        self._worker.signals.error.connect(self._on_error)
+        self._set_running(True)
+        self.status_label.setText("Counting rows...")
+        start_worker(self._worker)
+
+    def _set_running(self, running: bool):
+        self.export_btn.setEnabled(not running)
+        self.start_edit.setEnabled(not running)
+        self.end_edit.setEnabled(not running)
+        self.cancel_btn.setEnabled(True)
+        if running:
+            self.progress.setRange(0, 0)  # busy until the first progress report
+
+    def _on_progress(self, done: int, total: int):
+        self.progress.setRange(0, max(1, total))
+        self.progress.setValue(done)
+        self.status_label.setText(f"{done:,} of {total:,} rows written")
+
+    def _on_finished(self, result: dict):
+        self._worker = None
+        self._set_running(False)
+        self.progress.setRange(0, 1)
+        if result.get('cancelled'):
+            self.progress.setValue(0)
+            self.status_label.setText("Export cancelled")
+            return
+        self.progress.setValue(1)
+        QMessageBox.information(self, "Export Successful", f"{result.get('rows', 0):,} rows exported to {self._path}")
+        self.accept()
+
+    def _on_error(self, message: str):
+        self._worker = None
+        self._set_running(False)
+        self.progress.setRange(0, 1)
+        self.progress.setValue(0)
+        self.status_label.setText("Export failed")
+        QMessageBox.critical(self, "Export Failed", f"Failed to export attendance: {message}")
+
+    def _cancel(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            self.cancel_btn.setEnabled(False)
+            self.status_label.setText("Cancelling...")
+        else:
+            self.reject()
+
+    def reject(self):
+        # Escape / window close while exporting cancels instead of orphaning the worker
+        if self._worker is not None:
+            self._cancel()
+            return
+        super().reject()
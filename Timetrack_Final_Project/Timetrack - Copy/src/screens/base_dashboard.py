@@ -1,14 +1,26 @@
 # screens/base_dashboard.py
 from PyQt6.QtWidgets import (
-    QApplication, QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout,
-    QHBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView, QFrame, QSizePolicy, QStackedWidget,
+    QApplication, QWidget, QLabel, QLineEdit, QVBoxLayout,
+    QHBoxLayout, QTableWidgetItem, QTableView, QHeaderView, QFrame, QSizePolicy, QStackedWidget,
     QFileDialog, QMessageBox, QInputDialog, QComboBox, QScrollArea, QSplitter, QListWidget
 )
 from PyQt6.QtCore import Qt, QTimer, QTime, QDate
 from PyQt6.QtGui import QFont, QPixmap, QPainter, QPageLayout, QPageSize, QPdfWriter
 
-from ..database.db_queries import get_all_employees, get_employee_details, get_department_attendance, update_employee, delete_employee, get_today_attendance, get_today_stats
-from ..widgets.reports_chart import ReportsChartWidget
+from ..database.db_queries import get_department_attendance, update_employee, delete_employee, get_today_attendance, get_today_stats, get_employees_page, get_employees_month_absences
+from ..widgets.attendance_table_model import (
+    AttendanceTableModel,
+    AttendanceFilterProxyModel,
+    ACTION_COLUMN,
+)
+from ..widgets.employee_table_model import EmployeeTableModel, EMPLOYEE_ACTION_COLUMN, SORTABLE_COLUMNS
+from ..widgets.action_button_delegate import (
+    ActionButtonDelegate,
+    VIEW_DETAILS_ACTION,
+    EDIT_ACTION,
+    DEACTIVATE_ACTION,
+    EDIT_LEAVE_ACTION,
+)
 import os
 import shutil
 
@@ -16,31 +28,44 @@ import shutil
 from ..config import (
     ATTENDANCE_REFRESH_MS,
     REPORTS_REFRESH_MS,
+    INDIV_HOURS_REFRESH_MS,
     TIME_TICK_MS,
+    EMPLOYEE_PAGE_SIZE,
+    EMPLOYEE_SEARCH_DEBOUNCE_MS,
+    PAGE_PREFETCH_DELAY_MS,
     TIME_DISPLAY_FORMAT,
     DATE_DISPLAY_FORMAT,
 )
-from ..utils.export_helpers import (
-    format_period_label,
-    export_department_attendance_csv,
-    build_department_attendance_html,
-    export_html_to_pdf,
-    export_qtablewidget_to_csv,
-    build_qtablewidget_html,
-)
-from .components.employee_management_view import EmployeeManagementView
-from .components.reports_view import ReportsView
+from ..utils.refresh_scheduler import get_refresh_scheduler, PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW
+from ..utils.lazy_import import lazy_module, lazy_callable
+from ..utils.workers import Worker, start_worker
+from ..utils import metrics
+
+# Tab components, the chart and export code load on first use
+export_helpers = lazy_module("..utils.export_helpers", __package__)
+image_ingest = lazy_module("..utils.image_ingest", __package__)
+pdf_report = lazy_module("..utils.pdf_report", __package__)
+create_reports_chart = lazy_callable("..widgets.reports_chart", "create_reports_chart", __package__)
+EmployeeManagementView = lazy_callable(".components.employee_management_view", "EmployeeManagementView", __package__)
+ReportsView = lazy_callable(".components.reports_view", "ReportsView", __package__)
+EmployeeDetailsModal = lazy_callable(".emp_details", "EmployeeDetailsModal", __package__)
+AttendanceExportModal = lazy_callable(".attendance_export_modal", "AttendanceExportModal", __package__)
+BulkImportModal = lazy_callable(".bulk_import_modal", "BulkImportModal", __package__)
 
 
 class DashboardBase(QWidget):
+    # Buttons painted in the Employee Management "Actions" column (subclasses may restrict)
+    EMPLOYEE_ROW_ACTIONS = [EDIT_ACTION, DEACTIVATE_ACTION, EDIT_LEAVE_ACTION]
+    EMPLOYEE_ACTION_BUTTON_WIDTH = 80
+
     def __init__(self, title_suffix="Dashboard"):
         super().__init__()
         self.setWindowTitle(f"TimeTrack - {title_suffix}")
         self.setGeometry(200, 100, 1500, 900)
-        self.current_tab = "attendance"
+        self.current_tab = None
         self.employee_data = {}
         self.attendance_rows: list[dict] = []
-        self.load_employee_data()
+        self._background_workers = set()
 
         # Main layout
         main_layout = QHBoxLayout()
@@ -118,6 +143,10 @@ class DashboardBase(QWidget):
         date_layout.addWidget(self.header_time_label)
 
         header_layout.addWidget(header_spacer, 1)
+        if metrics.is_enabled():
+            # DB latency from the metrics registry (Timetrack_METRICS=1)
+            from ..widgets.db_latency_indicator import DbLatencyIndicator
+            header_layout.addWidget(DbLatencyIndicator(), 0)
         header_layout.addWidget(date_widget, 0)
 
         # Main Content Area
@@ -144,32 +173,43 @@ class DashboardBase(QWidget):
             }
         """)
 
-        # Timer to update time
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_time)
-        self.timer.start(TIME_TICK_MS)
-
-        # Setup common pages
-        self.setup_attendance_page()
-        self.setup_employee_management_page()
-        self.setup_reports_page()
+        # Pages are registered as factories and built on first visit (see ensure_page)
+        self._page_factories = {}
+        self._pages = {}
+        self._page_rows = {}
+        self.register_page("attendance", self.setup_attendance_page, 0)
+        self.register_page("employee_management", self.setup_employee_management_page, 1)
+        self.register_page("reports", self.setup_reports_page, 2)
 
         # Initial stats update (no-op)
         self.update_stats()
 
-        # Periodic attendance refresh (no event bus)
-        self.attendance_refresh_timer = QTimer(self)
-        self.attendance_refresh_timer.setInterval(ATTENDANCE_REFRESH_MS)
-        self.attendance_refresh_timer.timeout.connect(lambda: [self.refresh_attendance_view(), self.update_stats()])
-        self.attendance_refresh_timer.start()
-
-        # Reports tab auto-refresh timer - disabled for new reports screen
-        self.reports_refresh_timer = QTimer(self)
-        self.reports_refresh_timer.setInterval(REPORTS_REFRESH_MS)
-        self.reports_refresh_timer.timeout.connect(self.update_reports_view)
+        # Periodic refreshes run on the shared scheduler (paused while hidden or on another tab)
+        scheduler = get_refresh_scheduler()
+        self.clock_job = scheduler.add_job(
+            "clock", self.update_time, TIME_TICK_MS, owner=self,
+            priority=PRIORITY_HIGH, cost=0, idle_backoff=False,
+        )
+        self.attendance_job = scheduler.add_job(
+            "attendance", lambda: [self.refresh_attendance_view(), self.update_stats()],
+            ATTENDANCE_REFRESH_MS, owner=self, priority=PRIORITY_HIGH, cost=2,
+            active=lambda: self.current_tab == "attendance",
+        )
+        self.reports_chart_job = scheduler.add_job(
+            "reports_chart", self.update_reports_view, REPORTS_REFRESH_MS, owner=self,
+            priority=PRIORITY_NORMAL, cost=2,
+            active=lambda: self.current_tab == "reports",
+        )
+        self.indiv_hours_job = scheduler.add_job(
+            "indiv_hours", self._update_indiv_table, INDIV_HOURS_REFRESH_MS, owner=self,
+            priority=PRIORITY_LOW, cost=4,
+            active=lambda: self.current_tab == "reports",
+        )
 
         # Switch to default tab
         self.switch_tab("attendance")
+        if PAGE_PREFETCH_DELAY_MS > 0:
+            QTimer.singleShot(PAGE_PREFETCH_DELAY_MS, self.prefetch_pages)
 
     def create_stat_card(self, number, label_text, bg_color, fg_color):
         card = QFrame()
@@ -228,10 +268,49 @@ class DashboardBase(QWidget):
         """Handle logout action - override in child classes"""
         pass
 
+    def closeEvent(self, event):
+        # Closed dashboards are not reopened (logout builds a new kiosk window): drop their refresh jobs
+        try:
+            get_refresh_scheduler().remove_owner(self)
+        except Exception:
+            pass
+        super().closeEvent(event)
+
+    def register_page(self, name, factory, sidebar_row):
+        """Register a page built by factory() (returning its widget) on first visit."""
+        self._page_factories[name] = factory
+        self._page_rows[name] = sidebar_row
+
+    def ensure_page(self, name):
+        """Return the page widget, building and populating it on first use."""
+        page = self._pages.get(name)
+        if page is None and name in self._page_factories:
+            page = self._page_factories[name]()
+            self._pages[name] = page
+            self.main_content.addWidget(page)
+            self.on_page_built(name, page)
+        return page
+
+    def on_page_built(self, name, page):
+        """Called once per page right after it is built - override in child classes"""
+        pass
+
+    def prefetch_pages(self, names=None):
+        """Warm pages not visited yet, one per event-loop turn so input stays responsive."""
+        pending = [n for n in (names or self._page_factories) if n not in self._pages]
+        if not pending or not self.isVisible():
+            return
+        try:
+            self.ensure_page(pending[0])
+        except Exception as e:
+            print(f"Failed to prefetch {pending[0]} page: {e}")
+        if len(pending) > 1:
+            QTimer.singleShot(0, lambda: self.prefetch_pages(pending[1:]))
+
     def setup_attendance_page(self):
         # Revert to inline UI setup to avoid any component-parent lifecycle issues
-        if hasattr(self, 'attendance_page') and self.attendance_page is not None:
-            return
+        if getattr(self, 'attendance_page', None) is not None:
+            return self.attendance_page
         self.attendance_page = QWidget()
         attendance_layout = QVBoxLayout(self.attendance_page)
 
@@ -256,21 +335,27 @@ class DashboardBase(QWidget):
         self.attendance_search.textChanged.connect(self.filter_attendance_table)
         attendance_layout.addWidget(self.attendance_search)
 
-        self.attendance_table = QTableWidget()
-        self.attendance_table.setColumnCount(6)
-        self.attendance_table.setHorizontalHeaderLabels([
-            "Employee ID", "Employee Name", "Time In", "Time Out", "Status", "Action"
-        ])
+        self.attendance_model = AttendanceTableModel(self)
+        self.attendance_proxy = AttendanceFilterProxyModel(self)
+        self.attendance_proxy.setSourceModel(self.attendance_model)
+
+        self.attendance_table = QTableView()
+        self.attendance_table.setModel(self.attendance_proxy)
         self.attendance_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.attendance_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.attendance_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.attendance_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.attendance_table.setSortingEnabled(True)
+        self.attendance_table.sortByColumn(0, Qt.SortOrder.AscendingOrder)
         # Make rows a bit taller so buttons are not cropped
         self.attendance_table.verticalHeader().setDefaultSectionSize(44)
+        self.attendance_actions = ActionButtonDelegate([VIEW_DETAILS_ACTION], self.attendance_table, button_height=36)
+        self.attendance_actions.attach(self.attendance_table, ACTION_COLUMN)
+        self.attendance_actions.action_triggered.connect(lambda _action, eid: self.show_employee_details(eid))
         attendance_layout.addWidget(self.attendance_table)
 
-        self.main_content.addWidget(self.attendance_page)
-
         # Initial load
         self.refresh_attendance_view()
+        return self.attendance_page
 
     def refresh_attendance_view(self):
         try:
@@ -278,31 +363,11 @@ class DashboardBase(QWidget):
         except Exception as e:
             print(f"Failed to load attendance: {e}")
             self.attendance_rows = []
-        # Apply current filter
-        query = self.attendance_search.text() if hasattr(self, 'attendance_search') else ""
-        self.filter_attendance_table(query)
+        # Only rows that changed are repainted; the proxy keeps the current filter/sort
+        self.attendance_model.set_rows(self.attendance_rows)
 
     def filter_attendance_table(self, text):
-        text = (text or "").lower()
-        rows = [
-            row for row in self.attendance_rows
-            if text in (row.get('full_name', '') or '').lower()
-            or text in str(row.get('employee_id', '')).lower()
-        ]
-        self.attendance_table.setRowCount(len(rows))
-        for r, data in enumerate(rows):
-            self.attendance_table.setItem(r, 0, QTableWidgetItem(str(data.get('employee_id', ''))))
-            self.attendance_table.setItem(r, 1, QTableWidgetItem(data.get('full_name', '')))
-            self.attendance_table.setItem(r, 2, QTableWidgetItem(data.get('check_in', '--')))
-            self.attendance_table.setItem(r, 3, QTableWidgetItem(data.get('check_out', '--')))
-            self.attendance_table.setItem(r, 4, QTableWidgetItem(data.get('status', '')))
-
-            view_btn = QPushButton("View Details")
-            view_btn.setStyleSheet("background-color: #a78bfa; color: white; padding: 5px 10px; border-radius: 6px; margin: 2px;")
-            view_btn.setFixedHeight(36)
-            emp_id = data.get('employee_id', '')
-            view_btn.clicked.connect(lambda checked=False, eid=emp_id: self.show_employee_details(eid))
-            self.attendance_table.setCellWidget(r, 5, view_btn)
+        self.attendance_proxy.set_search_text(text)
 
     def show_employee_details(self, emp_id):
         try:
@@ -321,7 +386,6 @@ class DashboardBase(QWidget):
                     'image_path': img_path,
                     **(details or {})
                 }
-                from .emp_details import EmployeeDetailsModal
                 modal = EmployeeDetailsModal(employee_data, self)
                 modal.exec()
         except Exception as e:
@@ -329,78 +393,122 @@ class DashboardBase(QWidget):
 
     def setup_employee_management_page(self):
         # Replace inline UI with component while keeping attribute names and signals
-        if hasattr(self, 'employee_management_page') and self.employee_management_page is not None:
-            return
+        if getattr(self, 'employee_management_page', None) is not None:
+            return self.employee_management_page
         view = EmployeeManagementView(self)
         self.employee_management_page = view
         self.add_emp_btn = view.add_emp_btn
+        view.import_btn.clicked.connect(self.import_csv)
         self.search = view.search_edit
         self.table = view.table
-        self.search.textChanged.connect(self.filter_employee_table)
-        self.main_content.addWidget(self.employee_management_page)
-        # Load employee data into table
+
+        # Rows are fetched page by page as the table scrolls (see EmployeeTableModel)
+        self.employee_model = EmployeeTableModel(
+            get_employees_page, get_employees_month_absences, page_size=EMPLOYEE_PAGE_SIZE, parent=self
+        )
+        self.employee_data = self.employee_model.employee_data
+        self.table.setModel(self.employee_model)
+        self._employee_sort = (1, Qt.SortOrder.AscendingOrder)
+        header = self.table.horizontalHeader()
+        header.setSortIndicatorShown(True)
+        header.setSortIndicator(*self._employee_sort)
+        header.sectionClicked.connect(self._on_employee_header_clicked)
+
+        # Filtering runs server-side, so debounce keystrokes
+        self._employee_search_timer = QTimer(self)
+        self._employee_search_timer.setSingleShot(True)
+        self._employee_search_timer.setInterval(EMPLOYEE_SEARCH_DEBOUNCE_MS)
+        self._employee_search_timer.timeout.connect(lambda: self.filter_employee_table(self.search.text()))
+        self.search.textChanged.connect(lambda _text: self._employee_search_timer.start())
+
+        self.employee_actions = ActionButtonDelegate(
+            self.EMPLOYEE_ROW_ACTIONS, self.table,
+            button_width=self.EMPLOYEE_ACTION_BUTTON_WIDTH, button_height=28,
+        )
+        self.employee_actions.attach(self.table, EMPLOYEE_ACTION_COLUMN)
+        self.employee_actions.action_triggered.connect(self._on_employee_action)
+        # Load the first page into the table
         self.load_employee_table()
+        return self.employee_management_page
+
+    def import_csv(self):
+        """Bulk-import employees or historical punches (see BulkImportModal)"""
+        dlg = BulkImportModal(self)
+        dlg.exec()
+        if dlg.imported:
+            self.load_employee_table()
+            self.attendance_job.trigger()
 
     def load_employee_table(self):
-        self.load_employee_data()
-        self.table.setRowCount(len(self.employee_data))
-        keys = list(self.employee_data.keys())
-        for row in range(len(keys)):
-            emp_id = keys[row]
-            emp = self.employee_data[emp_id]
-            self.table.setItem(row, 0, QTableWidgetItem(str(emp['id'])))
-            self.table.setItem(row, 1, QTableWidgetItem(emp['name']))
-            self.table.setItem(row, 2, QTableWidgetItem(emp['position']))
-            self.table.setItem(row, 3, QTableWidgetItem(emp['department']))
-            self.table.setItem(row, 4, QTableWidgetItem(str(emp['absences'])))
-            self.table.setItem(row, 5, QTableWidgetItem(str(emp['leave_credits'])))
-
-            # Action cell
-            action_widget = QWidget()
-            h = QHBoxLayout(action_widget)
-            h.setContentsMargins(0, 0, 0, 0)
-            h.setSpacing(4)
-
-            edit_btn = QPushButton("Edit")
-            edit_btn.setStyleSheet("QPushButton{background:#a78bfa;color:white;padding:4px 8px;border-radius:6px;font-size:10px;}")
-            edit_btn.setFixedWidth(80)
-
-            delete_btn = QPushButton("Deactivate")
-            delete_btn.setStyleSheet("QPushButton{background:#ef4444;color:white;padding:4px 8px;border-radius:6px;font-size:10px;}")
-            delete_btn.setFixedWidth(80)
-
-            leave_btn = QPushButton("Edit Leave")
-            leave_btn.setStyleSheet("QPushButton{background:#f59e0b;color:white;padding:4px 8px;border-radius:6px;font-size:10px;}")
-            leave_btn.setFixedWidth(80)
-
-            edit_btn.clicked.connect(lambda checked, eid=emp_id: self.handle_edit_employee(eid))
-            delete_btn.clicked.connect(lambda checked, eid=emp_id: self.handle_delete_employee(eid))
-            leave_btn.clicked.connect(lambda checked, eid=emp_id: self.handle_edit_leave(eid))
-
-            h.addWidget(edit_btn)
-            h.addWidget(delete_btn)
-            h.addWidget(leave_btn)
-            h.addStretch()
-            self.table.setCellWidget(row, 6, action_widget)
+        """(Re)load the Employee Management table from its first page."""
+        self.employee_model.reload()
+
+    def _on_employee_header_clicked(self, column):
+        # Only ID and Name have a server-side ordering; keep the current indicator otherwise
+        header = self.table.horizontalHeader()
+        if column not in SORTABLE_COLUMNS:
+            header.setSortIndicator(self._employee_sort[0], self._employee_sort[1])
+            return
+        order = header.sortIndicatorOrder()
+        self._employee_sort = (column, order)
+        self.employee_model.sort(column, order)
+
+    def _on_employee_action(self, action, emp_id):
+        handlers = {
+            "edit": self.handle_edit_employee,
+            "deactivate": self.handle_delete_employee,
+            "leave": self.handle_edit_leave,
+        }
+        handler = handlers.get(action)
+        if handler is not None and emp_id is not None:
+            handler(emp_id)
 
     def filter_employee_table(self, text: str):
-        text = (text or '').lower()
-        row = 0
-        for emp_id, emp in self.employee_data.items():
-            id_match = text in str(emp['id']).lower()
-            name_match = text in (emp['name'] or '').lower()
-            pos_match = text in (emp['position'] or '').lower()
-            dept_match = text in (emp['department'] or '').lower()
-            if id_match or name_match or pos_match or dept_match:
-                self.table.setRowHidden(row, False)
-            else:
-                self.table.setRowHidden(row, True)
-            row += 1
+        self.employee_model.set_filter(text)
 
     def handle_add_employee(self):
         # Placeholder - implement in child classes
         pass
 
+    def run_in_background(self, worker, on_done, on_error):
+        """Start a Worker, keeping it referenced until it reports back."""
+        self._background_workers.add(worker)
+
+        def _done(result):
+            self._background_workers.discard(worker)
+            on_done(result)
+
+        def _failed(message):
+            self._background_workers.discard(worker)
+            on_error(message)
+
+        worker.signals.finished.connect(_done)
+        worker.signals.error.connect(_failed)
+        start_worker(worker)
+
+    def store_employee_photo(self, emp_id, image_path):
+        """Resize/recompress the picked photo on a worker thread, then point the employee at it."""
+        def _done(_stored):
+            if getattr(self, 'employee_model', None) is not None:
+                self.load_employee_table()
+
+        self.run_in_background(
+            Worker(image_ingest.ingest_employee_photo, emp_id, image_path), _done,
+            lambda message: QMessageBox.warning(
+                self, "Photo Not Saved", f"The employee was saved, but the photo could not be imported:\n{message}"),
+        )
+
+    def export_table_pdf(self, path, title, headers, rows, subtitle=None, summary_text="", align=None):
+        """Render a paginated table PDF on a worker thread (see utils/pdf_report.py)."""
+        worker = Worker(pdf_report.render_table_pdf, path, title, headers, rows,
+                        subtitle=subtitle, summary_text=summary_text, align=align)
+        self.run_in_background(
+            worker,
+            lambda result: QMessageBox.information(
+                self, "Export Successful", f"Report exported to {path} ({result['pages']} page(s))"),
+            lambda message: QMessageBox.critical(self, "Export Failed", f"Failed to export PDF: {message}"),
+        )
+
     def handle_edit_employee(self, emp_id):
         # Placeholder - implement in child classes
         pass
@@ -415,8 +523,8 @@ class DashboardBase(QWidget):
 
     def setup_reports_page(self):
         # Replace inline UI with component and wire up signals/buttons
-        if hasattr(self, 'reports_page') and self.reports_page is not None:
-            return
+        if getattr(self, 'reports_scroll', None) is not None:
+            return self.reports_scroll
 
         view = ReportsView(self)
         # Alias commonly used attributes for backward compatibility
@@ -435,6 +543,7 @@ class DashboardBase(QWidget):
         self.period_combo.currentTextChanged.connect(self.update_reports_view)
         view.export_csv_btn.clicked.connect(self.export_report_csv)
         view.export_pdf_btn.clicked.connect(self.export_report_pdf)
+        view.export_raw_btn.clicked.connect(self.export_raw_attendance)
 
         # Wire view combo change to table update (search removed)
         self.indiv_view_combo.currentTextChanged.connect(self._on_indiv_selection_changed)
@@ -445,36 +554,34 @@ class DashboardBase(QWidget):
 
         # Content widget is the scroll area itself
         self.reports_scroll = view
-        self.main_content.addWidget(self.reports_scroll)
 
         # Internal state for selected employee (no search, always None = all employees)
         self._selected_emp_id = None
+        return self.reports_scroll
 
     def switch_tab(self, tab_name):
-        if tab_name == self.current_tab:
+        if tab_name == self.current_tab or tab_name not in self._page_factories:
             return
 
+        # Built (and first populated) on the first visit only
+        first_visit = tab_name not in self._pages
+        page = self.ensure_page(tab_name)
         self.current_tab = tab_name
 
         # Switch content
-        if tab_name == "attendance":
-            self.main_content.setCurrentWidget(self.attendance_page)
-            self.sidebar.setCurrentRow(0)
-            self.reports_refresh_timer.stop()
-        elif tab_name == "employee_management":
-            self.main_content.setCurrentWidget(self.employee_management_page)
-            self.sidebar.setCurrentRow(1)
-            self.reports_refresh_timer.stop()
-        elif tab_name == "reports":
+        if tab_name == "reports":
             # Create chart lazily and safely
             try:
                 self._ensure_reports_chart()
             except Exception as e:
                 print(f"Chart init error: {e}")
-            self.main_content.setCurrentWidget(self.reports_scroll)
-            self.sidebar.setCurrentRow(2)
-            self.update_reports_view()
-            self.reports_refresh_timer.start()
+        self.main_content.setCurrentWidget(page)
+        self.sidebar.setCurrentRow(self._page_rows[tab_name])
+        if tab_name == "attendance" and not first_visit:
+            self.attendance_job.trigger()
+        elif tab_name == "reports":
+            self.reports_chart_job.trigger()
+            self.indiv_hours_job.trigger()
 
 
     def _ensure_reports_chart(self):
@@ -487,7 +594,8 @@ class DashboardBase(QWidget):
                     self._reports_placeholder = None
 
                 # Create the chart widget with proper sizing
-                self.reports_chart = ReportsChartWidget()
+                # Qt or matplotlib chart, per Timetrack_CHART_BACKEND
+                self.reports_chart = create_reports_chart()
                 self.reports_chart.setMinimumHeight(450)
                 self.reports_chart.setMaximumHeight(550)
                 self.chart_container_layout.addWidget(self.reports_chart)
@@ -688,17 +796,12 @@ class DashboardBase(QWidget):
 
         labels, present, late, absent = self.get_report_data(self.report_period)
 
-        if hasattr(self, 'reports_chart') and self.reports_chart and getattr(self.reports_chart, 'canvas', None):
+        if getattr(self, 'reports_chart', None) is not None:
             try:
                 self.reports_chart.plot(labels, present, late, absent, title)
             except Exception as e:
                 print(f"Failed to update reports chart: {e}")
 
-        try:
-            self._update_indiv_table()
-        except Exception as e:
-            print(f"Failed to update individual summary: {e}")
-
         if hasattr(self, 'reports_chart_header'):
             self.reports_chart_header.setText(f"📊 {title}")
 
@@ -732,9 +835,9 @@ class DashboardBase(QWidget):
             return
 
         today = QDate.currentDate()
-        period_label = format_period_label(getattr(self, 'report_period', 'daily'), today)
+        period_label = export_helpers.format_period_label(getattr(self, 'report_period', 'daily'), today)
         rows = get_department_attendance(getattr(self, 'report_period', 'daily'))
-        export_department_attendance_csv(rows, period_label, path)
+        export_helpers.export_department_attendance_csv(rows, period_label, path)
         QMessageBox.information(self, "Export Successful", f"Report exported to {path}")
 
     def export_report_pdf(self):
@@ -752,10 +855,14 @@ class DashboardBase(QWidget):
         data = get_department_attendance(getattr(self, 'report_period', 'daily'))
         today = QDate.currentDate()
         display = getattr(self, 'report_period', 'daily').capitalize()
-        period_label = format_period_label(getattr(self, 'report_period', 'daily'), today)
-        html = build_department_attendance_html(f"{display} Attendance Report", period_label, data)
-        export_html_to_pdf(html, path)
-        QMessageBox.information(self, "Export Successful", f"Report exported to {path}")
+        period_label = export_helpers.format_period_label(getattr(self, 'report_period', 'daily'), today)
+        headers, rows, align = export_helpers.department_attendance_table(data)
+        self.export_table_pdf(path, f"{display} Attendance Report – {period_label}", headers, rows, align=align)
+
+    def export_raw_attendance(self):
+        """Stream raw punches for a chosen date range to CSV (see AttendanceExportModal)"""
+        dlg = AttendanceExportModal(self)
+        dlg.exec()
 
     def export_individual_hours_csv(self):
         """Export individual working hours table to CSV using helpers"""
@@ -770,7 +877,7 @@ class DashboardBase(QWidget):
         path, _ = QFileDialog.getSaveFileName(self, "Export Individual Hours CSV", filename, "CSV Files (*.csv)")
         if not path:
             return
-        export_qtablewidget_to_csv(self.indiv_table, path)
+        export_helpers.export_qtablewidget_to_csv(self.indiv_table, path)
         QMessageBox.information(self, "Export Successful", f"Individual hours exported to {path}")
 
     def export_individual_hours_pdf(self):
@@ -796,32 +903,13 @@ class DashboardBase(QWidget):
         from PyQt6.QtCore import QDate
         today = QDate.currentDate()
         subtitle = f"Generated on: {today.toString('MMMM d, yyyy')}"
-        html = build_qtablewidget_html(self.indiv_table, title, subtitle=subtitle, summary_text=self.indiv_summary_label.text())
-        export_html_to_pdf(html, path)
-        QMessageBox.information(self, "Export Successful", f"Individual hours exported to {path}")
+        # Snapshot the table here; pages are laid out on a worker thread
+        headers, rows = export_helpers.snapshot_qtablewidget(self.indiv_table)
+        self.export_table_pdf(path, title, headers, rows, subtitle=subtitle, summary_text=self.indiv_summary_label.text())
 
     def load_employee_data(self):
-        """Load employee data from database into self.employee_data dict."""
-        try:
-            employees = get_all_employees() or []
-            self.employee_data = {}
-            for emp in employees:
-                emp_id = emp['employee_id']
-                details = {}
-                try:
-                    details = get_employee_details(emp_id, 'month') or {}
-                except Exception as _e:
-                    details = {}
-                self.employee_data[emp_id] = {
-                    'id': emp_id,
-                    'name': emp['full_name'],
-                    'position': emp.get('position', ''),
-                    'department': emp.get('department', ''),
-                    'image_path': emp.get('image_path'),
-                    'leave_credits': details.get('leave_credits', emp.get('leave_credits', 15)),
-                    'absences': int(details.get('absences', 0) or 0),
-                }
-        except Exception as e:
-            print(f"Error loading employee data: {e}")
-            self.employee_data = {}
-
+        """Reload employee rows; kept for callers of the old eager loader.
+        Rows (and their computed details) are now fetched page by page by the table model.
+        """
+        if getattr(self, 'employee_model', None) is not None:
+            self.load_employee_table()
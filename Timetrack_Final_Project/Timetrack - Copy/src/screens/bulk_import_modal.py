@@ -0,0 +1,198 @@
+# screens/bulk_import_modal.py
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QFrame, QLabel, QPushButton, QWidget,
+    QMessageBox, QComboBox, QLineEdit, QProgressBar, QFileDialog
+)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont
+
+from ..utils.bulk_import import import_csv
+from ..utils.workers import Worker, start_worker
+
+
+class BulkImportModal(QDialog):
+    """Import employees or historical punches from a CSV file.
+
+    Rows are validated and written in batches on a worker thread; rows that fail validation
+    are saved to a rejected-rows CSV next to the source. `imported` is the number of rows
+    written, so the caller knows whether to reload its tables.
+    """
+
+    KINDS = (("Employees", "employees"), ("Attendance punches", "punches"))
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self.setModal(True)
+        self.setWindowTitle("Import from CSV")
+        self.setFixedSize(520, 340)
+        self._worker: Worker | None = None
+        self.imported = 0
+        self._build_ui()
+
+    def _build_ui(self):
+        root = QVBoxLayout(self)
+        root.setContentsMargins(18, 18, 18, 18)
+        root.setSpacing(12)
+
+        card = QFrame()
+        card.setStyleSheet("QFrame { background:#f8fafc; border:1px solid #e5e7eb; border-radius:10px; }")
+        v = QVBoxLayout(card)
+        v.setContentsMargins(18, 18, 18, 18)
+        v.setSpacing(14)
+
+        header_label = QLabel("Bulk import (CSV)")
+        header_label.setFont(QFont("Inter", 12, QFont.Weight.Bold))
+        header_label.setStyleSheet("color: #374151; border: none;")
+        header_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        v.addWidget(header_label)
+
+        field_style = "background:white;border:2px solid #e5e7eb;border-radius:8px;padding:4px 8px;"
+        self.kind_combo = QComboBox()
+        for label, kind in self.KINDS:
+            self.kind_combo.addItem(label, kind)
+        self.kind_combo.setFixedHeight(36)
+        self.kind_combo.setStyleSheet(f"QComboBox{{{field_style}}}")
+        self.kind_combo.currentIndexChanged.connect(self._update_hint)
+        v.addWidget(self.kind_combo)
+
+        file_row = QHBoxLayout()
+        self.path_edit = QLineEdit()
+        self.path_edit.setReadOnly(True)
+        self.path_edit.setPlaceholderText("Choose a CSV file...")
+        self.path_edit.setFixedHeight(36)
+        self.path_edit.setStyleSheet(f"QLineEdit{{{field_style}}}")
+        self.browse_btn = QPushButton("Browse")
+        self.browse_btn.setFixedHeight(36)
+        self.browse_btn.setStyleSheet("QPushButton{background:#a78bfa;color:white;padding:6px 14px;border-radius:8px;font-weight:bold}")
+        self.browse_btn.clicked.connect(self._browse)
+        file_row.addWidget(self.path_edit, 1)
+        file_row.addWidget(self.browse_btn)
+        v.addLayout(file_row)
+
+        self.hint_label = QLabel("")
+        self.hint_label.setWordWrap(True)
+        self.hint_label.setStyleSheet("color: #64748b; border: none; font-size: 11px;")
+        v.addWidget(self.hint_label)
+        self._update_hint()
+
+        self.progress = QProgressBar()
+        self.progress.setFixedHeight(10)
+        self.progress.setTextVisible(False)
+        self.progress.setStyleSheet("""
+            QProgressBar { background-color: #e5e7eb; border: none; border-radius: 5px; }
+            QProgressBar::chunk { background-color: #a78bfa; border-radius: 5px; }
+        """)
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("color: #64748b; border: none;")
+        v.addWidget(self.progress)
+        v.addWidget(self.status_label)
+        v.addStretch()
+
+        actions = QHBoxLayout()
+        actions.addStretch()
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.setStyleSheet("QPushButton{background:#94a3b8;color:white;padding:10px 14px;border-radius:10px;font-weight:bold}")
+        self.import_btn = QPushButton("Import")
+        self.import_btn.setStyleSheet("QPushButton{background:#10b981;color:white;padding:10px 14px;border-radius:10px;font-weight:bold}")
+        self.cancel_btn.clicked.connect(self._cancel)
+        self.import_btn.clicked.connect(self._start_import)
+        actions.addWidget(self.cancel_btn)
+        actions.addSpacing(8)
+        actions.addWidget(self.import_btn)
+
+        v.addLayout(actions)
+        root.addWidget(card)
+
+    def _update_hint(self, *_):
+        if self.kind_combo.currentData() == "employees":
+            self.hint_label.setText("Columns: full_name, position, department; optional employee_id, "
+                                    "leave_credits, is_active")
+        else:
+            self.hint_label.setText("Columns: employee_id, date (YYYY-MM-DD); optional time_in, time_out "
+                                    "(HH:MM or timestamp), status. Import employees first.")
+
+    def _browse(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Import from CSV", "", "CSV Files (*.csv);;All Files (*)")
+        if path:
+            self.path_edit.setText(path)
+
+    def _start_import(self):
+        path = self.path_edit.text().strip()
+        if not path:
+            QMessageBox.warning(self, "No File", "Choose a CSV file to import.")
+            return
+        kind = self.kind_combo.currentData()
+
+        def _run(worker):
+            return import_csv(kind, path, progress=worker.report_progress, is_cancelled=worker.is_cancelled)
+
+        self._worker = Worker(_run, pass_worker=True)
+        self._worker.signals.progress.connect(self._on_progress)
+        self._worker.signals.finished.connect(self._on_finished)
+        self._worker.signals.error.connect(self._on_error)
+        self._set_running(True)
+        self.status_label.setText("Reading file...")
+        start_worker(self._worker)
+
+    def _set_running(self, running: bool):
+        self.import_btn.setEnabled(not running)
+        self.browse_btn.setEnabled(not running)
+        self.kind_combo.setEnabled(not running)
+        self.cancel_btn.setEnabled(True)
+        if running:
+            self.progress.setRange(0, 0)  # busy until the first progress report
+
+    def _on_progress(self, done_kb: int, total_kb: int):
+        self.progress.setRange(0, max(1, total_kb))
+        self.progress.setValue(done_kb)
+        self.status_label.setText(f"{done_kb * 100 // max(1, total_kb)}% of the file processed")
+
+    def _on_finished(self, result: dict):
+        self._worker = None
+        self._set_running(False)
+        self.imported += result.get('imported', 0)
+        self.progress.setRange(0, 1)
+        self.progress.setValue(0 if result.get('cancelled') or result.get('error') else 1)
+        summary = (f"{result.get('imported', 0):,} of {result.get('read', 0):,} row(s) imported, "
+                   f"{result.get('rejected', 0):,} rejected.")
+        if result.get('rejects_path'):
+            summary += f"\n\nRejected rows (with reasons) were saved to:\n{result['rejects_path']}"
+        if result.get('error'):
+            self.status_label.setText("Import stopped")
+            QMessageBox.critical(self, "Import Stopped", f"{result['error']}\n\n{summary}")
+            return
+        if result.get('cancelled'):
+            self.status_label.setText("Import cancelled")
+            QMessageBox.information(self, "Import Cancelled",
+                                    "Rows read before cancelling were imported; the rest of the file "
+                                    f"was skipped.\n\n{summary}")
+            return
+        self.status_label.setText("Import finished")
+        if result.get('rejected'):
+            QMessageBox.warning(self, "Import Finished", summary)
+        else:
+            QMessageBox.information(self, "Import Successful", summary)
+        self.accept()
+
+    def _on_error(self, message: str):
+        self._worker = None
+        self._set_running(False)
+        self.progress.setRange(0, 1)
+        self.progress.setValue(0)
+        self.status_label.setText("Import failed")
+        QMessageBox.critical(self, "Import Failed", f"Failed to import: {message}")
+
+    def _cancel(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            self.cancel_btn.setEnabled(False)
+            self.status_label.setText("Cancelling...")
+        else:
+            self.reject()
+
+    def reject(self):
+        # Escape / window close while importing cancels instead of orphaning the worker
+        if self._worker is not None:
+            self._cancel()
+            return
+        super().reject()
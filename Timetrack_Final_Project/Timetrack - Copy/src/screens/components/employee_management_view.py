@@ -1,5 +1,5 @@
 # screens/components/employee_management_view.py
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, QTableWidget, QHeaderView
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, QTableView, QHeaderView
 from PyQt6.QtCore import Qt
 
 
@@ -16,6 +16,12 @@ class EmployeeManagementView(QWidget):
             "QPushButton {background:#a78bfa;color:white;padding:8px 16px;"
             "border-radius:8px;font-weight:bold;}"
         )
+        self.import_btn = QPushButton("Import CSV")
+        self.import_btn.setStyleSheet(
+            "QPushButton {background:#10b981;color:white;padding:8px 16px;"
+            "border-radius:8px;font-weight:bold;}"
+        )
+        top_btn_layout.addWidget(self.import_btn, alignment=Qt.AlignmentFlag.AlignRight)
         top_btn_layout.addWidget(self.add_emp_btn, alignment=Qt.AlignmentFlag.AlignRight)
         layout.addLayout(top_btn_layout)
 
@@ -40,17 +46,8 @@ class EmployeeManagementView(QWidget):
         )
         layout.addWidget(self.search_edit)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels([
-            "Employee ID",
-            "Name",
-            "Position",
-            "Department",
-            "Absences",
-            "Leave Credits",
-            "Actions",
-        ])
+        # Model (lazily paged EmployeeTableModel) is set by the owner
+        self.table = QTableView()
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         layout.addWidget(self.table)
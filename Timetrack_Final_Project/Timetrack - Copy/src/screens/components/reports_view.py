@@ -37,8 +37,13 @@ class ReportsView(QScrollArea):
         self.export_pdf_btn.setFixedHeight(35)
         self.export_pdf_btn.setStyleSheet("QPushButton { background-color: #ef4444; color: white; padding: 8px 16px; border-radius: 6px; font-weight: bold; }")
 
+        self.export_raw_btn = QPushButton("Export Raw Punches")
+        self.export_raw_btn.setFixedHeight(35)
+        self.export_raw_btn.setStyleSheet("QPushButton { background-color: #a78bfa; color: white; padding: 8px 16px; border-radius: 6px; font-weight: bold; }")
+
         period_layout.addWidget(self.export_csv_btn)
         period_layout.addWidget(self.export_pdf_btn)
+        period_layout.addWidget(self.export_raw_btn)
         layout.addLayout(period_layout)
 
         # Chart header
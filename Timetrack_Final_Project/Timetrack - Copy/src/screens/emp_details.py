@@ -3,9 +3,12 @@ from PyQt6.QtWidgets import (
     QDialog, QLabel, QVBoxLayout, QHBoxLayout,
     QFrame, QPushButton, QScrollArea, QSizePolicy, QWidget
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QSize
 from PyQt6.QtGui import QFont, QPixmap
 
+from ..utils.thumbnails import get_avatar_pixmap
+from ..utils.tracing import traced
+
 
 class EmployeeDetailsModal(QDialog):
     def __init__(self, employee_data, parent=None):
@@ -26,12 +29,20 @@ class EmployeeDetailsModal(QDialog):
             y = screen.y() + (screen.height() - self.height()) // 2
             self.move(x, y)
 
+    def make_avatar_pixmap(self, image_path, size: QSize) -> QPixmap:
+        """Cached avatar thumbnail; initials placeholder when the image is missing."""
+        return get_avatar_pixmap(
+            image_path, max(size.width(), size.height()),
+            name=self.employee_data.get("name"), dpr=self.devicePixelRatioF(),
+        )
+
     def keyPressEvent(self, event):
         if event.key() == Qt.Key.Key_Escape:
             self.close()
         else:
             super().keyPressEvent(event)
 
+    @traced("build employee details", "widget")
     def init_ui(self):
         self.setWindowTitle("Employee Details")
         self.setModal(True)
@@ -104,10 +115,7 @@ class EmployeeDetailsModal(QDialog):
         # Image
         if self.employee_data.get('image_path'):
             img_label = QLabel()
-            pixmap = QPixmap(self.employee_data['image_path']).scaled(
-                220, 220, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
-            )
-            img_label.setPixmap(pixmap)
+            img_label.setPixmap(self.make_avatar_pixmap(self.employee_data['image_path'], QSize(220, 220)))
             img_label.setStyleSheet("border: 2px solid #E0DCE6; background: white;")
             img_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             img_label.setFixedSize(220, 220)
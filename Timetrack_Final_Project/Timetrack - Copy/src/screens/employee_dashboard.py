@@ -2,16 +2,23 @@ import sys
 import os
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout,
-    QHBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView, QFrame, QSizePolicy, QMessageBox, QListWidget
+    QHBoxLayout, QTableView, QHeaderView, QFrame, QSizePolicy, QMessageBox, QListWidget
 )
-from PyQt6.QtCore import Qt, QTimer, QTime, QDate
+from PyQt6.QtCore import Qt, QTime, QDate
 from PyQt6.QtGui import QFont, QPixmap
-from .emp_details import EmployeeDetailsModal
 from ..database.db_queries import get_today_attendance, get_today_stats, get_employee_by_id, get_employee_details, employee_check_in, employee_check_out
+from ..widgets.action_button_delegate import ActionButtonDelegate, VIEW_DETAILS_ACTION
+from ..widgets.attendance_table_model import AttendanceTableModel, ACTION_COLUMN
+from ..utils.refresh_scheduler import get_refresh_scheduler, PRIORITY_HIGH
+from ..utils.lazy_import import lazy_callable
+from ..utils import metrics
 from ..config import ATTENDANCE_REFRESH_MS, TIME_TICK_MS, TIME_DISPLAY_FORMAT, DATE_DISPLAY_FORMAT
 
+EmployeeDetailsModal = lazy_callable(".emp_details", "EmployeeDetailsModal", __package__)
+
 class AttendanceDashboard(QWidget):
-    def __init__(self):
+    def __init__(self, initial_attendance=None):
+        """initial_attendance: today's rows when already loaded (startup preloads them off the GUI thread)."""
         super().__init__()
         self.setWindowTitle("TimeTrack - Attendance Monitoring System")
         self.setGeometry(200, 100, 1500, 900)
@@ -167,6 +174,10 @@ class AttendanceDashboard(QWidget):
 
         header_layout.addWidget(page_title)
         header_layout.addWidget(header_spacer, 1)
+        if metrics.is_enabled():
+            # DB latency from the metrics registry (Timetrack_METRICS=1)
+            from ..widgets.db_latency_indicator import DbLatencyIndicator
+            header_layout.addWidget(DbLatencyIndicator(), 0)
         header_layout.addWidget(date_widget)
 
         # Check-in card
@@ -254,18 +265,16 @@ class AttendanceDashboard(QWidget):
         checkin_layout.addLayout(left_checkin, 2)
         checkin_layout.addLayout(right_checkin, 1)
 
-        # Attendance table
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels([
-            "Employee ID", "Employee Name", "Time In", "Time Out", "Status", "Action"
-        ])
+        # Attendance table: the model diffs each refresh by employee_id and only touches changed rows
+        self.attendance_model = AttendanceTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.attendance_model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         # Ensure rows tall enough so action button text isn't cropped
         self.table.verticalHeader().setDefaultSectionSize(44)
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: white;
                 border: 1px solid #e2e8f0;
                 border-radius: 8px;
@@ -279,12 +288,16 @@ class AttendanceDashboard(QWidget):
                 color: #475569;
                 border-bottom: 2px solid #e2e8f0;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
                 color: #1e293b;
             }
         """)
 
+        self.table_actions = ActionButtonDelegate([VIEW_DETAILS_ACTION], self.table, button_height=36, font_size=11)
+        self.table_actions.attach(self.table, ACTION_COLUMN)
+        self.table_actions.action_triggered.connect(lambda _action, emp_id: self.show_employee_details(emp_id))
+
         # Add all to right layout
         right_layout.addLayout(header_layout)
         right_layout.addWidget(checkin_card)
@@ -300,17 +313,21 @@ class AttendanceDashboard(QWidget):
         self.staff_btn.clicked.connect(self.show_staff_login)
         self.admin_btn.clicked.connect(self.show_admin_login)
 
-        # Timers
-        timer = QTimer(self)
-        timer.timeout.connect(self.update_time)
-        timer.start(TIME_TICK_MS)
-
-        self.load_attendance_data()
+        if initial_attendance is not None:
+            self.attendance_model.set_rows(initial_attendance)
+        else:
+            self.load_attendance_data()
 
-        self.attendance_refresh_timer = QTimer(self)
-        self.attendance_refresh_timer.setInterval(ATTENDANCE_REFRESH_MS)
-        self.attendance_refresh_timer.timeout.connect(self.load_attendance_data)
-        self.attendance_refresh_timer.start()
+        # Periodic refreshes run on the shared scheduler (paused while the kiosk window is hidden)
+        scheduler = get_refresh_scheduler()
+        self.clock_job = scheduler.add_job(
+            "kiosk_clock", self.update_time, TIME_TICK_MS, owner=self,
+            priority=PRIORITY_HIGH, cost=0, idle_backoff=False,
+        )
+        self.attendance_job = scheduler.add_job(
+            "kiosk_attendance", self.load_attendance_data, ATTENDANCE_REFRESH_MS, owner=self,
+            priority=PRIORITY_HIGH, cost=2,
+        )
 
     def update_time(self):
         # Update header time and date
@@ -318,32 +335,7 @@ class AttendanceDashboard(QWidget):
         self.header_date_label.setText(QDate.currentDate().toString(DATE_DISPLAY_FORMAT))
 
     def load_attendance_data(self):
-        attendance = get_today_attendance()
-        self.table.setRowCount(len(attendance))
-        for r, data in enumerate(attendance):
-            self.table.setItem(r, 0, QTableWidgetItem(str(data['employee_id'])))
-            self.table.setItem(r, 1, QTableWidgetItem(data['full_name']))
-            self.table.setItem(r, 2, QTableWidgetItem(data['check_in']))
-            self.table.setItem(r, 3, QTableWidgetItem(data['check_out']))
-            self.table.setItem(r, 4, QTableWidgetItem(data['status']))
-
-            view_btn = QPushButton("View Details")
-            view_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #a78bfa;
-                    color: white;
-                    padding: 6px 12px;
-                    border-radius: 6px;
-                    border: none;
-                    font-size: 11px;
-                }
-                QPushButton:hover {
-                    background-color: #8b5cf6;
-                }
-            """)
-            view_btn.setFixedHeight(36)
-            view_btn.clicked.connect(lambda checked, emp_id=data['employee_id']: self.show_employee_details(emp_id))
-            self.table.setCellWidget(r, 5, view_btn)
+        self.attendance_model.set_rows(get_today_attendance())
 
     def handle_checkin(self):
         emp_id_text = self.checkin_id.text().strip()
@@ -425,8 +417,7 @@ class AttendanceDashboard(QWidget):
 
     def closeEvent(self, event):
         try:
-            if hasattr(self, 'attendance_refresh_timer'):
-                self.attendance_refresh_timer.stop()
+            get_refresh_scheduler().remove_owner(self)
         except Exception:
             pass
         super().closeEvent(event)
@@ -1,27 +1,35 @@
 # screens/staff_dashboard.py
-from PyQt6.QtWidgets import QWidget, QMessageBox, QInputDialog, QHBoxLayout, QTableWidgetItem, QPushButton
+from PyQt6.QtWidgets import QMessageBox, QInputDialog
 from PyQt6.QtCore import Qt
 
-from ..database.db_queries import update_employee, get_employee_by_id, get_employee_details, add_employee, set_employee_image_path
+from ..database.db_queries import update_employee, get_employee_by_id, get_employee_details, add_employee
 from .base_dashboard import DashboardBase
-from .add_employee_modal import AddEmployeeModal
-from .emp_details import EmployeeDetailsModal
-import os
-import shutil
+from ..widgets.action_button_delegate import EDIT_ACTION, EDIT_LEAVE_ACTION
+from ..utils.lazy_import import lazy_callable
+
+AddEmployeeModal = lazy_callable(".add_employee_modal", "AddEmployeeModal", __package__)
 
 class StaffDashboard(DashboardBase):
+    # Staff cannot deactivate employees: no Deactivate button in the Actions column
+    EMPLOYEE_ROW_ACTIONS = [EDIT_ACTION, EDIT_LEAVE_ACTION]
+    EMPLOYEE_ACTION_BUTTON_WIDTH = 120
+
     def __init__(self):
         super().__init__(title_suffix="Staff Dashboard")
 
         # Add Logout to sidebar
         self.sidebar.addItem("Logout")
 
-        self._restrict_staff_reports_to_monthly()
         self.sidebar.setCurrentRow(0)  # Default to Attendance tab
-        if hasattr(self, 'add_emp_btn'):
-            self.add_emp_btn.clicked.connect(self.show_add_employee_modal)
         self.switch_tab("attendance")
 
+    def on_page_built(self, name, page):
+        """Apply staff restrictions when the lazily built pages are first visited"""
+        if name == "reports":
+            self._restrict_staff_reports_to_monthly()
+        elif name == "employee_management":
+            self.add_emp_btn.clicked.connect(self.show_add_employee_modal)
+
     def _restrict_staff_reports_to_monthly(self):
         try:
             # Allow only Daily, Weekly, Monthly in the main reports period selector (remove Yearly)
@@ -40,10 +48,7 @@ class StaffDashboard(DashboardBase):
                 self.indiv_view_combo.addItems(["Monthly"])
                 self.indiv_view_combo.setCurrentIndex(0)
                 self.indiv_view_combo.blockSignals(False)
-
-            # Refresh the reports view to reflect the restriction immediately
-            if hasattr(self, 'update_reports_view') and hasattr(self, 'period_combo') and self.period_combo is not None:
-                self.update_reports_view(self.period_combo.currentText())
+            # No refresh here: switching to the Reports tab triggers its refresh jobs
         except Exception as e:
             print(f"[StaffDashboard] Failed to apply staff report period restrictions: {e}")
 
@@ -58,45 +63,6 @@ class StaffDashboard(DashboardBase):
         elif index == 3:
             self.handle_logout()
 
-    # overrides the base_dashboard method to delete button in the employee management table
-    def load_employee_table(self):
-        self.load_employee_data()
-        self.table.setRowCount(len(self.employee_data))
-        keys = list(self.employee_data.keys())
-        for row in range(len(keys)):
-            emp_id = keys[row]
-            emp = self.employee_data[emp_id]
-            self.table.setItem(row, 0, QTableWidgetItem(str(emp['id'])))
-            self.table.setItem(row, 1, QTableWidgetItem(emp['name']))
-            self.table.setItem(row, 2, QTableWidgetItem(emp['position']))
-            self.table.setItem(row, 3, QTableWidgetItem(emp['department']))
-            self.table.setItem(row, 4, QTableWidgetItem(str(emp['absences'])))
-            self.table.setItem(row, 5, QTableWidgetItem(str(emp['leave_credits'])))
-
-            # Action cell (no Delete button)
-            action_widget = QWidget()
-            h = QHBoxLayout(action_widget)
-            h.setContentsMargins(0, 0, 0, 0)
-            h.setSpacing(4)
-
-            edit_btn = QPushButton("Edit")
-            edit_btn.setStyleSheet(
-                "QPushButton{background:#a78bfa;color:white;padding:6px 12px;border-radius:6px;font-size:11px;}")
-            edit_btn.setFixedWidth(120)
-
-            leave_btn = QPushButton("Edit Leave")
-            leave_btn.setStyleSheet(
-                "QPushButton{background:#f59e0b;color:white;padding:6px 12px;border-radius:6px;font-size:11px;}")
-            leave_btn.setFixedWidth(120)
-
-            edit_btn.clicked.connect(lambda checked, eid=emp_id: self.handle_edit_employee(eid))
-            leave_btn.clicked.connect(lambda checked, eid=emp_id: self.handle_edit_leave(eid))
-
-            h.addWidget(edit_btn)
-            h.addWidget(leave_btn)
-            h.addStretch()
-            self.table.setCellWidget(row, 6, action_widget)
-
     def show_add_employee_modal(self):
         try:
             dlg = AddEmployeeModal(self)
@@ -114,15 +80,8 @@ class StaffDashboard(DashboardBase):
             img = data.get('image_path')
             new_id = add_employee(name, pos, dept)
             if new_id and img:
-                ext = os.path.splitext(img)[1].lower() or '.jpg'
-                dest_dir = os.path.join('assets', 'employees')
-                os.makedirs(dest_dir, exist_ok=True)
-                dest_path = os.path.join(dest_dir, f"#{new_id}{ext}")
-                try:
-                    shutil.copyfile(img, dest_path)
-                    set_employee_image_path(new_id, dest_path)
-                except Exception as e:
-                    print(f"Failed to copy image: {e}")
+                # Resized and stored by content hash in the background
+                self.store_employee_photo(new_id, img)
             self.load_employee_table()
             QMessageBox.information(self, "Success", "Employee added successfully!")
         except Exception as e:
@@ -142,19 +101,10 @@ class StaffDashboard(DashboardBase):
             pos = data['position']
             dept = data['department']
             img = data.get('image_path')
+            update_employee(emp_id, name, pos, dept)
             if img:
-                ext = os.path.splitext(img)[1].lower() or '.jpg'
-                dest_dir = os.path.join('assets', 'employees')
-                os.makedirs(dest_dir, exist_ok=True)
-                dest_path = os.path.join(dest_dir, f"#{emp_id}{ext}")
-                try:
-                    shutil.copyfile(img, dest_path)
-                    update_employee(emp_id, name, pos, dept, image_path=dest_path)
-                except Exception as e:
-                    print(f"Failed to copy/update image: {e}")
-                    update_employee(emp_id, name, pos, dept)
-            else:
-                update_employee(emp_id, name, pos, dept)
+                # Resized and stored by content hash in the background
+                self.store_employee_photo(emp_id, img)
             self.load_employee_table()
             QMessageBox.information(self, "Success", "Employee updated successfully!")
         except Exception as e:
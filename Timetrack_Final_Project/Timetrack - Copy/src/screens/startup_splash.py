@@ -0,0 +1,95 @@
+# screens/startup_splash.py
+from PyQt6.QtWidgets import QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QProgressBar
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QFont, QPixmap
+
+
+class StartupSplash(QWidget):
+    """Shown immediately at launch while the database is initialized in the background.
+
+    Displays step progress, and on failure the error with Retry / Quit buttons.
+    """
+
+    retry_requested = pyqtSignal()
+    quit_requested = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("TimeTrack")
+        self.setWindowFlags(Qt.WindowType.SplashScreen | Qt.WindowType.FramelessWindowHint)
+        self.setFixedSize(460, 360)
+        self.setStyleSheet("""
+            QWidget {
+                background-color: #1e293b;
+                font-family: 'Segoe UI', Arial, sans-serif;
+            }
+        """)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(30, 30, 30, 25)
+        layout.setSpacing(12)
+
+        logo = QLabel()
+        pixmap = QPixmap("assets/Timetrack.png")
+        if not pixmap.isNull():
+            logo.setPixmap(pixmap.scaled(100, 140, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+        logo.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        title = QLabel("TimeTrack")
+        title.setFont(QFont("Inter", 18, QFont.Weight.Bold))
+        title.setStyleSheet("color: white;")
+        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self.status_label = QLabel("Starting...")
+        self.status_label.setStyleSheet("color: #cbd5e1; font-size: 13px;")
+        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.status_label.setWordWrap(True)
+
+        self.progress = QProgressBar()
+        self.progress.setTextVisible(False)
+        self.progress.setFixedHeight(8)
+        self.progress.setStyleSheet("""
+            QProgressBar { background-color: #334155; border: none; border-radius: 4px; }
+            QProgressBar::chunk { background-color: #a78bfa; border-radius: 4px; }
+        """)
+
+        buttons = QHBoxLayout()
+        self.retry_btn = QPushButton("Retry")
+        self.quit_btn = QPushButton("Quit")
+        for btn, color in ((self.retry_btn, "#a78bfa"), (self.quit_btn, "#64748b")):
+            btn.setStyleSheet(f"""
+                QPushButton {{
+                    background-color: {color}; color: white; border: none;
+                    border-radius: 6px; padding: 8px 18px; font-weight: bold;
+                }}
+            """)
+            btn.setVisible(False)
+            buttons.addWidget(btn)
+        self.retry_btn.clicked.connect(self._on_retry)
+        self.quit_btn.clicked.connect(self.quit_requested.emit)
+
+        layout.addWidget(logo)
+        layout.addWidget(title)
+        layout.addStretch(1)
+        layout.addWidget(self.status_label)
+        layout.addWidget(self.progress)
+        layout.addLayout(buttons)
+
+    def set_progress(self, step: int, total: int, label: str):
+        self.progress.setRange(0, max(1, total))
+        self.progress.setValue(step)
+        self.status_label.setStyleSheet("color: #cbd5e1; font-size: 13px;")
+        self.status_label.setText(label)
+
+    def show_error(self, message: str):
+        self.status_label.setStyleSheet("color: #fca5a5; font-size: 13px;")
+        self.status_label.setText(message)
+        self.progress.setValue(0)
+        self.retry_btn.setVisible(True)
+        self.quit_btn.setVisible(True)
+
+    def _on_retry(self):
+        self.retry_btn.setVisible(False)
+        self.quit_btn.setVisible(False)
+        self.set_progress(0, 1, "Retrying...")
+        self.retry_requested.emit()
@@ -0,0 +1,297 @@
+# src/utils/bulk_import.py
+"""Bulk import of employees and historical attendance punches from CSV.
+
+    python -m src.utils.bulk_import employees new_site.csv
+    python -m src.utils.bulk_import punches badge_export.csv --batch-size 10000
+
+The file is read as a stream and validated row by row; valid rows are written in batched
+transactions (multi-row INSERTs) and invalid ones are collected in a rejected-rows CSV next
+to the source, with the line number and reason. Import employees before their punches.
+
+Employees: full_name, position, department [, employee_id, leave_credits, is_active]
+Punches:   employee_id, date [, time_in, time_out, status]
+Dates are YYYY-MM-DD; times are HH:MM[:SS] or full "YYYY-MM-DD HH:MM[:SS]" timestamps
+(time_out may fall on the next day). A missing status is derived like a kiosk check-in.
+"""
+from __future__ import annotations
+import argparse
+import codecs
+import csv
+import os
+import sys
+import time
+from datetime import date, datetime, time as dtime, timedelta
+from typing import Callable, Optional
+
+from ..config import IMPORT_BATCH_SIZE
+
+IMPORT_KINDS = ("employees", "punches")
+EMPLOYEE_COLUMNS = ("employee_id", "full_name", "position", "department", "leave_credits", "is_active")
+EMPLOYEE_REQUIRED = ("full_name", "position", "department")
+PUNCH_COLUMNS = ("employee_id", "date", "time_in", "time_out", "status")
+PUNCH_REQUIRED = ("employee_id", "date")
+# Column sizes from the employees table
+_TEXT_LIMITS = {"full_name": 100, "position": 50, "department": 50}
+_TRUE = {"1", "true", "yes", "y", "active"}
+_FALSE = {"0", "false", "no", "n", "inactive"}
+
+
+def rejects_path_for(path: str) -> str:
+    """Default rejected-rows file: <source>.rejected.csv beside the source."""
+    stem, _ext = os.path.splitext(path)
+    return f"{stem}.rejected.csv"
+
+
+def _normalize_header(name: str) -> str:
+    return (name or "").strip().lower().replace(" ", "_")
+
+
+def _int(text: str, column: str) -> int:
+    try:
+        return int(text)
+    except ValueError:
+        raise ValueError(f"{column} is not a whole number: {text!r}") from None
+
+
+def _parse_date(text: str) -> date:
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        raise ValueError(f"date is not YYYY-MM-DD: {text!r}") from None
+
+
+def _parse_time(text: str, day: date, column: str) -> datetime:
+    try:
+        if len(text) <= 8:
+            return datetime.combine(day, dtime.fromisoformat(text))
+        return datetime.fromisoformat(text)
+    except ValueError:
+        raise ValueError(f"{column} is not HH:MM[:SS] or a timestamp: {text!r}") from None
+
+
+class _EmployeeRows:
+    """Validates employee rows and writes them with insert_employees."""
+
+    columns, required = EMPLOYEE_COLUMNS, EMPLOYEE_REQUIRED
+
+    def __init__(self):
+        from ..database.db_queries import get_employee_ids
+        self.known_ids = get_employee_ids()
+
+    def parse(self, get: Callable[[str], str]) -> tuple:
+        emp_id = None
+        if get("employee_id"):
+            emp_id = _int(get("employee_id"), "employee_id")
+            if emp_id <= 0:
+                raise ValueError(f"employee_id must be positive: {emp_id}")
+            if emp_id in self.known_ids:
+                raise ValueError(f"employee_id {emp_id} already exists")
+        values = {}
+        for column, limit in _TEXT_LIMITS.items():
+            value = get(column)
+            if not value:
+                raise ValueError(f"{column} is empty")
+            if len(value) > limit:
+                raise ValueError(f"{column} is longer than {limit} characters")
+            values[column] = value
+        leave_credits = _int(get("leave_credits"), "leave_credits") if get("leave_credits") else 15
+        if leave_credits < 0:
+            raise ValueError(f"leave_credits is negative: {leave_credits}")
+        active = get("is_active").lower()
+        if active and active not in _TRUE | _FALSE:
+            raise ValueError(f"is_active is not yes/no: {get('is_active')!r}")
+        if emp_id is not None:
+            self.known_ids.add(emp_id)
+        return (emp_id, values["full_name"], values["position"], values["department"],
+                leave_credits, active not in _FALSE)
+
+    def write(self, rows: list[tuple]) -> tuple[int, list[int]]:
+        from ..database.db_queries import insert_employees
+        return insert_employees(rows), []
+
+
+class _PunchRows:
+    """Validates punch rows and writes them with insert_attendance_records."""
+
+    columns, required = PUNCH_COLUMNS, PUNCH_REQUIRED
+
+    def __init__(self):
+        from ..database.db_queries import get_employee_ids, punch_status, ATTENDANCE_STATUSES
+        self.known_ids = get_employee_ids()
+        self.today = date.today()
+        self.punch_status = punch_status
+        self.statuses = ATTENDANCE_STATUSES
+
+    def parse(self, get: Callable[[str], str]) -> tuple:
+        emp_id = _int(get("employee_id"), "employee_id")
+        if emp_id not in self.known_ids:
+            raise ValueError(f"unknown employee_id {emp_id}")
+        day = _parse_date(get("date"))
+        if day > self.today:
+            raise ValueError(f"date is in the future: {day}")
+        time_in = _parse_time(get("time_in"), day, "time_in") if get("time_in") else None
+        time_out = _parse_time(get("time_out"), day, "time_out") if get("time_out") else None
+        if time_in is not None and time_in.date() != day:
+            raise ValueError(f"time_in {time_in} is not on {day}")
+        if time_out is not None:
+            if time_in is None:
+                raise ValueError("time_out without time_in")
+            if time_out <= time_in:
+                raise ValueError("time_out is not after time_in")
+            if time_out - time_in > timedelta(hours=24):
+                raise ValueError("shift is longer than 24 hours")
+        status = get("status").capitalize()
+        if not status:
+            status = self.punch_status(time_in) if time_in is not None else 'Absent'
+        elif status not in self.statuses:
+            raise ValueError(f"status must be one of {', '.join(self.statuses)}: {get('status')!r}")
+        elif status == 'Absent' and time_in is not None:
+            raise ValueError("Absent record has a time_in")
+        elif status != 'Absent' and time_in is None:
+            raise ValueError(f"{status} record has no time_in")
+        return (emp_id, time_in, time_out, status, day)
+
+    def write(self, rows: list[tuple]) -> tuple[int, list[int]]:
+        from ..database.db_queries import insert_attendance_records
+        result = insert_attendance_records(rows)
+        return result['inserted'], result['duplicates']
+
+
+def import_csv(kind: str, path: str, rejects_path: Optional[str] = None, batch_size: int = IMPORT_BATCH_SIZE,
+               progress: Optional[Callable[[int, int], None]] = None,
+               is_cancelled: Optional[Callable[[], bool]] = None) -> dict:
+    """Import `path` as `kind` ('employees' or 'punches').
+
+    progress(done_kb, total_kb) and is_cancelled() are called every batch_size rows read;
+    when cancelled, the rows read so far are still written (or rejected) and the rest are
+    skipped. A batch the database refuses, or a line that cannot be decoded or parsed as CSV,
+    stops the import; the rows before it are kept and 'error' says why. Raises ValueError
+    when the header lacks a required column.
+    Returns {'read', 'imported', 'rejected', 'cancelled', 'error', 'rejects_path', 'elapsed_ms'}.
+    """
+    if kind not in IMPORT_KINDS:
+        raise ValueError(f"Unknown import kind: {kind}")
+    started = time.perf_counter()
+    rejects_path = rejects_path or rejects_path_for(path)
+    result = {'read': 0, 'imported': 0, 'rejected': 0, 'cancelled': False, 'error': None,
+              'rejects_path': None, 'elapsed_ms': 0.0}
+    rejects_file = rejects_writer = None
+
+    with open(path, "rb") as raw:
+        total_kb = max(1, os.fstat(raw.fileno()).st_size // 1024)
+        # Decode line by line so the byte offset (raw.tell) can drive progress; utf-8-sig drops Excel's BOM
+        reader = csv.reader(codecs.iterdecode(raw, "utf-8-sig"))
+        header = next(reader, None)
+        if header is None:
+            raise ValueError("The file is empty")
+        names = [_normalize_header(h) for h in header]
+        rows_type = _EmployeeRows if kind == "employees" else _PunchRows
+        missing = [c for c in rows_type.required if c not in names]
+        if missing:
+            raise ValueError(f"Missing column(s): {', '.join(missing)}")
+        index = {c: names.index(c) for c in rows_type.columns if c in names}
+        handler = rows_type()
+
+        def reject(line: int, reason: str, fields: list[str]):
+            nonlocal rejects_file, rejects_writer
+            if rejects_writer is None:
+                # Opened on the first rejected row, so clean imports leave no file behind
+                rejects_file = open(rejects_path, "w", encoding="utf-8", newline="")
+                rejects_writer = csv.writer(rejects_file)
+                rejects_writer.writerow(["line", "reason"] + header)
+                result['rejects_path'] = rejects_path
+            rejects_writer.writerow([line, reason] + fields)
+            result['rejected'] += 1
+
+        batch, sources = [], []
+
+        def flush() -> bool:
+            try:
+                inserted, duplicates = handler.write(batch)
+            except Exception as e:
+                result['error'] = f"Database error after {result['imported']:,} row(s): {e}"
+                for line, fields in sources:
+                    reject(line, f"not imported: {e}", fields)
+                return False
+            result['imported'] += inserted
+            for i in duplicates:
+                reject(sources[i][0], "duplicate: a record for this employee and date already exists", sources[i][1])
+            batch.clear()
+            sources.clear()
+            return True
+
+        try:
+            for fields in reader:
+                if not any(f.strip() for f in fields):
+                    continue  # blank line
+                result['read'] += 1
+                line = reader.line_num
+                try:
+                    row = handler.parse(
+                        lambda c: fields[index[c]].strip() if c in index and index[c] < len(fields) else ""
+                    )
+                    batch.append(row)
+                    sources.append((line, fields))
+                except ValueError as e:
+                    reject(line, str(e), fields)
+                if len(batch) >= batch_size and not flush():
+                    break
+                if result['read'] % batch_size == 0:
+                    if progress is not None:
+                        progress(min(raw.tell() // 1024, total_kb - 1), total_kb)
+                    if is_cancelled is not None and is_cancelled():
+                        result['cancelled'] = True
+                        # Rows read so far are written, so read == imported + rejected
+                        if batch:
+                            flush()
+                        break
+            else:
+                if batch:
+                    flush()
+            if progress is not None and not result['cancelled'] and result['error'] is None:
+                progress(total_kb, total_kb)
+        except (UnicodeDecodeError, csv.Error) as e:
+            # The rows read before the unreadable line are still written
+            if not batch or flush():
+                result['error'] = (f"Could not read line {reader.line_num + 1}: {e}. "
+                                   f"{result['imported']:,} row(s) before it were imported")
+        finally:
+            if rejects_file is not None:
+                rejects_file.close()
+    result['elapsed_ms'] = round((time.perf_counter() - started) * 1000.0, 1)
+    return result
+
+
+def _print_progress(done: int, total: int) -> None:
+    print(f"\r  {done * 100 // max(1, total)}%", end="\n" if done >= total else "", flush=True)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.utils.bulk_import", description=__doc__.splitlines()[0])
+    parser.add_argument("kind", choices=IMPORT_KINDS)
+    parser.add_argument("file", help="CSV file with a header row")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE, help="rows per transaction")
+    parser.add_argument("--rejects", default=None, help="rejected-rows CSV (default: <file>.rejected.csv)")
+    args = parser.parse_args(argv)
+    if not os.path.isfile(args.file):
+        parser.error(f"not a file: {args.file}")
+    if args.batch_size <= 0:
+        parser.error("--batch-size must be positive")
+
+    try:
+        result = import_csv(args.kind, args.file, args.rejects, args.batch_size, _print_progress)
+    except ValueError as e:
+        print(f"Cannot import {args.file}: {e}")
+        return 2
+    rate = result['read'] / max(result['elapsed_ms'] / 1000.0, 0.001)
+    print(f"Imported {result['imported']:,} of {result['read']:,} {args.kind} row(s) "
+          f"in {result['elapsed_ms'] / 1000.0:.1f} s ({rate:,.0f} rows/s); {result['rejected']:,} rejected")
+    if result['rejects_path']:
+        print(f"  rejected rows: {result['rejects_path']}")
+    if result['error']:
+        print(f"  stopped: {result['error']}")
+    return 1 if result['error'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
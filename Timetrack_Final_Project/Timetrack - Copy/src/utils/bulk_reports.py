@@ -0,0 +1,193 @@
+# src/utils/bulk_reports.py
+"""Month-end batch: one hours report (PDF and/or CSV) per employee.
+
+    python -m src.utils.bulk_reports --view monthly --year 2025 --out reports/2025
+    python -m src.utils.bulk_reports --view yearly --format csv --employees 1001,1002
+
+Every employee's series comes from one bulk query; files are rendered in parallel worker
+processes with Qt's offscreen platform (no display needed), and a manifest.json lists
+every file written and every failure.
+"""
+from __future__ import annotations
+import argparse
+import csv
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime
+from typing import Callable, Optional
+
+from ..config import DEFAULT_CSV_ENCODING
+
+REPORT_FORMATS = ("pdf", "csv")
+MANIFEST_NAME = "manifest.json"
+MONTH_NAMES = ("January", "February", "March", "April", "May", "June", "July",
+               "August", "September", "October", "November", "December")
+HOURS_HEADERS = ["Hours", "Worked Days", "Expected Days", "Absences", "Overtime"]
+
+_qt_app = None  # per worker process, see _init_worker
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "_", text or "").strip("_")[:40] or "employee"
+
+
+def _table(view: str, rows: list[dict]) -> tuple[list[str], list[list], str]:
+    """Headers, cells and summary line of one employee's report."""
+    if view == "monthly":
+        headers = ["Month"] + HOURS_HEADERS
+        cells = [[MONTH_NAMES[int(r['month']) - 1]] for r in rows]
+    else:
+        headers = ["Year"] + HOURS_HEADERS
+        cells = [[int(r['year'])] for r in rows]
+    for cell, r in zip(cells, rows):
+        cell.extend([f"{float(r['hours']):.2f}", r['worked_days'], r['expected_days'],
+                     r['absences'], f"{float(r['overtime']):.2f}"])
+    total_hours = sum(float(r['hours']) for r in rows)
+    total_absences = sum(int(r['absences']) for r in rows)
+    summary = f"Total: {total_hours:.2f} hours, {total_absences} absence(s)"
+    return headers, cells, summary
+
+
+def _init_worker() -> None:
+    # Each worker process needs its own (headless) Qt application for fonts and QPdfWriter
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtGui import QGuiApplication
+    global _qt_app
+    _qt_app = QGuiApplication.instance() or QGuiApplication([sys.argv[0]])
+
+
+def _file_entry(path: str, fmt: str) -> dict:
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return {'format': fmt, 'path': path, 'bytes': os.path.getsize(path), 'sha256': digest}
+
+
+def render_employee_report(job: dict) -> dict:
+    """Write one employee's files. Runs in a worker process; returns its manifest entry."""
+    emp = job['employee']
+    view, period = job['view'], job['period_label']
+    entry = {'employee_id': emp['employee_id'], 'name': emp['full_name'], 'rows': len(job['rows']),
+             'files': [], 'error': None}
+    base = os.path.join(job['out_dir'], f"{emp['employee_id']}_{_slug(emp['full_name'])}_{view}_{_slug(period)}")
+    headers, cells, summary = _table(view, job['rows'])
+    try:
+        if "csv" in job['formats']:
+            path = base + ".csv"
+            with open(path, "w", encoding=DEFAULT_CSV_ENCODING, newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(headers)
+                writer.writerows(cells)
+            entry['files'].append(_file_entry(path, "csv"))
+        if "pdf" in job['formats']:
+            from .pdf_report import render_table_pdf
+            path = base + ".pdf"
+            subtitle = f"{emp.get('position', '')} · {emp.get('department', '')} · {period}".strip(" ·")
+            render_table_pdf(path, f"Working Hours Report - {emp['full_name']} (#{emp['employee_id']})",
+                             headers, cells, subtitle=subtitle, summary_text=summary,
+                             align=["left"] + ["center"] * len(HOURS_HEADERS))
+            entry['files'].append(_file_entry(path, "pdf"))
+    except Exception as e:
+        entry['error'] = f"{type(e).__name__}: {e}"
+    return entry
+
+
+def generate_reports(out_dir: str, view: str = "monthly", year: Optional[int] = None,
+                     formats: tuple[str, ...] = REPORT_FORMATS, employee_ids: Optional[list[int]] = None,
+                     workers: int = 0, progress: Optional[Callable[[int, int], None]] = None) -> dict:
+    """Generate every employee's report into out_dir and write the manifest. Returns the manifest."""
+    from ..database.db_queries import (
+        get_all_employees, get_employees_monthly_hours_bulk, get_employees_yearly_hours_bulk
+    )
+
+    started = time.perf_counter()
+    year = year or date.today().year
+    employees = get_all_employees()
+    if employee_ids:
+        wanted = set(employee_ids)
+        employees = [e for e in employees if e['employee_id'] in wanted]
+    ids = [e['employee_id'] for e in employees]
+    if view == "monthly":
+        series = get_employees_monthly_hours_bulk(year, ids) if ids else {}
+        period_label = str(year)
+    else:
+        series = get_employees_yearly_hours_bulk(ids) if ids else {}
+        period_label = "All Years"
+    query_ms = (time.perf_counter() - started) * 1000.0
+
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = [{
+        'employee': {k: e.get(k) for k in ('employee_id', 'full_name', 'position', 'department')},
+        'rows': series.get(e['employee_id'], []),
+        'view': view, 'period_label': period_label, 'formats': tuple(formats), 'out_dir': out_dir,
+    } for e in employees]
+
+    entries = []
+    if jobs:
+        max_workers = workers if workers and workers > 0 else (os.cpu_count() or 1)
+        # spawn: workers start clean instead of inheriting this process's state (and Windows has no fork)
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs)), mp_context=context,
+                                 initializer=_init_worker) as pool:
+            futures = [pool.submit(render_employee_report, job) for job in jobs]
+            for done, future in enumerate(as_completed(futures), 1):
+                entries.append(future.result())
+                if progress is not None:
+                    progress(done, len(jobs))
+    entries.sort(key=lambda e: e['employee_id'])
+
+    manifest = {
+        'generated_at': datetime.now().isoformat(timespec="seconds"),
+        'view': view,
+        'period': period_label,
+        'formats': list(formats),
+        'employees': len(entries),
+        'files': sum(len(e['files']) for e in entries),
+        'failed': [e['employee_id'] for e in entries if e['error']],
+        'query_ms': round(query_ms, 1),
+        'elapsed_ms': round((time.perf_counter() - started) * 1000.0, 1),
+        'reports': entries,
+    }
+    with open(os.path.join(out_dir, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def _print_progress(done: int, total: int) -> None:
+    print(f"\r  {done}/{total}", end="\n" if done == total else "", flush=True)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.utils.bulk_reports", description=__doc__.splitlines()[0])
+    parser.add_argument("--view", choices=("monthly", "yearly"), default="monthly",
+                        help="monthly = one row per month of --year; yearly = one row per year")
+    parser.add_argument("--year", type=int, default=date.today().year)
+    parser.add_argument("--format", dest="formats", nargs="+", choices=REPORT_FORMATS, default=list(REPORT_FORMATS))
+    parser.add_argument("--employees", default="", help="comma-separated employee ids (default: all active)")
+    parser.add_argument("--out", default=None, help="output folder (default: reports/<view>_<year>)")
+    parser.add_argument("--workers", type=int, default=0, help="processes (0 = one per CPU)")
+    args = parser.parse_args(argv)
+
+    try:
+        employee_ids = [int(x) for x in args.employees.split(",") if x.strip()]
+    except ValueError:
+        parser.error("--employees must be a comma-separated list of ids")
+    out_dir = args.out or os.path.join("reports", f"{args.view}_{args.year if args.view == 'monthly' else 'all'}")
+
+    manifest = generate_reports(out_dir, args.view, args.year, tuple(args.formats), employee_ids,
+                                args.workers, _print_progress)
+    print(f"Wrote {manifest['files']} file(s) for {manifest['employees']} employee(s) to {out_dir} "
+          f"in {manifest['elapsed_ms'] / 1000.0:.1f} s (bulk query {manifest['query_ms']:.0f} ms)")
+    for entry in manifest['reports']:
+        if entry['error']:
+            print(f"  failed: #{entry['employee_id']} {entry['name']}: {entry['error']}")
+    return 1 if manifest['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,7 +4,10 @@ These helpers keep UI-free logic separate; callers handle file dialogs and messa
 """
 from __future__ import annotations
 
-from typing import Iterable, Sequence, Optional
+import csv
+import os
+from datetime import date
+from typing import Callable, Iterable, Sequence, Optional
 
 from ..config import DEFAULT_CSV_ENCODING
 
@@ -36,66 +39,72 @@ def export_department_attendance_csv(
     Each row should contain: department, total_employees, present, late, absent
     """
     with open(path, "w", encoding=encoding, newline="") as f:
-        f.write("Period,Department,Total Employees,Present,Late,Absent\n")
+        writer = csv.writer(f)
+        writer.writerow(["Period", "Department", "Total Employees", "Present", "Late", "Absent"])
         for d in rows:
-            f.write(
-                f"{period_label},{d.get('department','')},{d.get('total_employees',0)},{d.get('present',0)},{d.get('late',0)},{d.get('absent',0)}\n"
-            )
+            writer.writerow([
+                period_label, d.get('department', ''), d.get('total_employees', 0),
+                d.get('present', 0), d.get('late', 0), d.get('absent', 0),
+            ])
 
 
-def build_department_attendance_html(title: str, period_label: str, rows: Iterable[dict]) -> str:
-    """Build a simple HTML table for department attendance.
-    Caller can render this HTML to PDF using export_html_to_pdf.
-    """
-    html = [
-        f"<h2 style=\"text-align:center;\">{title} – {period_label}</h2>",
-        "<br>",
-        "<table border=\"1\" cellspacing=\"0\" cellpadding=\"10\" width=\"100%\">",
-        "<thead>",
-        "<tr style=\"background-color:#f3f4f6;\">",
-        "<th align=\"left\">Department</th>",
-        "<th align=\"center\">Total Employees</th>",
-        "<th align=\"center\">Present</th>",
-        "<th align=\"center\">Late</th>",
-        "<th align=\"center\">Absent</th>",
-        "</tr>",
-        "</thead>",
-        "<tbody>",
-    ]
-    for d in rows:
-        html.append(
-            "<tr>"
-            f"<td>{d.get('department','')}</td>"
-            f"<td align=\"center\">{d.get('total_employees',0)}</td>"
-            f"<td align=\"center\">{d.get('present',0)}</td>"
-            f"<td align=\"center\">{d.get('late',0)}</td>"
-            f"<td align=\"center\">{d.get('absent',0)}</td>"
-            "</tr>"
-        )
-    html.append("</tbody></table>")
-    return "".join(html)
-
-
-def export_html_to_pdf(html: str, path: str) -> None:
-    """Render HTML string to a PDF file using Qt's QTextDocument.
-    Imported lazily so non-Qt environments importing this module won't fail.
-    """
-    from PyQt6.QtGui import QPdfWriter, QPainter, QFont, QTextDocument
-    from PyQt6.QtCore import QSizeF
-    from PyQt6.QtGui import QPageSize, QPageLayout
-
-    writer = QPdfWriter(path)
-    writer.setPageSize(QPageSize(QPageSize.PageSizeId.A4))
-    writer.setPageOrientation(QPageLayout.Orientation.Portrait)
+# Header row of export_attendance_records_csv, matching RAW_ATTENDANCE_COLUMNS
+RAW_ATTENDANCE_HEADERS = [
+    "Record ID", "Employee ID", "Name", "Department", "Date",
+    "Time In", "Time Out", "Status", "Hours Worked",
+]
 
-    doc = QTextDocument()
-    doc.setDefaultFont(QFont("Inter", 10))
-    doc.setHtml(html)
 
-    painter = QPainter(writer)
-    doc.setPageSize(QSizeF(writer.width(), writer.height()))
-    doc.drawContents(painter)
-    painter.end()
+def export_attendance_records_csv(
+    path: str,
+    start_date: date,
+    end_date: date,
+    encoding: str = DEFAULT_CSV_ENCODING,
+    progress: Optional[Callable[[int, int], None]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+) -> dict:
+    """Stream raw attendance punches for start_date..end_date (inclusive) to CSV.
+
+    Rows are fetched chunk by chunk from a server-side cursor and written as they arrive,
+    so memory does not grow with the row count. progress(written, total) is called after
+    every chunk. When is_cancelled() turns true, or the database fails (the error is raised),
+    the partial file is deleted. Returns {'rows': written, 'cancelled': bool}. Safe to run on
+    a worker thread.
+    """
+    from ..database.db_queries import count_attendance_records, iter_attendance_records
+
+    total = count_attendance_records(start_date, end_date)
+    written = 0
+    cancelled = False
+    chunks = iter_attendance_records(start_date, end_date)
+    try:
+        with open(path, "w", encoding=encoding, newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(RAW_ATTENDANCE_HEADERS)
+            if progress is not None:
+                progress(0, total)
+            for chunk in chunks:
+                writer.writerows(chunk)
+                written += len(chunk)
+                if progress is not None:
+                    progress(written, max(total, written))
+                if is_cancelled is not None and is_cancelled():
+                    cancelled = True
+                    break
+    except Exception:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        raise
+    finally:
+        chunks.close()
+    if cancelled:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    return {'rows': written, 'cancelled': cancelled}
 
 
 def export_qtablewidget_to_csv(table, path: str, encoding: str = DEFAULT_CSV_ENCODING) -> None:
@@ -110,46 +119,47 @@ def export_qtablewidget_to_csv(table, path: str, encoding: str = DEFAULT_CSV_ENC
     col_count = table.columnCount()
 
     with open(path, "w", encoding=encoding, newline="") as f:
+        writer = csv.writer(f)
         # headers
         headers = []
         for c in range(col_count):
             hi = table.horizontalHeaderItem(c)
             headers.append(hi.text() if hi else f"Column {c+1}")
-        f.write(",".join(headers) + "\n")
-        # rows
+        writer.writerow(headers)
+        # rows (csv quotes cells containing commas/quotes/newlines)
         for r in range(row_count):
             row = []
             for c in range(col_count):
                 it = table.item(r, c)
-                row.append((it.text() if it else "").replace(",", ";"))
-            f.write(",".join(row) + "\n")
+                row.append(it.text() if it else "")
+            writer.writerow(row)
 
 
-def build_qtablewidget_html(table, title: str, subtitle: Optional[str] = None, summary_text: str = "") -> str:
-    """Build an HTML document from a QTableWidget contents with optional title/subtitle/summary."""
+def snapshot_qtablewidget(table) -> tuple[list[str], list[list[str]]]:
+    """Copy a QTableWidget's headers and cell texts (GUI thread) for rendering elsewhere."""
     from PyQt6.QtWidgets import QTableWidget
 
     assert isinstance(table, QTableWidget)
-    col_count = table.columnCount()
-    row_count = table.rowCount()
-
-    parts = [f"<h2 style=\"text-align:center;\">{title}</h2>"]
-    if subtitle:
-        parts.append(f"<p style=\"text-align:center;\">{subtitle}</p>")
-    parts.append("<br>")
-    parts.append("<table border=\"1\" cellspacing=\"0\" cellpadding=\"10\" width=\"100%\"><thead><tr style=\"background-color:#f3f4f6;\">")
-    for c in range(col_count):
+    headers = []
+    for c in range(table.columnCount()):
         hi = table.horizontalHeaderItem(c)
-        parts.append(f"<th align=\"center\">{hi.text() if hi else f'Column {c+1}'}</th>")
-    parts.append("</tr></thead><tbody>")
-    for r in range(row_count):
-        parts.append("<tr>")
-        for c in range(col_count):
+        headers.append(hi.text() if hi else f"Column {c+1}")
+    rows = []
+    for r in range(table.rowCount()):
+        row = []
+        for c in range(len(headers)):
             it = table.item(r, c)
-            parts.append(f"<td align=\"center\">{(it.text() if it else '')}</td>")
-        parts.append("</tr>")
-    parts.append("</tbody></table>")
-    if summary_text:
-        parts.append(f"<br><p style=\"text-align:center; font-weight:bold;\">{summary_text}</p>")
-    return "".join(parts)
+            row.append(it.text() if it else "")
+        rows.append(row)
+    return headers, rows
+
+
+def department_attendance_table(rows: Iterable[dict]) -> tuple[list[str], list[list], list[str]]:
+    """Headers, cell rows and column alignment of the department attendance report."""
+    headers = ["Department", "Total Employees", "Present", "Late", "Absent"]
+    cells = [
+        [d.get('department', ''), d.get('total_employees', 0), d.get('present', 0), d.get('late', 0), d.get('absent', 0)]
+        for d in rows
+    ]
+    return headers, cells, ["left", "center", "center", "center", "center"]
 
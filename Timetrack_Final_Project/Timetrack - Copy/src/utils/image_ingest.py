@@ -0,0 +1,234 @@
+# src/utils/image_ingest.py
+"""Employee photo ingest: validate, resize, recompress and store by content hash.
+
+Single photos are ingested from the dashboards on a worker thread; whole folders and the
+existing assets are processed in parallel from the command line:
+
+    python -m src.utils.image_ingest import <folder>
+    python -m src.utils.image_ingest normalize [--delete-originals]
+"""
+from __future__ import annotations
+import argparse
+import hashlib
+import io
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Iterable, Optional
+
+from PIL import Image, ImageOps
+
+from ..config import EMPLOYEE_IMAGE_DIR, IMAGE_MAX_DIMENSION, IMAGE_JPEG_QUALITY, IMAGE_INGEST_WORKERS
+
+# Formats accepted from users (MPO = multi-picture JPEG written by many phones)
+ALLOWED_FORMATS = {"JPEG", "MPO", "PNG", "WEBP", "BMP", "GIF"}
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".bmp", ".gif"}
+# Names of already-ingested files: <content hash>.jpg
+_STORED_NAME = re.compile(r"^[0-9a-f]{32}\.jpg$")
+
+
+class ImageIngestError(ValueError):
+    """The file is missing, is not a supported image, or cannot be decoded."""
+
+
+def normalize_image(path: str, max_dimension: int = IMAGE_MAX_DIMENSION,
+                    quality: int = IMAGE_JPEG_QUALITY) -> bytes:
+    """Decode `path`, apply EXIF orientation, fit it in max_dimension and re-encode as JPEG."""
+    if not os.path.isfile(path):
+        raise ImageIngestError(f"File not found: {path}")
+    try:
+        with Image.open(path) as im:
+            if im.format not in ALLOWED_FORMATS:
+                raise ImageIngestError(f"Unsupported image format: {im.format}")
+            im.load()  # full decode: truncated/corrupt files fail here
+            im = ImageOps.exif_transpose(im)
+            if im.mode in ("RGBA", "LA") or (im.mode == "P" and "transparency" in im.info):
+                # JPEG has no alpha: flatten onto white like the avatar frames
+                rgba = im.convert("RGBA")
+                im = Image.new("RGB", rgba.size, (255, 255, 255))
+                im.paste(rgba, mask=rgba.getchannel("A"))
+            else:
+                im = im.convert("RGB")
+            im.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+            out = io.BytesIO()
+            im.save(out, "JPEG", quality=quality, optimize=True, progressive=True)
+            return out.getvalue()
+    except ImageIngestError:
+        raise
+    except (OSError, ValueError, Image.DecompressionBombError) as e:
+        raise ImageIngestError(f"Cannot decode {os.path.basename(path)}: {e}") from e
+
+
+def is_stored(path: str, dest_dir: str = EMPLOYEE_IMAGE_DIR) -> bool:
+    """True for files this pipeline wrote (content-hash names inside dest_dir)."""
+    return (os.path.abspath(os.path.dirname(path)) == os.path.abspath(dest_dir)
+            and bool(_STORED_NAME.match(os.path.basename(path))))
+
+
+def _store(data: bytes, dest_dir: str) -> tuple[str, bool]:
+    """Write data as <sha256>.jpg unless it is already there. Returns (path, created)."""
+    digest = hashlib.sha256(data).hexdigest()[:32]
+    dest = os.path.join(dest_dir, f"{digest}.jpg")
+    if os.path.isfile(dest):
+        return dest, False
+    os.makedirs(dest_dir, exist_ok=True)
+    tmp = f"{dest}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, dest)
+    return dest, True
+
+
+def ingest_image(path: str, dest_dir: str = EMPLOYEE_IMAGE_DIR, max_dimension: int = IMAGE_MAX_DIMENSION,
+                 quality: int = IMAGE_JPEG_QUALITY) -> str:
+    """Normalize one photo into dest_dir and return its stored path (deduplicated by content)."""
+    if is_stored(path, dest_dir):
+        # Already ingested (e.g. an edit that kept the current photo): re-encoding would only lose quality
+        return path
+    return _store(normalize_image(path, max_dimension, quality), dest_dir)[0]
+
+
+def ingest_employee_photo(employee_id: int, path: str, dest_dir: str = EMPLOYEE_IMAGE_DIR) -> str:
+    """Ingest a photo picked in the UI and point the employee at it. Runs on a worker thread."""
+    from ..database.db_queries import set_employee_image_path
+    stored = ingest_image(path, dest_dir)
+    if not set_employee_image_path(employee_id, stored):
+        raise RuntimeError(f"Photo stored as {stored} but employee #{employee_id} was not updated")
+    return stored
+
+
+def _ingest_one(path: str, dest_dir: str, max_dimension: int, quality: int) -> tuple[str, Optional[str], bool, Optional[str]]:
+    # Process-pool entry point: (source, stored path, created, error) - errors as text so they pickle
+    try:
+        stored, created = _store(normalize_image(path, max_dimension, quality), dest_dir)
+        return path, stored, created, None
+    except Exception as e:
+        return path, None, False, str(e)
+
+
+def ingest_many(paths: Iterable[str], dest_dir: str = EMPLOYEE_IMAGE_DIR, workers: int = IMAGE_INGEST_WORKERS,
+                progress: Optional[Callable[[int, int], None]] = None) -> dict:
+    """Ingest photos in parallel worker processes.
+
+    Returns {'stored': {source: stored_path}, 'created': n new files, 'failed': {source: error}}.
+    progress(done, total) is called in this process as results arrive.
+    """
+    paths = list(paths)
+    report = {'stored': {}, 'created': 0, 'failed': {}}
+    if not paths:
+        return report
+    max_workers = workers if workers and workers > 0 else (os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(paths))) as pool:
+        futures = [pool.submit(_ingest_one, p, dest_dir, IMAGE_MAX_DIMENSION, IMAGE_JPEG_QUALITY) for p in paths]
+        for done, future in enumerate(as_completed(futures), 1):
+            source, stored, created, error = future.result()
+            if error is None:
+                report['stored'][source] = stored
+                report['created'] += int(created)
+            else:
+                report['failed'][source] = error
+            if progress is not None:
+                progress(done, len(paths))
+    return report
+
+
+def _employee_id_from_name(path: str) -> Optional[int]:
+    """'1042.jpg' or '#1042.png' -> 1042 (the old assets/employees naming)."""
+    stem = os.path.splitext(os.path.basename(path))[0].lstrip("#")
+    return int(stem) if stem.isdigit() else None
+
+
+def import_folder(folder: str, dest_dir: str = EMPLOYEE_IMAGE_DIR, workers: int = IMAGE_INGEST_WORKERS,
+                  progress: Optional[Callable[[int, int], None]] = None) -> dict:
+    """Bulk-import every image in `folder`; files named after an employee id are assigned to them."""
+    from ..database.db_queries import set_employee_image_paths
+    paths = sorted(
+        os.path.join(folder, name) for name in os.listdir(folder)
+        if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS
+    )
+    report = ingest_many(paths, dest_dir, workers, progress)
+    assignments = []
+    report['unmatched'] = []
+    for source, stored in sorted(report['stored'].items()):
+        emp_id = _employee_id_from_name(source)
+        if emp_id is None:
+            report['unmatched'].append(source)
+        else:
+            assignments.append((emp_id, stored))
+    report['assigned'] = set_employee_image_paths(assignments)
+    return report
+
+
+def normalize_existing_assets(dest_dir: str = EMPLOYEE_IMAGE_DIR, workers: int = IMAGE_INGEST_WORKERS,
+                              delete_originals: bool = False,
+                              progress: Optional[Callable[[int, int], None]] = None) -> dict:
+    """Re-ingest photos stored before this pipeline existed and repoint the employees.
+
+    With delete_originals, source files no employee references any more are removed.
+    """
+    from ..database.db_queries import get_employee_image_paths, set_employee_image_paths
+    rows = get_employee_image_paths()
+    legacy = [r for r in rows if not is_stored(r['image_path'], dest_dir)]
+    missing = sorted({r['image_path'] for r in legacy if not os.path.isfile(r['image_path'])})
+    sources = sorted({r['image_path'] for r in legacy if os.path.isfile(r['image_path'])})
+    report = ingest_many(sources, dest_dir, workers, progress)
+    report['missing'] = missing
+    report['assigned'] = set_employee_image_paths([
+        (r['employee_id'], report['stored'][r['image_path']])
+        for r in legacy if r['image_path'] in report['stored']
+    ])
+    report['deleted'] = []
+    if delete_originals:
+        still_used = {r['image_path'] for r in get_employee_image_paths()}
+        for source in report['stored']:
+            if source not in still_used:
+                try:
+                    os.remove(source)
+                    report['deleted'].append(source)
+                except OSError as e:
+                    print(f"Failed to delete {source}: {e}")
+    return report
+
+
+def _print_progress(done: int, total: int) -> None:
+    print(f"\r  {done}/{total}", end="\n" if done == total else "", flush=True)
+
+
+def _print_report(report: dict) -> None:
+    print(f"Stored {len(report['stored'])} photo(s), {report['created']} new "
+          f"({len(report['stored']) - report['created']} duplicate(s)); "
+          f"{report.get('assigned', 0)} employee(s) updated.")
+    for source, error in sorted(report['failed'].items()):
+        print(f"  failed: {source}: {error}")
+    for source in report.get('unmatched', []):
+        print(f"  not assigned (file name is not an employee id): {source}")
+    for source in report.get('missing', []):
+        print(f"  missing on disk: {source}")
+    for source in report.get('deleted', []):
+        print(f"  deleted original: {source}")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.utils.image_ingest", description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=IMAGE_INGEST_WORKERS, help="processes (0 = one per CPU)")
+    parser.add_argument("--dest", default=EMPLOYEE_IMAGE_DIR, help="asset folder (default: %(default)s)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    imp = commands.add_parser("import", help="import a folder of photos named <employee id>.<ext>")
+    imp.add_argument("folder")
+    norm = commands.add_parser("normalize", help="re-ingest photos stored before the ingest pipeline")
+    norm.add_argument("--delete-originals", action="store_true", help="remove replaced source files")
+    args = parser.parse_args(argv)
+
+    if args.command == "import":
+        if not os.path.isdir(args.folder):
+            parser.error(f"not a folder: {args.folder}")
+        report = import_folder(args.folder, args.dest, args.workers, _print_progress)
+    else:
+        report = normalize_existing_assets(args.dest, args.workers, args.delete_originals, _print_progress)
+    _print_report(report)
+    return 1 if report['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+# src/utils/import_profiler.py
+from __future__ import annotations
+import sys
+import threading
+import time
+from importlib.abc import MetaPathFinder
+from typing import Optional
+
+
+class ImportNode:
+    """One module import: cumulative time includes the imports it triggered (children)."""
+
+    __slots__ = ("name", "cumulative_ms", "children")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.cumulative_ms = 0.0
+        self.children: list[ImportNode] = []
+
+    @property
+    def self_ms(self) -> float:
+        return max(0.0, self.cumulative_ms - sum(c.cumulative_ms for c in self.children))
+
+
+def _time_loader(loader, profiler: "ImportProfiler") -> None:
+    """Time create_module + exec_module of one module's loader.
+
+    The spec keeps its own loader object (importlib.resources, pkgutil.get_data and isinstance
+    checks need it); only its two methods are shadowed by instance attributes, which remove
+    themselves once the module has executed. Class-level loaders (builtin and frozen modules)
+    and loaders without an instance __dict__ are left untimed.
+    """
+    if isinstance(loader, type) or not hasattr(loader, "__dict__") or "exec_module" in vars(loader):
+        return
+    create = getattr(loader, "create_module", None)
+    exec_module = loader.exec_module
+
+    def timed_create(spec):
+        if create is None:
+            return None
+        # Extension modules do their real work here
+        with profiler.timing(spec.name, "create"):
+            return create(spec)
+
+    def timed_exec(module):
+        try:
+            with profiler.timing(module.__spec__.name, "exec"):
+                exec_module(module)
+        finally:
+            loader.__dict__.pop("create_module", None)
+            loader.__dict__.pop("exec_module", None)
+
+    loader.create_module = timed_create
+    loader.exec_module = timed_exec
+
+
+class _Timing:
+    def __init__(self, profiler: "ImportProfiler", name: str, phase: str):
+        self._profiler = profiler
+        self._name = name
+        self._phase = phase
+
+    def __enter__(self):
+        self._node = self._profiler._push(self._name)
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self._profiler._pop(self._node, (time.perf_counter() - self._start) * 1000.0, self._phase)
+        return False
+
+
+class ImportProfiler(MetaPathFinder):
+    """Records a per-module import-time tree, like `python -X importtime` but inspectable in-app.
+
+    install() puts the profiler first on sys.meta_path; it asks the other finders for the spec
+    and times module creation/execution on the spec's own loader. Imports made by a module while it
+    executes become its children. report() renders the tree with cumulative and self times.
+    """
+
+    def __init__(self):
+        self.roots: list[ImportNode] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._finding = threading.local()
+
+    def install(self) -> "ImportProfiler":
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+        return self
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    # --- MetaPathFinder ---
+
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(self._finding, "active", False):
+            return None
+        self._finding.active = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._finding.active = False
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            _time_loader(spec.loader, self)
+        return spec
+
+    # --- Timing ---
+
+    def timing(self, name: str, phase: str) -> _Timing:
+        return _Timing(self, name, phase)
+
+    def _stack(self) -> list[ImportNode]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+            # Nodes whose create_module ran and whose exec_module is still to come
+            self._local.created = {}
+        return stack
+
+    def _push(self, name: str) -> ImportNode:
+        stack = self._stack()
+        node = self._local.created.pop(name, None)
+        if node is None:
+            node = ImportNode(name)
+            if stack:
+                stack[-1].children.append(node)
+            else:
+                with self._lock:
+                    self.roots.append(node)
+        stack.append(node)
+        return node
+
+    def _pop(self, node: ImportNode, elapsed_ms: float, phase: str) -> None:
+        stack = self._stack()
+        if stack and stack[-1] is node:
+            stack.pop()
+        node.cumulative_ms += elapsed_ms
+        if phase == "create":
+            self._local.created[node.name] = node
+
+    # --- Reporting ---
+
+    def mark(self) -> int:
+        """Position in `roots`; pass to report(since=...) to only show later imports."""
+        return len(self.roots)
+
+    def total_ms(self, since: int = 0) -> float:
+        return sum(n.cumulative_ms for n in self.roots[since:])
+
+    def report(self, since: int = 0, min_ms: float = 1.0, max_depth: int = 6, title: str = "Import times") -> str:
+        """Indented tree of imports taking at least `min_ms` (cumulative); smaller ones are summed up."""
+        roots = self.roots[since:]
+        lines = [f"{title}: {len(roots)} top-level imports, {self.total_ms(since):.1f} ms total",
+                 f"{'cumulative':>10} {'self':>8}  module"]
+        self._render(roots, 0, min_ms, max_depth, lines)
+        lines.append(self._top_self_times(roots))
+        return "\n".join(lines)
+
+    def _render(self, nodes: list[ImportNode], depth: int, min_ms: float, max_depth: int, lines: list[str]) -> None:
+        hidden_count, hidden_ms = 0, 0.0
+        for node in sorted(nodes, key=lambda n: n.cumulative_ms, reverse=True):
+            if node.cumulative_ms < min_ms or depth >= max_depth:
+                hidden_count += 1
+                hidden_ms += node.cumulative_ms
+                continue
+            lines.append(f"{node.cumulative_ms:10.1f} {node.self_ms:8.1f}  {'  ' * depth}{node.name}")
+            self._render(node.children, depth + 1, min_ms, max_depth, lines)
+        if hidden_count:
+            lines.append(f"{hidden_ms:10.1f} {'':8}  {'  ' * depth}... {hidden_count} more")
+
+    def _top_self_times(self, roots: list[ImportNode], limit: int = 10) -> str:
+        flat: list[ImportNode] = []
+        pending = list(roots)
+        while pending:
+            node = pending.pop()
+            flat.append(node)
+            pending.extend(node.children)
+        top = sorted(flat, key=lambda n: n.self_ms, reverse=True)[:limit]
+        return "Slowest modules (self time): " + ", ".join(f"{n.name} {n.self_ms:.1f} ms" for n in top)
+
+
+_profiler: Optional[ImportProfiler] = None
+
+
+def start_import_profiler() -> ImportProfiler:
+    """Install the app-wide profiler (idempotent)."""
+    global _profiler
+    if _profiler is None:
+        _profiler = ImportProfiler().install()
+    return _profiler
+
+
+def get_import_profiler() -> Optional[ImportProfiler]:
+    return _profiler
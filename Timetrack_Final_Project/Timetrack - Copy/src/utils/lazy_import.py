@@ -0,0 +1,68 @@
+# src/utils/lazy_import.py
+from __future__ import annotations
+import importlib
+from typing import Any, Optional
+
+
+class LazyModule:
+    """Module proxy that imports the real module on first attribute access.
+
+    Use for modules only needed by some tabs/dialogs/exports:
+        export_helpers = lazy_module("..utils.export_helpers", __package__)
+        export_helpers.export_qtablewidget_to_csv(...)   # imported here, on first use
+    """
+
+    def __init__(self, name: str, package: Optional[str] = None):
+        self._lazy_name = name
+        self._lazy_package = package
+        self._lazy_module = None
+
+    def _load(self):
+        if self._lazy_module is None:
+            self._lazy_module = importlib.import_module(self._lazy_name, self._lazy_package)
+        return self._lazy_module
+
+    def __getattr__(self, attr: str) -> Any:
+        # Only called for attributes not set in __init__
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._lazy_module is not None else "not loaded"
+        return f"<lazy module {self._lazy_name!r} ({state})>"
+
+
+class LazyCallable:
+    """Stand-in for a class or function of a lazily imported module.
+
+    Calling it imports the module and forwards the call, so call sites stay unchanged:
+        AddEmployeeModal = lazy_callable(".add_employee_modal", "AddEmployeeModal", __package__)
+        dlg = AddEmployeeModal(self)
+    Not usable for isinstance() checks or subclassing; import the module directly for those.
+    """
+
+    def __init__(self, module: LazyModule, attr: str):
+        self._module = module
+        self._attr = attr
+        self._target = None
+
+    def resolve(self) -> Any:
+        if self._target is None:
+            self._target = getattr(self._module, self._attr)
+        return self._target
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.resolve(), attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy {self._module._lazy_name}.{self._attr}>"
+
+
+def lazy_module(name: str, package: Optional[str] = None) -> LazyModule:
+    return LazyModule(name, package)
+
+
+def lazy_callable(module_name: str, attr: str, package: Optional[str] = None) -> LazyCallable:
+    return LazyCallable(LazyModule(module_name, package), attr)
@@ -0,0 +1,358 @@
+# src/utils/metrics.py
+"""In-process metrics (counters, gauges, histograms) exported in Prometheus text format.
+
+Off unless Timetrack_METRICS=1: start_metrics() then hooks the database query observers
+(statement latency per database function, connections, punches), the refresh scheduler
+(refresh duration per view/job), the thumbnail caches (hit ratios) and a cached table row
+count, and serves everything on http://127.0.0.1:<METRICS_PORT>/metrics. The dashboards
+show db_latency_ms() in their header while it runs.
+"""
+from __future__ import annotations
+import sys
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+from ..config import METRICS_PORT, METRICS_ROW_COUNT_TTL_S
+
+DB_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+REFRESH_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Weight of the newest statement in the moving average behind db_latency_ms()
+_LATENCY_SMOOTHING = 0.2
+
+_DB_PACKAGE = __name__.rsplit(".", 2)[0] + ".database"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labels)
+        self._lock = threading.Lock()
+        self._values: dict[tuple, object] = {}
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._samples(key, value))
+        return lines
+
+    def _samples(self, key: tuple, value) -> list[str]:
+        return [f"{self.name}{_labels(self.labelnames, key)} {_format_value(value)}"]
+
+
+class Counter(_Metric):
+    """Monotonic total; inc() for events, set_total() to mirror a count kept elsewhere."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set_total(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = float(value)
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = float(value)
+
+    def value(self, **labels) -> Optional[float]:
+        with self._lock:
+            return self._values.get(self._key(labels))
+
+
+class Histogram(_Metric):
+    """Cumulative buckets plus _sum and _count, like the Prometheus client histogram."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = (),
+                 buckets: Iterable[float] = DB_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    def _samples(self, key: tuple, value) -> list[str]:
+        counts, total, count = value
+        lines, running = [], 0
+        for bound, n in zip(self.buckets, counts):
+            running += n
+            le = f'le="{_format_value(bound)}"'
+            lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {running}")
+        lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_format_value(total)}")
+        lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metrics plus collectors (callables run before each render to refresh gauges)."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(f"{metric.name} is already registered as a {existing.kind}")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help_text: str, labels: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labels))
+
+    def gauge(self, name: str, help_text: str, labels: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help_text, labels))
+
+    def histogram(self, name: str, help_text: str, labels: Iterable[str] = (),
+                  buckets: Iterable[float] = DB_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, labels, buckets))
+
+    def add_collector(self, fn: Callable[[], None]) -> None:
+        self._collectors.append(fn)
+
+    def render(self) -> str:
+        for fn in list(self._collectors):
+            try:
+                fn()
+            except Exception as e:
+                print(f"Metrics collector failed: {e}")
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+db_query_seconds = REGISTRY.histogram(
+    "timetrack_db_query_seconds", "SQL statement latency by calling database function.", ("function",))
+db_connect_seconds = REGISTRY.histogram(
+    "timetrack_db_connect_seconds", "Time to open a database connection.")
+db_connections = REGISTRY.counter(
+    "timetrack_db_connections_total", "Database connections opened, by result.", ("result",))
+db_latency_gauge = REGISTRY.gauge(
+    "timetrack_db_latency_recent_seconds", "Moving average of recent SQL statement latency.")
+refresh_seconds = REGISTRY.histogram(
+    "timetrack_refresh_seconds", "Duration of scheduled view refreshes.", ("view", "job"), REFRESH_BUCKETS)
+punches = REGISTRY.counter(
+    "timetrack_punches_total", "Attendance punches written by the kiosk.", ("kind",))
+table_rows = REGISTRY.gauge(
+    "timetrack_table_rows", "Rows per table (refreshed at most once per METRICS_ROW_COUNT_TTL_S).", ("table",))
+cache_lookups = REGISTRY.counter(
+    "timetrack_cache_lookups_total", "Thumbnail cache lookups by layer and result.", ("cache", "result"))
+cache_hit_ratio = REGISTRY.gauge(
+    "timetrack_cache_hit_ratio", "Thumbnail cache hits / lookups by layer.", ("cache",))
+
+# Statements that record a punch, by the database function that sends them
+_PUNCH_STATEMENTS = {"employee_check_in": ("INSERT", "check_in"), "employee_check_out": ("UPDATE", "check_out")}
+
+_state_lock = threading.Lock()
+_recent_latency: Optional[float] = None
+_db_online: Optional[bool] = None
+_exporter: Optional["MetricsExporter"] = None
+_row_counts_at = 0.0
+
+
+def _db_function() -> str:
+    """Name of the innermost function in the database package (other than db_config) on the stack."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith(_DB_PACKAGE) and not module.endswith(".db_config"):
+            return frame.f_code.co_name
+        frame = frame.f_back
+    return "other"
+
+
+def _on_query(kind: str, statement, seconds: float) -> None:
+    global _recent_latency, _db_online
+    if kind == "query":
+        function = _db_function()
+        db_query_seconds.observe(seconds, function=function)
+        punch = _PUNCH_STATEMENTS.get(function)
+        if punch and str(statement).lstrip().upper().startswith(punch[0]):
+            punches.inc(kind=punch[1])
+        with _state_lock:
+            _recent_latency = seconds if _recent_latency is None else (
+                _recent_latency + _LATENCY_SMOOTHING * (seconds - _recent_latency))
+            db_latency_gauge.set(_recent_latency)
+    elif kind == "connect":
+        db_connections.inc(result="ok")
+        db_connect_seconds.observe(seconds)
+        _db_online = True
+    elif kind == "connect_error":
+        db_connections.inc(result="error")
+        _db_online = False
+
+
+def _on_refresh(job) -> None:
+    try:
+        view = type(job.owner).__name__
+    except RuntimeError:
+        view = "deleted"
+    refresh_seconds.observe(job.last_duration_ms / 1000.0, view=view, job=job.name)
+
+
+def _collect_cache_stats() -> None:
+    from .thumbnails import CACHE_STATS
+    stats = dict(CACHE_STATS)
+    for layer in ("memory", "disk"):
+        hits, misses = stats.get(f"{layer}_hit", 0), stats.get(f"{layer}_miss", 0)
+        cache_lookups.set_total(hits, cache=f"thumbnail_{layer}", result="hit")
+        cache_lookups.set_total(misses, cache=f"thumbnail_{layer}", result="miss")
+        if hits + misses:
+            cache_hit_ratio.set(hits / (hits + misses), cache=f"thumbnail_{layer}")
+
+
+def _collect_row_counts() -> None:
+    global _row_counts_at
+    now = time.monotonic()
+    if _row_counts_at and now - _row_counts_at < METRICS_ROW_COUNT_TTL_S:
+        return
+    _row_counts_at = now
+    from ..database.db_queries import get_table_row_counts
+    for table, count in get_table_row_counts().items():
+        table_rows.set(count, table=table)
+
+
+REGISTRY.add_collector(_collect_cache_stats)
+REGISTRY.add_collector(_collect_row_counts)
+
+
+def db_latency_ms() -> Optional[float]:
+    """Recent statement latency in ms (moving average), or None before the first query."""
+    with _state_lock:
+        return None if _recent_latency is None else _recent_latency * 1000.0
+
+
+def db_online() -> Optional[bool]:
+    """False when the last connection attempt failed, None before the first one."""
+    return _db_online
+
+
+def is_enabled() -> bool:
+    return _exporter is not None
+
+
+class MetricsExporter:
+    """Serves REGISTRY.render() at /metrics on localhost from a daemon thread."""
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY, port: int = METRICS_PORT, host: str = "127.0.0.1"):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), _Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://{host}:{self.server.server_address[1]}/metrics"
+        self._thread = threading.Thread(target=self.server.serve_forever, name="metrics-exporter", daemon=True)
+
+    def start(self) -> "MetricsExporter":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def start_metrics(port: int = METRICS_PORT) -> Optional[MetricsExporter]:
+    """Install the app hooks and start the exporter (idempotent). None if the port is taken."""
+    global _exporter
+    if _exporter is not None:
+        return _exporter
+    from ..database.db_config import add_query_observer
+    from .refresh_scheduler import add_job_observer
+
+    try:
+        exporter = MetricsExporter(port=port).start()
+    except OSError as e:
+        print(f"Metrics exporter not started on port {port}: {e}")
+        return None
+    add_query_observer(_on_query)
+    add_job_observer(_on_refresh)
+    _exporter = exporter
+    print(f"Metrics: {exporter.url}")
+    return exporter
+
+
+def stop_metrics() -> None:
+    global _exporter
+    if _exporter is None:
+        return
+    from ..database.db_config import remove_query_observer
+    from .refresh_scheduler import remove_job_observer
+
+    remove_query_observer(_on_query)
+    remove_job_observer(_on_refresh)
+    _exporter.stop()
+    _exporter = None
@@ -0,0 +1,205 @@
+# src/utils/pdf_report.py
+"""Paginated table PDFs drawn row by row with QPainter.
+
+Unlike an HTML table in a QTextDocument (built and painted in one go), rows are laid out
+page by page as they are consumed: the header row repeats on every page, each page gets a page number,
+and only the current page is held in memory. Works on a worker thread; pass plain data
+(see export_helpers.snapshot_qtablewidget / department_attendance_table), not widgets.
+"""
+from __future__ import annotations
+import math
+import os
+from typing import Callable, Iterable, Optional, Sequence
+
+from PyQt6.QtCore import Qt, QMarginsF, QRectF
+from PyQt6.QtGui import QPdfWriter, QPainter, QFont, QFontMetricsF, QColor, QPen, QPageSize, QPageLayout
+
+# Layout (points at PDF_RESOLUTION dpi)
+PDF_RESOLUTION = 144
+MARGIN_MM = 15
+BODY_FONT_PT = 9
+TITLE_FONT_PT = 15
+HEADER_BG = "#f3f4f6"
+STRIPE_BG = "#fafafa"
+GRID_COLOR = "#d1d5db"
+# Rows measured to size the columns (the rest are elided to fit)
+SAMPLE_ROWS = 200
+
+
+def _column_widths(headers: Sequence[str], sample: list[Sequence], metrics: QFontMetricsF,
+                   bold: QFontMetricsF, available: float, padding: float) -> list[float]:
+    """Share `available` in proportion to each column's widest sampled cell."""
+    wants = [bold.horizontalAdvance(str(h)) + 2 * padding for h in headers]
+    for row in sample:
+        for c, value in enumerate(row[:len(headers)]):
+            wants[c] = max(wants[c], metrics.horizontalAdvance(_text(value)) + 2 * padding)
+    total = sum(wants) or 1.0
+    if total <= available:
+        # Spread the slack evenly so the table spans the page like the HTML version
+        extra = (available - total) / len(wants)
+        return [w + extra for w in wants]
+    return [available * w / total for w in wants]
+
+
+def _text(value) -> str:
+    return "" if value is None else str(value)
+
+
+def render_table_pdf(path: str, title: str, headers: Sequence[str], rows: Iterable[Sequence],
+                     subtitle: Optional[str] = None, summary_text: str = "",
+                     align: Optional[Sequence[str]] = None,
+                     progress: Optional[Callable[[int, int], None]] = None,
+                     is_cancelled: Optional[Callable[[], bool]] = None) -> dict:
+    """Write `rows` as a paginated A4 table to `path`.
+
+    align: per column 'left' / 'center' / 'right' (default center, like the HTML exports).
+    progress(done, total) is called once per page (total is 0 when rows has no len()).
+    When is_cancelled() turns true the partial file is deleted.
+    Returns {'pages': n, 'rows': n, 'cancelled': bool}.
+    """
+    headers = [str(h) for h in headers]
+    total_rows = len(rows) if hasattr(rows, '__len__') else None
+    row_iter = iter(rows)
+
+    writer = QPdfWriter(path)
+    writer.setResolution(PDF_RESOLUTION)
+    writer.setPageSize(QPageSize(QPageSize.PageSizeId.A4))
+    writer.setPageOrientation(QPageLayout.Orientation.Portrait)
+    writer.setPageMargins(QMarginsF(MARGIN_MM, MARGIN_MM, MARGIN_MM, MARGIN_MM), QPageLayout.Unit.Millimeter)
+    writer.setTitle(title)
+
+    painter = QPainter(writer)
+    try:
+        page = QRectF(0, 0, writer.width(), writer.height())
+        body_font = QFont("Inter", BODY_FONT_PT)
+        bold_font = QFont("Inter", BODY_FONT_PT, QFont.Weight.Bold)
+        title_font = QFont("Inter", TITLE_FONT_PT, QFont.Weight.Bold)
+        metrics = QFontMetricsF(body_font, writer)
+        bold_metrics = QFontMetricsF(bold_font, writer)
+        title_metrics = QFontMetricsF(title_font, writer)
+
+        padding = metrics.averageCharWidth()
+        row_h = metrics.height() * 1.9
+        footer_h = metrics.height() * 2
+        title_h = title_metrics.height() * 1.6 + (metrics.height() * 1.6 if subtitle else 0)
+
+        # Measure a sample to size the columns, then keep streaming after it
+        sample = []
+        for row in row_iter:
+            sample.append(row)
+            if len(sample) >= SAMPLE_ROWS:
+                break
+        widths = _column_widths(headers, sample, metrics, bold_metrics, page.width(), padding)
+        xs = [page.left()]
+        for w in widths:
+            xs.append(xs[-1] + w)
+        flags = {'left': Qt.AlignmentFlag.AlignLeft, 'right': Qt.AlignmentFlag.AlignRight}
+        names = list(align or [])
+        col_align = [flags.get(names[c] if c < len(names) else 'center', Qt.AlignmentFlag.AlignHCenter)
+                     for c in range(len(headers))]
+
+        first_rows = max(1, int((page.height() - title_h - footer_h) // row_h) - 1)
+        other_rows = max(1, int((page.height() - footer_h) // row_h) - 1)
+        total_pages = 0
+        if total_rows is not None:
+            # The summary line takes one row slot after the last row
+            slots = total_rows + (1 if summary_text else 0)
+            total_pages = 1 + math.ceil(max(0, slots - first_rows) / other_rows)
+
+        grid_pen = QPen(QColor(GRID_COLOR))
+        grid_pen.setWidthF(1.0)
+
+        def draw_cells(y: float, values: Sequence, font: QFont, fm: QFontMetricsF):
+            painter.setFont(font)
+            painter.setPen(QColor("#111827"))
+            for c, w in enumerate(widths):
+                text = _text(values[c]) if c < len(values) else ""
+                rect = QRectF(xs[c] + padding, y, w - 2 * padding, row_h)
+                text = fm.elidedText(text, Qt.TextElideMode.ElideRight, rect.width())
+                painter.drawText(rect, col_align[c] | Qt.AlignmentFlag.AlignVCenter, text)
+            painter.setPen(grid_pen)
+            painter.drawLine(int(xs[0]), int(y + row_h), int(xs[-1]), int(y + row_h))
+
+        def draw_header(y: float) -> float:
+            painter.fillRect(QRectF(xs[0], y, xs[-1] - xs[0], row_h), QColor(HEADER_BG))
+            painter.setPen(grid_pen)
+            painter.drawLine(int(xs[0]), int(y), int(xs[-1]), int(y))
+            draw_cells(y, headers, bold_font, bold_metrics)
+            return y + row_h
+
+        def finish_page(page_no: int, table_top: float, y: float):
+            # Vertical grid lines for the table part of this page, then the page number
+            painter.setPen(grid_pen)
+            for x in xs:
+                painter.drawLine(int(x), int(table_top), int(x), int(y))
+            painter.setFont(body_font)
+            painter.setPen(QColor("#6b7280"))
+            label = f"Page {page_no} of {total_pages}" if total_pages else f"Page {page_no}"
+            painter.drawText(QRectF(page.left(), page.bottom() - footer_h, page.width(), footer_h),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignBottom, label)
+
+        # Title block (first page only)
+        y = page.top()
+        painter.setFont(title_font)
+        painter.setPen(QColor("#111827"))
+        painter.drawText(QRectF(page.left(), y, page.width(), title_metrics.height() * 1.6),
+                         Qt.AlignmentFlag.AlignCenter, title)
+        y += title_metrics.height() * 1.6
+        if subtitle:
+            painter.setFont(body_font)
+            painter.drawText(QRectF(page.left(), y, page.width(), metrics.height() * 1.6),
+                             Qt.AlignmentFlag.AlignCenter, subtitle)
+            y += metrics.height() * 1.6
+
+        page_no = 1
+        written = 0
+        cancelled = False
+        bottom = page.bottom() - footer_h
+        table_top = y
+        y = draw_header(y)
+
+        def all_rows():
+            yield from sample
+            yield from row_iter
+
+        for row in all_rows():
+            if y + row_h > bottom:
+                finish_page(page_no, table_top, y)
+                if progress is not None:
+                    progress(written, total_rows or 0)
+                if is_cancelled is not None and is_cancelled():
+                    cancelled = True
+                    break
+                writer.newPage()
+                page_no += 1
+                table_top = page.top()
+                y = draw_header(table_top)
+            if written % 2:
+                painter.fillRect(QRectF(xs[0], y, xs[-1] - xs[0], row_h), QColor(STRIPE_BG))
+            draw_cells(y, row, body_font, metrics)
+            y += row_h
+            written += 1
+
+        if not cancelled:
+            table_bottom = y
+            if summary_text:
+                if y + row_h > bottom:
+                    finish_page(page_no, table_top, table_bottom)
+                    writer.newPage()
+                    page_no += 1
+                    y = table_top = table_bottom = page.top()
+                painter.setFont(bold_font)
+                painter.setPen(QColor("#111827"))
+                painter.drawText(QRectF(page.left(), y, page.width(), row_h),
+                                 Qt.AlignmentFlag.AlignCenter, summary_text)
+            finish_page(page_no, table_top, table_bottom)
+            if progress is not None:
+                progress(written, total_rows or 0)
+    finally:
+        painter.end()
+    if cancelled:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    return {'pages': page_no, 'rows': written, 'cancelled': cancelled}
@@ -0,0 +1,296 @@
+# src/utils/refresh_scheduler.py
+from __future__ import annotations
+import time
+from typing import Callable, Optional
+
+from PyQt6.QtCore import QObject, QTimer, QEvent
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from . import tracing
+from ..config import (
+    SCHEDULER_COALESCE_MS,
+    SCHEDULER_TICK_BUDGET,
+    SCHEDULER_IDLE_AFTER_MS,
+    SCHEDULER_IDLE_BACKOFF,
+)
+
+
+PRIORITY_LOW = 0
+PRIORITY_NORMAL = 1
+PRIORITY_HIGH = 2
+
+# Events that count as user activity (reset the idle back-off)
+_INPUT_EVENTS = frozenset({
+    QEvent.Type.MouseButtonPress,
+    QEvent.Type.MouseMove,
+    QEvent.Type.KeyPress,
+    QEvent.Type.Wheel,
+})
+# Events after which a hidden/minimized window may have become visible again
+_VISIBILITY_EVENTS = frozenset({
+    QEvent.Type.Show,
+    QEvent.Type.WindowStateChange,
+})
+
+
+# Callbacks fn(job) after every finished run (job.last_duration_ms is set); used by diagnostics
+_job_observers: list[Callable[["RefreshJob"], None]] = []
+
+
+def add_job_observer(fn: Callable[["RefreshJob"], None]) -> None:
+    _job_observers.append(fn)
+
+
+def remove_job_observer(fn: Callable[["RefreshJob"], None]) -> None:
+    try:
+        _job_observers.remove(fn)
+    except ValueError:
+        pass
+
+
+def _now_ms() -> float:
+    return time.monotonic() * 1000.0
+
+
+class RefreshJob:
+    """A periodic refresh registered with the RefreshScheduler (see add_job)."""
+
+    def __init__(self, scheduler: "RefreshScheduler", name: str, callback: Callable[[], object],
+                 interval_ms: int, owner: QWidget, priority: int, cost: int,
+                 active: Optional[Callable[[], bool]], idle_backoff: bool, async_done: bool):
+        self.name = name
+        self.callback = callback
+        self.interval_ms = int(interval_ms)
+        self.owner = owner
+        self.priority = priority
+        self.cost = max(0, int(cost))
+        self.active = active
+        self.idle_backoff = idle_backoff
+        self.async_done = async_done
+        self.in_flight = False
+        self.pending = False
+        self.deferred = False
+        self.next_due = _now_ms() + self.interval_ms
+        # How early the job may run to share a tick with other due jobs
+        self.slack_ms = min(SCHEDULER_COALESCE_MS, self.interval_ms // 10)
+        self.last_run: Optional[float] = None
+        self.last_duration_ms = 0.0
+        self._scheduler = scheduler
+
+    def trigger(self) -> None:
+        """Run as soon as possible (coalesced with other due jobs); queued if a run is in flight."""
+        if self.in_flight:
+            self.pending = True
+            return
+        self.next_due = _now_ms()
+        self._scheduler._schedule_soon()
+
+    def complete(self) -> None:
+        """Mark an async_done job's background run as finished."""
+        self._scheduler._finish(self)
+
+    def owner_visible(self) -> bool:
+        window = self.owner.window()
+        return window.isVisible() and not window.isMinimized()
+
+
+class RefreshScheduler(QObject):
+    """Single timer driving every periodic view refresh in the app.
+
+    Views register jobs with add_job() instead of owning QTimers. On each tick the due jobs
+    (plus those due within their slack, at most SCHEDULER_COALESCE_MS) run in priority order until the tick's cost
+    budget is spent; the rest run first on the next event-loop pass. Jobs are suspended while their owner window
+    is hidden or minimized, or while `active()` returns False, and their interval is multiplied
+    by SCHEDULER_IDLE_BACKOFF after SCHEDULER_IDLE_AFTER_MS without user input.
+    A job is never started again while its previous run is still in flight.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._jobs: list[RefreshJob] = []
+        self._last_input = _now_ms()
+        self._idle = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._tick)
+        # Windows of job owners -> whether their QWindow is filtered too (see _watch_window)
+        self._windows: dict[QWidget, bool] = {}
+
+    # --- Registration ---
+
+    def add_job(self, name: str, callback: Callable[[], object], interval_ms: int, owner: QWidget,
+                priority: int = PRIORITY_NORMAL, cost: int = 1,
+                active: Optional[Callable[[], bool]] = None, idle_backoff: bool = True,
+                async_done: bool = False) -> RefreshJob:
+        """Register `callback` to run every `interval_ms` while `owner`'s window is shown.
+
+        cost is in arbitrary units compared against SCHEDULER_TICK_BUDGET. With async_done=True the
+        job stays in flight after the callback returns until job.complete() is called.
+        The job is dropped automatically when `owner` is destroyed.
+        """
+        job = RefreshJob(self, name, callback, interval_ms, owner, priority, cost,
+                         active, idle_backoff, async_done)
+        self._jobs.append(job)
+        owner.destroyed.connect(lambda *_args, j=job: self.remove_job(j))
+        self._watch_window(owner)
+        self._schedule_next()
+        return job
+
+    def remove_job(self, job: RefreshJob) -> None:
+        if job in self._jobs:
+            self._jobs.remove(job)
+        self._schedule_next()
+
+    def remove_owner(self, owner: QWidget) -> None:
+        """Drop every job registered by `owner` or its child widgets (e.g. when its window is closed for good)."""
+        self._jobs = [j for j in self._jobs if not self._owned_by(j, owner)]
+        self._schedule_next()
+
+    @staticmethod
+    def _owned_by(job: RefreshJob, owner: QWidget) -> bool:
+        try:
+            return job.owner is owner or owner.isAncestorOf(job.owner)
+        except RuntimeError:
+            return True
+
+    def jobs(self) -> list[RefreshJob]:
+        return list(self._jobs)
+
+    # --- Scheduling ---
+
+    def _interval(self, job: RefreshJob) -> float:
+        if self._idle and job.idle_backoff:
+            return job.interval_ms * SCHEDULER_IDLE_BACKOFF
+        return job.interval_ms
+
+    def _runnable(self, job: RefreshJob) -> bool:
+        if job.in_flight:
+            return False
+        try:
+            # Owners created before being put in a layout get their real window later
+            self._watch_window(job.owner)
+            if not job.owner_visible():
+                return False
+            return job.active() if job.active is not None else True
+        except RuntimeError:
+            # Owner's C++ object already deleted
+            return False
+
+    def _schedule_soon(self) -> None:
+        self._timer.start(0)
+
+    def _schedule_next(self) -> None:
+        waiting = [j.next_due for j in self._jobs if not j.in_flight]
+        if not waiting:
+            self._timer.stop()
+            return
+        delay = max(0, int(min(waiting) - _now_ms()))
+        self._timer.start(delay)
+
+    def _tick(self) -> None:
+        now = _now_ms()
+        self._idle = now - self._last_input >= SCHEDULER_IDLE_AFTER_MS
+
+        due = []
+        for job in list(self._jobs):
+            if job.in_flight or job.next_due - job.slack_ms > now:
+                continue
+            if self._runnable(job):
+                due.append(job)
+            else:
+                # Suspended: look again after one interval (or sooner if the window is shown)
+                job.next_due = now + self._interval(job)
+        # Jobs deferred by the previous tick go first so low priorities cannot starve
+        due.sort(key=lambda j: (j.deferred, j.priority), reverse=True)
+
+        spent = 0
+        for job in due:
+            # Always run at least one job; the rest wait for the next tick once the budget is used
+            if spent and spent + job.cost > SCHEDULER_TICK_BUDGET:
+                job.deferred = True
+                job.next_due = now
+                continue
+            spent += job.cost
+            job.deferred = False
+            self._run(job)
+        self._schedule_next()
+
+    def _run(self, job: RefreshJob) -> None:
+        job.in_flight = True
+        job.pending = False
+        job.last_run = _now_ms()
+        try:
+            with tracing.span(f"refresh {job.name}", "refresh"):
+                job.callback()
+        except Exception as e:
+            print(f"Refresh job '{job.name}' failed: {e}")
+            self._finish(job)
+            return
+        if not job.async_done:
+            self._finish(job)
+
+    def _finish(self, job: RefreshJob) -> None:
+        if not job.in_flight:
+            return
+        job.in_flight = False
+        now = _now_ms()
+        if job.last_run is not None:
+            job.last_duration_ms = now - job.last_run
+            for fn in list(_job_observers):
+                try:
+                    fn(job)
+                except Exception as e:
+                    print(f"Refresh job observer failed: {e}")
+        job.next_due = now if job.pending else now + self._interval(job)
+        job.pending = False
+        self._schedule_next()
+
+    def _wake(self) -> None:
+        """Pull suspended or backed-off jobs back to their normal cadence."""
+        now = _now_ms()
+        for job in self._jobs:
+            if job.in_flight:
+                continue
+            base = (job.last_run if job.last_run is not None else now) + job.interval_ms
+            job.next_due = min(job.next_due, max(now, base))
+        self._schedule_next()
+
+    def _watch_window(self, widget: QWidget) -> None:
+        """Filter the events of the window showing `widget` instead of every event in the app.
+
+        The window widget reports visibility changes; input for any of its children passes
+        through its QWindow (created when first shown) before being dispatched to them.
+        """
+        window = widget.window()
+        if window not in self._windows:
+            self._windows[window] = False
+            window.installEventFilter(self)
+            window.destroyed.connect(lambda *_args, w=window: self._windows.pop(w, None))
+        if not self._windows[window]:
+            handle = window.windowHandle()
+            if handle is not None:
+                handle.installEventFilter(self)
+                self._windows[window] = True
+
+    def eventFilter(self, obj, event) -> bool:
+        etype = event.type()
+        if etype in _INPUT_EVENTS:
+            self._last_input = _now_ms()
+            if self._idle:
+                self._idle = False
+                self._wake()
+        elif etype in _VISIBILITY_EVENTS and isinstance(obj, QWidget) and obj.isWindow():
+            self._watch_window(obj)
+            self._wake()
+        return False
+
+
+_scheduler: Optional[RefreshScheduler] = None
+
+
+def get_refresh_scheduler() -> RefreshScheduler:
+    """Return the app-wide scheduler (created on first use; needs a QApplication)."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = RefreshScheduler(QApplication.instance())
+    return _scheduler
@@ -0,0 +1,157 @@
+# src/utils/slot_profiler.py
+"""Per-interaction profiling: one cProfile file per slow event handled on the GUI thread.
+
+Every Qt slot runs inside QApplication.notify: clicks and key presses (sidebar switches,
+exports, searches), timer ticks (refresh jobs) and queued signals from workers. With
+Timetrack_PROFILE_SLOTS=1 the app uses ProfilingApplication, which profiles each top-level
+notify and keeps the ones slower than SLOT_PROFILE_THRESHOLD_MS as
+<SLOT_PROFILE_DIR>/<time>_<slot>_<ms>ms.prof, where <slot> is the app function that took
+the most time (or the event and receiver when no app code ran). Open them with snakeviz or
+`python -m pstats`, or list them with:
+
+    python -m src.utils.slot_profiler [folder] [--top 20]
+"""
+from __future__ import annotations
+import argparse
+import cProfile
+import os
+import pstats
+import re
+import sys
+import time
+from datetime import datetime
+from typing import Optional
+
+from PyQt6.QtCore import QEvent
+from PyQt6.QtWidgets import QApplication
+
+from ..config import SLOT_PROFILE_DIR, SLOT_PROFILE_THRESHOLD_MS
+
+_THIS_FILE = os.path.abspath(__file__)
+_SRC_DIR = os.path.dirname(os.path.dirname(_THIS_FILE))
+# Events that only a (possibly nested) event loop delivers; seeing one while an interaction is
+# being profiled means a modal dialog or processEvents() is running inside it
+_LOOP_EVENTS = {QEvent.Type.Timer, QEvent.Type.MetaCall, QEvent.Type.SockAct}
+
+
+def _is_app_code(filename: str) -> bool:
+    path = os.path.abspath(filename)
+    return path.startswith(_SRC_DIR) and path != _THIS_FILE
+
+
+def slot_name(profile: cProfile.Profile) -> Optional[str]:
+    """module.function of the app code (under src/) with the highest cumulative time, if any ran."""
+    best, best_ct = None, -1.0
+    for (filename, _line, func), (_cc, _nc, _tt, ct, _callers) in pstats.Stats(profile).stats.items():
+        if ct > best_ct and _is_app_code(filename) and not func.startswith("<"):
+            best, best_ct = f"{os.path.splitext(os.path.basename(filename))[0]}.{func}", ct
+    return best
+
+
+def _safe(text: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "-", text).strip("-")[:80] or "event"
+
+
+class _Interaction:
+    __slots__ = ("profile", "start", "label")
+
+    def __init__(self, label: str):
+        self.label = label
+        self.profile = cProfile.Profile()
+        self.start = time.perf_counter()
+        self.profile.enable()
+
+
+class ProfilingApplication(QApplication):
+    """QApplication that profiles every top-level event it dispatches (GUI thread only).
+
+    Nested sendEvent calls belong to the interaction being profiled. When a nested event loop
+    starts (modal dialog), the interaction so far is closed as '<slot>-until-modal' and the
+    events of the nested loop are profiled as interactions of their own.
+    """
+
+    def __init__(self, argv: list[str], threshold_ms: float = SLOT_PROFILE_THRESHOLD_MS,
+                 out_dir: str = SLOT_PROFILE_DIR):
+        super().__init__(argv)
+        self.threshold_ms = threshold_ms
+        self.out_dir = out_dir
+        self.written = 0
+        self._active: Optional[_Interaction] = None
+        print(f"Slot profiling on: interactions over {threshold_ms:g} ms are saved to {os.path.abspath(out_dir)}")
+
+    def notify(self, receiver, event) -> bool:
+        if self._active is not None and (event.spontaneous() or event.type() in _LOOP_EVENTS):
+            self._finish(self._active, "-until-modal")
+        if self._active is not None:
+            return super().notify(receiver, event)
+        interaction = self._active = _Interaction(self._label(receiver, event))
+        try:
+            return super().notify(receiver, event)
+        finally:
+            if self._active is interaction:
+                self._finish(interaction, "")
+
+    def _label(self, receiver, event) -> str:
+        name = type(receiver).__name__
+        obj_name = receiver.objectName() if hasattr(receiver, "objectName") else ""
+        event_name = event.type().name if hasattr(event.type(), "name") else str(event.type())
+        return f"{event_name}-{name}{'.' + obj_name if obj_name else ''}"
+
+    def _finish(self, interaction: _Interaction, suffix: str) -> None:
+        interaction.profile.disable()
+        self._active = None
+        elapsed_ms = (time.perf_counter() - interaction.start) * 1000.0
+        if elapsed_ms < self.threshold_ms:
+            return
+        try:
+            os.makedirs(self.out_dir, exist_ok=True)
+            slot = slot_name(interaction.profile) or interaction.label
+            name = f"{datetime.now():%Y%m%d-%H%M%S}_{_safe(slot + suffix)}_{int(elapsed_ms)}ms.prof"
+            path = os.path.join(self.out_dir, name)
+            interaction.profile.dump_stats(path)
+            self.written += 1
+            print(f"[slot profile] {slot}{suffix} ({interaction.label}) took {elapsed_ms:.0f} ms -> {path}")
+        except Exception as e:
+            print(f"Failed to save slot profile: {e}")
+
+
+def _profile_ms(name: str) -> int:
+    match = re.search(r"_(\d+)ms\.prof$", name)
+    return int(match.group(1)) if match else 0
+
+
+def summarize(folder: str = SLOT_PROFILE_DIR, top: int = 20, functions: int = 5) -> str:
+    """The `top` slowest profiles in folder, each with its heaviest app functions."""
+    if not os.path.isdir(folder):
+        return f"No profiles in {folder}"
+    names = sorted((n for n in os.listdir(folder) if n.endswith(".prof")), key=_profile_ms, reverse=True)
+    lines = [f"{len(names)} profile(s) in {folder}"]
+    for name in names[:top]:
+        lines.append(f"\n{_profile_ms(name):>7} ms  {name}")
+        try:
+            stats = pstats.Stats(os.path.join(folder, name)).stats
+        except Exception as e:
+            lines.append(f"          unreadable: {e}")
+            continue
+        app_funcs = sorted(
+            ((ct, tt, nc, f"{os.path.relpath(fn, os.path.dirname(_SRC_DIR))}:{line} {func}")
+             for (fn, line, func), (_cc, nc, tt, ct, _callers) in stats.items()
+             if _is_app_code(fn)),
+            reverse=True,
+        )[:functions]
+        for ct, tt, nc, where in app_funcs:
+            lines.append(f"          {ct * 1000:8.1f} ms cum {tt * 1000:8.1f} ms self {nc:>6}x  {where}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.utils.slot_profiler", description=__doc__.splitlines()[0])
+    parser.add_argument("folder", nargs="?", default=SLOT_PROFILE_DIR)
+    parser.add_argument("--top", type=int, default=20, help="profiles to list (slowest first)")
+    args = parser.parse_args(argv)
+    print(summarize(args.folder, args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+# src/utils/stall_watchdog.py
+"""Event-loop stall watchdog: finds the blocking calls that freeze the GUI thread.
+
+A heartbeat QTimer on the GUI thread records when the event loop last ran, and how late each
+tick was (event-loop latency). A watchdog thread checks the heartbeat; once it is older than
+STALL_THRESHOLD_MS the GUI thread's Python stack is sampled (sys._current_frames) until the
+loop runs again. Each stall is attributed to the innermost app frame seen most often in its
+samples (the blocking call site: a DB function, shutil.copyfile, PDF rendering...) and
+aggregated per location: count, total, max. Stalls are logged as they end and a summary is
+printed on exit.
+
+Calls into C code that hold the GIL for the whole stall cannot be sampled; they show up at
+the Python line that made the call once the watchdog gets the GIL back.
+"""
+from __future__ import annotations
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from datetime import datetime
+from typing import Optional
+
+from PyQt6.QtCore import QObject, QTimer
+
+from ..config import STALL_HEARTBEAT_MS, STALL_THRESHOLD_MS, STALL_LOG_FILE
+
+_THIS_FILE = os.path.abspath(__file__)
+_PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(_THIS_FILE)))
+
+
+def _frame_label(frame: traceback.FrameSummary) -> str:
+    path = os.path.abspath(frame.filename)
+    if path.startswith(_PROJECT_DIR):
+        path = os.path.relpath(path, _PROJECT_DIR)
+    else:
+        path = os.path.basename(path)
+    return f"{path}:{frame.lineno} {frame.name}"
+
+
+def _is_app_frame(frame: traceback.FrameSummary) -> bool:
+    path = os.path.abspath(frame.filename)
+    return path.startswith(_PROJECT_DIR) and path != _THIS_FILE
+
+
+class StallSite:
+    """Stalls attributed to one app code location."""
+
+    __slots__ = ("location", "count", "total_ms", "max_ms", "callees", "stack")
+
+    def __init__(self, location: str):
+        self.location = location
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        # Innermost frames (library calls) seen below the app frame, e.g. shutil.py copyfile
+        self.callees: Counter[str] = Counter()
+        self.stack: list[str] = []  # stack of the longest stall
+
+    def add(self, ms: float, callee: str, stack: list[str]) -> None:
+        self.count += 1
+        self.total_ms += ms
+        if callee:
+            self.callees[callee] += 1
+        if ms >= self.max_ms:
+            self.max_ms = ms
+            self.stack = stack
+
+
+class _Stall:
+    __slots__ = ("beat", "samples")
+
+    def __init__(self, beat: float):
+        self.beat = beat
+        self.samples: list[traceback.StackSummary] = []
+
+
+class StallWatchdog(QObject):
+    """Heartbeat on the GUI thread plus a sampling watchdog thread (see module docstring).
+
+    Create it on the GUI thread and call start(); stop() ends the thread and returns report().
+    """
+
+    def __init__(self, threshold_ms: float = STALL_THRESHOLD_MS, heartbeat_ms: int = STALL_HEARTBEAT_MS,
+                 log_file: Optional[str] = STALL_LOG_FILE, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.threshold_ms = float(threshold_ms)
+        self.heartbeat_ms = int(heartbeat_ms)
+        self.log_file = log_file
+        self.sites: dict[str, StallSite] = {}
+        self.stalls = 0
+        self.beats = 0
+        self.max_latency_ms = 0.0
+        self._latency_total_ms = 0.0
+        self._started = 0.0
+        self._gui_ident = threading.get_ident()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_beat = time.monotonic()
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.heartbeat_ms)
+        self._timer.timeout.connect(self._beat)
+
+    # --- GUI thread ---
+
+    def start(self) -> "StallWatchdog":
+        if self._thread is not None:
+            return self
+        self._gui_ident = threading.get_ident()
+        self._started = self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._timer.start()
+        self._thread = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+        self._thread.start()
+        print(f"Stall watchdog on: event-loop stalls over {self.threshold_ms:g} ms are logged"
+              + (f" to {os.path.abspath(self.log_file)}" if self.log_file else ""))
+        return self
+
+    def stop(self) -> str:
+        self._timer.stop()
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        report = self.report()
+        self._log(report)
+        return report
+
+    def _beat(self) -> None:
+        now = time.monotonic()
+        latency_ms = max(0.0, (now - self._last_beat) * 1000.0 - self.heartbeat_ms)
+        self._last_beat = now
+        self.beats += 1
+        self._latency_total_ms += latency_ms
+        if latency_ms > self.max_latency_ms:
+            self.max_latency_ms = latency_ms
+
+    # --- Watchdog thread ---
+
+    def _watch(self) -> None:
+        poll = max(0.01, self.threshold_ms / 4000.0)
+        stall: Optional[_Stall] = None
+        while not self._stop.wait(poll):
+            beat = self._last_beat
+            if stall is not None and beat != stall.beat:
+                # The loop ran again: the stall lasted from the missed beat until now
+                self._record(stall, (beat - stall.beat) * 1000.0 - self.heartbeat_ms)
+                stall = None
+            if (time.monotonic() - beat) * 1000.0 - self.heartbeat_ms < self.threshold_ms:
+                continue
+            if stall is None:
+                stall = _Stall(beat)
+            frame = sys._current_frames().get(self._gui_ident)
+            if frame is not None:
+                stall.samples.append(traceback.extract_stack(frame))
+            del frame
+        if stall is not None:
+            self._record(stall, (time.monotonic() - stall.beat) * 1000.0 - self.heartbeat_ms)
+
+    def _record(self, stall: _Stall, ms: float) -> None:
+        # The app frame seen in most samples is where the loop was blocked
+        locations: Counter[str] = Counter()
+        callees: dict[str, str] = {}
+        stacks: dict[str, list[str]] = {}
+        for sample in stall.samples:
+            app = next((f for f in reversed(sample) if _is_app_frame(f)), None)
+            if app is None and sample:
+                app = sample[-1]
+            location = _frame_label(app) if app is not None else "<no Python frame>"
+            locations[location] += 1
+            leaf = sample[-1] if sample else None
+            callees[location] = _frame_label(leaf) if leaf is not None and leaf is not app else ""
+            stacks[location] = [_frame_label(f) for f in sample]
+        location = locations.most_common(1)[0][0] if locations else "<not sampled>"
+        with self._lock:
+            site = self.sites.get(location)
+            if site is None:
+                site = self.sites[location] = StallSite(location)
+            site.add(ms, callees.get(location, ""), stacks.get(location, []))
+            self.stalls += 1
+        callee = callees.get(location)
+        self._log(f"[stall] {ms:.0f} ms at {location}" + (f" -> {callee}" if callee else ""),
+                  stacks.get(location))
+
+    def _log(self, line: str, stack: Optional[list[str]] = None) -> None:
+        print(line)
+        if not self.log_file:
+            return
+        try:
+            folder = os.path.dirname(self.log_file)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            with open(self.log_file, "a", encoding="utf-8") as fh:
+                fh.write(f"{datetime.now():%Y-%m-%d %H:%M:%S} {line}\n")
+                for frame in stack or []:
+                    fh.write(f"    {frame}\n")
+        except Exception as e:
+            print(f"Failed to write stall log: {e}")
+
+    # --- Reporting ---
+
+    def report(self, limit: int = 15) -> str:
+        """Stall count/total/max per location, worst total first, plus event-loop latency."""
+        with self._lock:
+            sites = sorted(self.sites.values(), key=lambda s: s.total_ms, reverse=True)
+            stalls = self.stalls
+        minutes = max(1e-9, (time.monotonic() - self._started) / 60.0) if self._started else 0.0
+        mean_latency = self._latency_total_ms / self.beats if self.beats else 0.0
+        lines = [f"Event-loop stalls over {self.threshold_ms:g} ms: {stalls}"
+                 + (f" ({stalls / minutes:.2f}/min)" if minutes else ""),
+                 f"Heartbeat latency: mean {mean_latency:.1f} ms, max {self.max_latency_ms:.0f} ms "
+                 f"over {self.beats} beats"]
+        if sites:
+            lines.append(f"{'count':>6} {'total ms':>9} {'max ms':>8}  location")
+        for site in sites[:limit]:
+            lines.append(f"{site.count:>6} {site.total_ms:9.0f} {site.max_ms:8.0f}  {site.location}")
+            if site.callees:
+                lines.append(f"{'':>27}-> {site.callees.most_common(1)[0][0]}")
+        if len(sites) > limit:
+            lines.append(f"... {len(sites) - limit} more location(s)")
+        return "\n".join(lines)
@@ -0,0 +1,107 @@
+# src/utils/startup.py
+from __future__ import annotations
+import time
+from typing import Callable, Optional
+
+from PyQt6.QtCore import QObject, QEvent, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QWidget
+
+from .workers import Worker, start_worker
+
+# Progress labels, one per step of _run_startup_steps
+STARTUP_STEPS = (
+    "Connecting to the database and applying migrations...",
+    "Loading today's attendance...",
+)
+
+
+def _run_startup_steps(worker: Worker) -> dict:
+    """Runs on a worker thread: DB bootstrap, then the kiosk's first data load."""
+    from ..database.db_setup import setup_database
+    from ..database.db_queries import get_today_attendance
+
+    total = len(STARTUP_STEPS)
+    worker.report_progress(0, total)
+    error = setup_database()
+    if error is not None:
+        return {'ok': False, 'error': error}
+    worker.report_progress(1, total)
+    attendance = get_today_attendance()
+    worker.report_progress(2, total)
+    return {'ok': True, 'attendance': attendance}
+
+
+class StartupPipeline(QObject):
+    """Runs the startup steps in the background and reports progress to the splash.
+
+    progress(step, total, label) is emitted as steps start, then either finished(data)
+    with the preloaded data or failed(message). start() may be called again to retry.
+    """
+
+    progress = pyqtSignal(int, int, str)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._worker: Optional[Worker] = None
+
+    def start(self) -> None:
+        if self._worker is not None:
+            return
+        worker = Worker(_run_startup_steps, pass_worker=True)
+        worker.signals.progress.connect(self._on_progress)
+        worker.signals.finished.connect(self._on_finished)
+        worker.signals.error.connect(self._on_error)
+        self._worker = start_worker(worker)
+
+    def _on_progress(self, done: int, total: int) -> None:
+        label = STARTUP_STEPS[done] if done < len(STARTUP_STEPS) else "Opening TimeTrack..."
+        self.progress.emit(done, total, label)
+
+    def _on_finished(self, result: dict) -> None:
+        self._worker = None
+        if result.get('ok'):
+            self.finished.emit(result)
+        else:
+            self.failed.emit(result.get('error') or "Startup failed.")
+
+    def _on_error(self, message: str) -> None:
+        self._worker = None
+        self.failed.emit(f"Startup failed: {message}")
+
+
+class StartupMetrics(QObject):
+    """Milestones measured from process start (t0 taken first thing in main.py).
+
+    watch_first_paint(widget, name) records `name` on the widget's first paint; after the
+    dashboard's first paint, "interactive" is recorded once the event loop is idle again.
+    """
+
+    def __init__(self, t0: float, parent=None):
+        super().__init__(parent)
+        self._t0 = t0
+        self.marks: dict[str, float] = {}
+        self._watched: dict[QWidget, tuple[str, Optional[Callable[[], None]]]] = {}
+
+    def mark(self, name: str) -> float:
+        elapsed = (time.perf_counter() - self._t0) * 1000.0
+        self.marks.setdefault(name, elapsed)
+        return self.marks[name]
+
+    def watch_first_paint(self, widget: QWidget, name: str, then: Optional[Callable[[], None]] = None) -> None:
+        self._watched[widget] = (name, then)
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event) -> bool:
+        if event.type() == QEvent.Type.Paint and obj in self._watched:
+            name, then = self._watched.pop(obj)
+            obj.removeEventFilter(self)
+            self.mark(name)
+            if then is not None:
+                # Runs after this paint completes and pending events are processed
+                QTimer.singleShot(0, then)
+        return False
+
+    def report(self) -> str:
+        return "Startup timings: " + ", ".join(f"{k} {v:.0f} ms" for k, v in self.marks.items())
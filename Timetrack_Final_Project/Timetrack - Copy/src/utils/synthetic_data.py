@@ -0,0 +1,256 @@
+# src/utils/synthetic_data.py
+"""Synthetic employees and attendance history at benchmark scale.
+
+    python -m src.utils.synthetic_data --employees 5000 --years 3 --csv bench/
+    python -m src.utils.synthetic_data --employees 5000 --years 3 --mysql --database Timetrack_bench
+
+The same parameters and --seed always give the same data (fix --end-date too, it defaults to
+yesterday). --csv writes employees.csv and punches.csv in the format of src.utils.bulk_import
+plus dataset.json with the parameters; --mysql bulk-loads straight into a database, which is
+emptied first and created if needed. Run the app against it with Timetrack_DB_NAME.
+"""
+from __future__ import annotations
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, Iterator, Optional
+
+DEPARTMENTS = ("IT", "HR", "Finance", "Marketing", "Sales", "Operations", "Support", "Legal",
+               "Procurement", "Logistics", "Research", "Facilities")
+POSITIONS = ("Associate", "Specialist", "Analyst", "Senior Specialist", "Team Lead", "Manager")
+FIRST_NAMES = ("James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda", "David",
+               "Elizabeth", "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas",
+               "Sarah", "Carlos", "Maria", "Jose", "Ana", "Miguel", "Sofia", "Wei", "Mei", "Hiroshi",
+               "Yuki", "Arjun", "Priya", "Ahmed", "Fatima", "Olga", "Ivan", "Chloe", "Lucas")
+LAST_NAMES = ("Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+              "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
+              "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson", "White",
+              "Santos", "Reyes", "Cruz", "Tanaka", "Chen", "Wang", "Kumar", "Singh", "Khan", "Novak")
+FIRST_EMPLOYEE_ID = 10000  # same start as migration 008
+EMPLOYEE_CSV = "employees.csv"
+PUNCH_CSV = "punches.csv"
+MANIFEST_NAME = "dataset.json"
+DEFAULT_BENCH_DATABASE = "Timetrack_bench"
+LOAD_BATCH_SIZE = 10000
+
+
+def department_names(count: int) -> list[str]:
+    return [DEPARTMENTS[i] if i < len(DEPARTMENTS) else f"Department {i + 1}" for i in range(count)]
+
+
+def generate_employees(count: int, departments: int, start: date, end: date, seed: int = 0,
+                       inactive_rate: float = 0.05) -> list[dict]:
+    """Employees with ids from FIRST_EMPLOYEE_ID, a hire date and (for leavers) a last day.
+
+    Department sizes are skewed (a few large departments, a long tail of small ones) and a
+    quarter of the staff is hired during the period rather than before it.
+    """
+    rng = random.Random(f"{seed}:employees")
+    names = department_names(departments)
+    weights = [1.0 / (i + 1) for i in range(len(names))]
+    span = max(1, (end - start).days)
+    employees = []
+    for i in range(count):
+        hired = start if rng.random() < 0.75 else start + timedelta(days=rng.randrange(span))
+        left = None
+        if rng.random() < inactive_rate:
+            left = hired + timedelta(days=rng.randrange(max(1, (end - hired).days)))
+        employees.append({
+            'employee_id': FIRST_EMPLOYEE_ID + i,
+            'full_name': f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            'position': rng.choice(POSITIONS),
+            'department': rng.choices(names, weights)[0],
+            'leave_credits': rng.randint(5, 20),
+            'is_active': left is None,
+            'hired': hired,
+            'left': left,
+        })
+    return employees
+
+
+def generate_punches(employees: list[dict], start: date, end: date, seed: int = 0,
+                     absence_rate: float = 0.05, late_rate: float = 0.10,
+                     open_rate: float = 0.01) -> Iterator[tuple]:
+    """Yield (employee_id, time_in, time_out, status, date) per weekday, oldest day first.
+
+    Absences leave no row (as at the kiosk); late arrivals come after 08:15 and open sessions
+    have no time_out. Status follows the check-in rule (attendance.punch_status).
+    """
+    from ..database.attendance import punch_status
+    rng = random.Random(f"{seed}:punches")
+    day = start
+    one = timedelta(days=1)
+    while day <= end:
+        if day.weekday() < 5:
+            eight = datetime(day.year, day.month, day.day, 8, 0)
+            for emp in employees:
+                if day < emp['hired'] or (emp['left'] is not None and day > emp['left']):
+                    continue
+                if rng.random() < absence_rate:
+                    continue
+                if rng.random() < late_rate:
+                    time_in = eight + timedelta(minutes=16 + min(rng.expovariate(1 / 20.0), 150))
+                else:
+                    time_in = eight + timedelta(minutes=rng.triangular(-30, 15, 0))
+                time_in = time_in.replace(microsecond=0)
+                time_out = None
+                if rng.random() >= open_rate:
+                    shift = timedelta(hours=9, minutes=rng.triangular(-45, 120, 0))
+                    time_out = (time_in + shift).replace(microsecond=0)
+                yield (emp['employee_id'], time_in, time_out, punch_status(time_in), day)
+        day += one
+
+
+def write_csv(out_dir: str, employees: list[dict], punches: Iterator[tuple],
+              progress: Optional[Callable[[int], None]] = None) -> int:
+    """Write employees.csv and punches.csv (bulk_import format). Returns the punch count."""
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, EMPLOYEE_CSV), "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["employee_id", "full_name", "position", "department", "leave_credits", "is_active", "hired"])
+        for e in employees:
+            writer.writerow([e['employee_id'], e['full_name'], e['position'], e['department'],
+                             e['leave_credits'], "yes" if e['is_active'] else "no", e['hired'].isoformat()])
+    count = 0
+    with open(os.path.join(out_dir, PUNCH_CSV), "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["employee_id", "date", "time_in", "time_out", "status"])
+        for emp_id, time_in, time_out, status, day in punches:
+            writer.writerow([emp_id, day.isoformat(), time_in.isoformat(sep=" "),
+                             time_out.isoformat(sep=" ") if time_out else "", status])
+            count += 1
+            if progress is not None and count % LOAD_BATCH_SIZE == 0:
+                progress(count)
+    return count
+
+
+def write_mysql(employees: list[dict], punches: Iterator[tuple],
+                progress: Optional[Callable[[int], None]] = None) -> int:
+    """Empty the employees/attendance/staff tables of DB_NAME and bulk-load the dataset into them.
+
+    staff_users is reset to the default admin account only. Key and foreign-key checks are off
+    for the session (the generated data is consistent by construction) and rows go in
+    LOAD_BATCH_SIZE at a time. Returns the punch count.
+    """
+    from ..database.db_setup import setup_database
+    from ..database.db_config import get_db_connection
+    from ..database.migrations import create_default_admin
+    error = setup_database()
+    if error is not None:
+        raise RuntimeError(error)
+    conn = get_db_connection()
+    if not conn:
+        raise RuntimeError("Database connection failed")
+    count = 0
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SET SESSION foreign_key_checks = 0, unique_checks = 0")
+            cursor.execute("DELETE FROM attendance_records")
+            cursor.execute("DELETE FROM employees")
+            cursor.execute("DELETE FROM staff_users")
+            create_default_admin(cursor)
+            cursor.executemany(
+                """
+                INSERT INTO employees (employee_id, full_name, position, department, leave_credits, is_active, created_at)
+                VALUES (%s, %s, %s, %s, %s, %s, %s)
+                """,
+                [(e['employee_id'], e['full_name'], e['position'], e['department'], e['leave_credits'],
+                  e['is_active'], datetime.combine(e['hired'], datetime.min.time())) for e in employees]
+            )
+            conn.commit()
+            sql = "INSERT INTO attendance_records (employee_id, time_in, time_out, status, date) VALUES (%s, %s, %s, %s, %s)"
+            batch = []
+            for row in punches:
+                batch.append(row)
+                if len(batch) >= LOAD_BATCH_SIZE:
+                    cursor.executemany(sql, batch)
+                    conn.commit()
+                    count += len(batch)
+                    batch.clear()
+                    if progress is not None:
+                        progress(count)
+            if batch:
+                cursor.executemany(sql, batch)
+                conn.commit()
+                count += len(batch)
+            cursor.execute("SET SESSION foreign_key_checks = 1, unique_checks = 1")
+        return count
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def _print_progress(count: int) -> None:
+    print(f"\r  {count:,} punches", end="", flush=True)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.utils.synthetic_data", description=__doc__.splitlines()[0])
+    parser.add_argument("--employees", type=int, default=1000)
+    parser.add_argument("--departments", type=int, default=8)
+    parser.add_argument("--years", type=float, default=2.0, help="history length ending at --end-date")
+    parser.add_argument("--end-date", type=date.fromisoformat, default=date.today() - timedelta(days=1),
+                        help="last day of history, YYYY-MM-DD (default: yesterday)")
+    parser.add_argument("--absence-rate", type=float, default=0.05, help="share of workdays without a punch")
+    parser.add_argument("--late-rate", type=float, default=0.10, help="share of punches after 08:15")
+    parser.add_argument("--open-rate", type=float, default=0.01, help="share of punches without time_out")
+    parser.add_argument("--inactive-rate", type=float, default=0.05, help="share of employees who left")
+    parser.add_argument("--seed", type=int, default=0)
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--csv", metavar="DIR", help="write CSV files (bulk_import format) to DIR")
+    target.add_argument("--mysql", action="store_true", help="load into --database (emptied first)")
+    parser.add_argument("--database", default=DEFAULT_BENCH_DATABASE, help="MySQL database (default: %(default)s)")
+    parser.add_argument("--force", action="store_true", help="allow --database to be the app's own database")
+    args = parser.parse_args(argv)
+
+    if args.employees <= 0 or args.departments <= 0 or args.years <= 0:
+        parser.error("--employees, --departments and --years must be positive")
+    for name in ("absence_rate", "late_rate", "open_rate", "inactive_rate"):
+        if not 0.0 <= getattr(args, name) <= 1.0:
+            parser.error(f"--{name.replace('_', '-')} must be between 0 and 1")
+    if args.mysql:
+        # db_config reads this when first imported, so set it first
+        os.environ["Timetrack_DB_NAME"] = args.database
+        from ..database.db_config import is_app_database
+        if is_app_database(args.database) and not args.force:
+            parser.error(f"{args.database} is the app's database and would be emptied; pass --force to do it anyway")
+
+    start = args.end_date - timedelta(days=int(round(args.years * 365.25)) - 1)
+    started = time.perf_counter()
+    employees = generate_employees(args.employees, args.departments, start, args.end_date,
+                                   args.seed, args.inactive_rate)
+    punches = generate_punches(employees, start, args.end_date, args.seed,
+                               args.absence_rate, args.late_rate, args.open_rate)
+    if args.csv:
+        count = write_csv(args.csv, employees, punches, _print_progress)
+        target_label = args.csv
+    else:
+        try:
+            count = write_mysql(employees, punches, _print_progress)
+        except Exception as e:
+            print(f"\nFailed to load {args.database}: {e}")
+            return 1
+        target_label = f"MySQL database {args.database}"
+    elapsed = time.perf_counter() - started
+    print(f"\r{len(employees):,} employees and {count:,} punches ({start} to {args.end_date}) "
+          f"written to {target_label} in {elapsed:.1f} s")
+
+    if args.csv:
+        params = {k: v for k, v in vars(args).items() if k not in ("mysql", "database", "force", "csv")}
+        params['end_date'] = args.end_date.isoformat()
+        manifest = {'parameters': params, 'start_date': start.isoformat(),
+                    'employees': len(employees), 'punches': count}
+        with open(os.path.join(args.csv, MANIFEST_NAME), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
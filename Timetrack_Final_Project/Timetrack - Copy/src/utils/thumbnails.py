@@ -0,0 +1,151 @@
+# src/utils/thumbnails.py
+from __future__ import annotations
+import hashlib
+import os
+import threading
+from typing import Optional
+
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QPixmap, QPixmapCache, QPainter, QColor, QFont, QImage
+
+from ..config import THUMBNAIL_CACHE_DIR, THUMBNAIL_MEMORY_CACHE_KB
+
+# Fallback avatar colors (match the details modal palette)
+FALLBACK_BG = "#E0DCE6"
+FALLBACK_FG = "#8B7AB8"
+
+_cache_limit_set = False
+# Lookups per cache layer, read by the metrics exporter (approximate when workers race)
+CACHE_STATS = {"memory_hit": 0, "memory_miss": 0, "disk_hit": 0, "disk_miss": 0}
+
+
+def _source_key(path: str) -> Optional[tuple[str, int]]:
+    """(absolute path, mtime in ns) of a readable image file, or None."""
+    try:
+        if not (isinstance(path, str) and os.path.isfile(path)):
+            return None
+        return os.path.abspath(path), os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def thumbnail_path(path: str, size: int) -> Optional[str]:
+    """On-disk cache file for `path` at `size` px. A changed mtime gives a new file name."""
+    key = _source_key(path)
+    if key is None:
+        return None
+    digest = hashlib.sha1(f"{key[0]}|{key[1]}|{size}".encode("utf-8")).hexdigest()
+    return os.path.join(THUMBNAIL_CACHE_DIR, f"{digest[:24]}_{size}.png")
+
+
+def _write_thumbnail(path: str, dest: str, size: int) -> None:
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        # Pillow missing: let Qt scale it (no EXIF orientation handling)
+        image = QImage(path)
+        if image.isNull():
+            raise ValueError(f"cannot decode {path}")
+        image.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                     Qt.TransformationMode.SmoothTransformation).save(dest, "PNG")
+        return
+    with Image.open(path) as im:
+        im = ImageOps.exif_transpose(im)
+        im = im.convert("RGBA" if "A" in im.getbands() else "RGB")
+        im.thumbnail((size, size), Image.Resampling.LANCZOS)
+        im.save(dest, "PNG", optimize=True)
+
+
+def ensure_thumbnail(path: str, size: int) -> Optional[str]:
+    """Return the cached thumbnail file for `path`, creating it first if needed.
+
+    Only touches files (Pillow), so it is safe to call from worker threads. None if the
+    source is missing or cannot be decoded.
+    """
+    dest = thumbnail_path(path, size)
+    if dest is None:
+        return None
+    if os.path.isfile(dest):
+        CACHE_STATS["disk_hit"] += 1
+        return dest
+    CACHE_STATS["disk_miss"] += 1
+    # Write to a temp name first so a concurrent reader never sees a partial file
+    tmp = f"{dest}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(THUMBNAIL_CACHE_DIR, exist_ok=True)
+        _write_thumbnail(path, tmp, size)
+        os.replace(tmp, dest)
+        return dest
+    except Exception as e:
+        print(f"Failed to create thumbnail for {path}: {e}")
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return None
+
+
+def _initials(name: Optional[str]) -> str:
+    parts = [p for p in (name or "").split() if p[:1].isalnum()]
+    if not parts:
+        return "?"
+    if len(parts) == 1:
+        return parts[0][0].upper()
+    return (parts[0][0] + parts[-1][0]).upper()
+
+
+def _fallback_pixmap(name: Optional[str], size: int, dpr: float) -> QPixmap:
+    pm = QPixmap(round(size * dpr), round(size * dpr))
+    pm.setDevicePixelRatio(dpr)
+    pm.fill(QColor(FALLBACK_BG))
+    painter = QPainter(pm)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+    font = QFont("Segoe UI")
+    font.setPixelSize(max(8, int(size * 0.38)))
+    font.setWeight(QFont.Weight.Bold)
+    painter.setFont(font)
+    painter.setPen(QColor(FALLBACK_FG))
+    painter.drawText(QRectF(0, 0, size, size), Qt.AlignmentFlag.AlignCenter, _initials(name))
+    painter.end()
+    return pm
+
+
+def get_avatar_pixmap(path: Optional[str], size: int, name: Optional[str] = None, dpr: float = 1.0) -> QPixmap:
+    """Avatar for `path` fitting a size x size box (aspect kept), from the cache when possible.
+
+    Lookup order: QPixmapCache (bounded, in memory) -> thumbnail file on disk -> decode the
+    source once with Pillow. Missing/unreadable images give an initials placeholder, which is
+    cached too. GUI thread only.
+    """
+    global _cache_limit_set
+    if not _cache_limit_set:
+        QPixmapCache.setCacheLimit(THUMBNAIL_MEMORY_CACHE_KB)
+        _cache_limit_set = True
+
+    px = max(1, round(size * dpr))
+    source = _source_key(path) if path else None
+    if source is not None:
+        key = f"avatar:{source[0]}:{source[1]}:{px}"
+    else:
+        key = f"avatar-fallback:{_initials(name)}:{px}"
+
+    pm = QPixmapCache.find(key)
+    if pm is not None and not pm.isNull():
+        CACHE_STATS["memory_hit"] += 1
+        return pm
+
+    CACHE_STATS["memory_miss"] += 1
+    pm = None
+    if source is not None:
+        thumb = ensure_thumbnail(path, px)
+        if thumb is not None:
+            pm = QPixmap(thumb)
+            if pm.isNull():
+                pm = None
+            else:
+                pm.setDevicePixelRatio(dpr)
+    if pm is None:
+        pm = _fallback_pixmap(name, size, dpr)
+    QPixmapCache.insert(key, pm)
+    return pm
@@ -0,0 +1,298 @@
+# src/utils/tracing.py
+"""Lightweight trace spans from a UI action down to the SQL statements it sends.
+
+With Timetrack_TRACE=1 the app runs under TracingApplication. Each click, key press, timer
+tick or queued signal handled on the GUI thread opens a root span. Spans nest below it:
+- database functions (every public function of the database modules, "db")
+- connects and cursor executes (reported by the db_config query observers, "sql")
+- model/widget population (@traced methods, "widget")
+- scheduled refreshes ("refresh")
+- paints ("render")
+Workers started inside a trace continue it on their thread.
+
+Spans go to a ring buffer of TRACE_MAX_EVENTS. Spans shorter than TRACE_MIN_SPAN_MS
+without children are dropped, so idle timers and cursor blinks leave no trace. The
+buffer is saved as Chrome trace-event JSON (chrome://tracing, ui.perfetto.dev) on exit
+and on Ctrl+Shift+T. User actions that touched the database print a one-line summary,
+e.g. "2 connection(s), 6 statement(s) in get_employee_by_id, get_employee_details".
+"""
+from __future__ import annotations
+import functools
+import inspect
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Callable, Optional
+
+from PyQt6.QtCore import Qt, QEvent
+from PyQt6.QtWidgets import QApplication, QAbstractButton
+
+from ..config import TRACE_DIR, TRACE_MAX_EVENTS, TRACE_MIN_SPAN_MS
+
+# Top-level events that start a root span, by category
+_ROOT_EVENTS = {
+    QEvent.Type.MouseButtonPress: "input",
+    QEvent.Type.MouseButtonRelease: "input",
+    QEvent.Type.MouseButtonDblClick: "input",
+    QEvent.Type.KeyPress: "input",
+    QEvent.Type.Shortcut: "input",
+    QEvent.Type.Timer: "timer",
+    QEvent.Type.MetaCall: "signal",
+    QEvent.Type.UpdateRequest: "render",
+    QEvent.Type.Paint: "render",
+}
+_EXPORT_KEY = (Qt.Key.Key_T, Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.ShiftModifier)
+_DB_MODULES = ("employees", "attendance", "auth")
+
+_enabled = False
+_local = threading.local()
+_events: deque = deque(maxlen=TRACE_MAX_EVENTS)
+_thread_names: dict[int, str] = {}
+_ids = itertools.count(1)
+_t0_ns = time.perf_counter_ns()
+_min_span_ns = int(TRACE_MIN_SPAN_MS * 1_000_000)
+_NULL = nullcontext()
+
+
+class Span:
+    __slots__ = ("name", "cat", "args", "start_ns", "children", "root", "trace_id",
+                 "connections", "statements", "functions")
+
+    def __init__(self, name: str, cat: str, args: Optional[dict], root: Optional["Span"]):
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.children = 0  # recorded ones
+        self.root = root
+        self.trace_id = root.trace_id if root is not None else next(_ids)
+        # Database activity of the trace (root spans only)
+        self.connections = 0
+        self.statements = 0
+        self.functions: list[str] = []
+        self.start_ns = time.perf_counter_ns()
+
+
+def _stack() -> list[Span]:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+        _thread_names[threading.get_native_id()] = threading.current_thread().name
+    return stack
+
+
+def _root_of(stack: list[Span]) -> Optional[Span]:
+    if not stack:
+        return None
+    return stack[0].root or stack[0]
+
+
+def _record(name: str, cat: str, start_ns: int, end_ns: int, trace_id: int, args: Optional[dict]) -> None:
+    event = {
+        "name": name, "cat": cat, "ph": "X", "pid": os.getpid(), "tid": threading.get_native_id(),
+        "ts": (start_ns - _t0_ns) / 1000.0, "dur": (end_ns - start_ns) / 1000.0,
+        "args": dict(args or {}, trace=trace_id),
+    }
+    _events.append(event)
+
+
+class _SpanContext:
+    __slots__ = ("_name", "_cat", "_args", "_root", "_span")
+
+    def __init__(self, name: str, cat: str, args: Optional[dict], root: Optional[Span]):
+        self._name = name
+        self._cat = cat
+        self._args = args
+        self._root = root
+        self._span: Optional[Span] = None
+
+    def __enter__(self) -> Span:
+        stack = _stack()
+        root = _root_of(stack) if stack else self._root
+        span = self._span = Span(self._name, self._cat, self._args, root)
+        stack.append(span)
+        return span
+
+    def __exit__(self, *exc) -> bool:
+        span = self._span
+        end_ns = time.perf_counter_ns()
+        stack = _stack()
+        if stack and stack[-1] is span:
+            stack.pop()
+        elif span in stack:
+            # A generator span closed out of order
+            stack.remove(span)
+        if span.children or end_ns - span.start_ns >= _min_span_ns:
+            _record(span.name, span.cat, span.start_ns, end_ns, span.trace_id, span.args)
+            if stack:
+                stack[-1].children += 1
+        if span.root is None and span.cat == "input" and (span.statements or span.connections):
+            _print_summary(span, end_ns)
+        return False
+
+
+def span(name: str, cat: str = "app", args: Optional[dict] = None, root: Optional[Span] = None):
+    """Context manager timing a span (no-op unless tracing is enabled).
+
+    `root` continues a trace started on another thread (see current_root); it only applies
+    when no span is open on this thread.
+    """
+    if not _enabled:
+        return _NULL
+    return _SpanContext(name, cat, args, root)
+
+
+def current_root() -> Optional[Span]:
+    """Root span of the trace open on this thread, to hand to a worker."""
+    if not _enabled:
+        return None
+    return _root_of(_stack())
+
+
+def traced(name: Optional[str] = None, cat: str = "app") -> Callable:
+    """Decorator: run the function inside span(name or its qualified name, cat)."""
+    def decorate(fn: Callable) -> Callable:
+        label = name or fn.__qualname__
+        if inspect.isgeneratorfunction(fn):
+            @functools.wraps(fn)
+            def generator_wrapper(*args, **kwargs):
+                if not _enabled:
+                    return (yield from fn(*args, **kwargs))
+                with _SpanContext(label, cat, None, None):
+                    return (yield from fn(*args, **kwargs))
+            return generator_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _SpanContext(label, cat, None, None):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def _on_query(kind: str, statement, seconds: float) -> None:
+    # Reported after the fact: the span ends now and started `seconds` ago
+    end_ns = time.perf_counter_ns()
+    start_ns = end_ns - int(seconds * 1_000_000_000)
+    stack = _stack()
+    root = _root_of(stack)
+    if stack:
+        stack[-1].children += 1
+    if kind == "query":
+        name, args = "execute", {"statement": " ".join(str(statement).split())[:300]}
+    else:
+        name, args = kind, {"database": statement}
+    if root is not None:
+        if kind == "query":
+            root.statements += 1
+        else:
+            root.connections += 1
+        db_span = next((s for s in reversed(stack) if s.cat == "db"), None)
+        if db_span is not None and db_span.name not in root.functions:
+            root.functions.append(db_span.name)
+    _record(name, "sql", start_ns, end_ns, root.trace_id if root is not None else 0, args)
+
+
+def _print_summary(root: Span, end_ns: int) -> None:
+    functions = ", ".join(f.split(".", 1)[-1] for f in root.functions)
+    print(f"[trace {root.trace_id}] {root.name}: {(end_ns - root.start_ns) / 1e6:.0f} ms, "
+          f"{root.connections} connection(s), {root.statements} statement(s)"
+          + (f" in {functions}" if functions else ""))
+
+
+def instrument_database() -> int:
+    """Wrap the public functions of the database modules (and their db_queries re-exports) in spans.
+
+    Modules that already imported a function by name keep the unwrapped one, so call this
+    before the screens are imported.
+    """
+    import importlib
+    from ..database import db_queries
+
+    package = db_queries.__name__.rsplit(".", 1)[0]
+    count = 0
+    for module_name in _DB_MODULES:
+        module = importlib.import_module(f"{package}.{module_name}")
+        for name, fn in list(vars(module).items()):
+            if (name.startswith("_") or not inspect.isfunction(fn) or fn.__module__ != module.__name__
+                    or hasattr(fn, "__wrapped__")):
+                continue
+            wrapped = traced(f"db.{name}", "db")(fn)
+            setattr(module, name, wrapped)
+            if getattr(db_queries, name, None) is fn:
+                setattr(db_queries, name, wrapped)
+            count += 1
+    return count
+
+
+def enable() -> None:
+    global _enabled
+    if _enabled:
+        return
+    from ..database.db_config import add_query_observer
+    instrument_database()
+    add_query_observer(_on_query)
+    _enabled = True
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def export_chrome_trace(path: Optional[str] = None) -> str:
+    """Write the buffered spans as Chrome trace-event JSON; returns the file path."""
+    if path is None:
+        os.makedirs(TRACE_DIR, exist_ok=True)
+        path = os.path.join(TRACE_DIR, f"trace-{datetime.now():%Y%m%d-%H%M%S}.json")
+    pid = os.getpid()
+    meta = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "TimeTrack"}}]
+    meta += [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+             for tid, name in list(_thread_names.items())]
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump({"traceEvents": meta + list(_events), "displayTimeUnit": "ms"}, fh)
+    return path
+
+
+def _describe(receiver) -> str:
+    name = type(receiver).__name__
+    if isinstance(receiver, QAbstractButton) and receiver.text():
+        return f"{name} '{receiver.text()}'"
+    obj_name = receiver.objectName() if hasattr(receiver, "objectName") else ""
+    return f"{name}.{obj_name}" if obj_name else name
+
+
+class TracingApplication(QApplication):
+    """QApplication whose notify opens the root (and paint) spans; enables tracing on creation.
+
+    Extra keyword arguments go to the next class in the MRO, so it can be combined with another
+    notify-overriding subclass (see main.py).
+    """
+
+    def __init__(self, argv: list[str], **kwargs):
+        super().__init__(argv, **kwargs)
+        enable()
+        self.aboutToQuit.connect(self._export_on_exit)
+        print(f"Tracing on: spans are saved to {os.path.abspath(TRACE_DIR)} on exit and on Ctrl+Shift+T")
+
+    def notify(self, receiver, event) -> bool:
+        etype = event.type()
+        cat = _ROOT_EVENTS.get(etype)
+        if cat is None:
+            return super().notify(receiver, event)
+        if etype == QEvent.Type.KeyPress and (event.key(), event.modifiers()) == _EXPORT_KEY:
+            print(f"Trace saved to {export_chrome_trace()}")
+            return True
+        with _SpanContext(f"{etype.name} {_describe(receiver)}", cat, None, None):
+            return super().notify(receiver, event)
+
+    def _export_on_exit(self) -> None:
+        try:
+            print(f"Trace saved to {export_chrome_trace()}")
+        except Exception as e:
+            print(f"Failed to save trace: {e}")
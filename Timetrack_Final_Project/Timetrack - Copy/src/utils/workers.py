@@ -0,0 +1,64 @@
+# src/utils/workers.py
+from __future__ import annotations
+import traceback
+from typing import Callable
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from . import tracing
+
+
+class WorkerSignals(QObject):
+    """Signals of a Worker; they are delivered on the thread that created the worker (the GUI)."""
+
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+    progress = pyqtSignal(int, int)
+
+
+class Worker(QRunnable):
+    """Run `fn(*args, **kwargs)` on the global thread pool.
+
+    The return value is emitted through signals.finished, exceptions through signals.error.
+    With pass_worker=True the worker itself is passed as the `worker` keyword argument so
+    long jobs can call worker.report_progress(done, total) and poll worker.is_cancelled().
+    fn must not touch widgets; hand results back through the signals.
+    """
+
+    def __init__(self, fn: Callable, *args, pass_worker: bool = False, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+        self._cancelled = False
+        if pass_worker:
+            self.kwargs['worker'] = self
+        # Trace open when the worker was created (Timetrack_TRACE=1); run() continues it
+        self._trace_root = tracing.current_root()
+        # Python keeps the worker alive (callers hold a reference until finished)
+        self.setAutoDelete(False)
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def report_progress(self, done: int, total: int) -> None:
+        self.signals.progress.emit(int(done), int(total))
+
+    def run(self) -> None:
+        try:
+            with tracing.span(f"worker {getattr(self.fn, '__qualname__', 'task')}", "worker", root=self._trace_root):
+                result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            traceback.print_exc()
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
+
+def start_worker(worker: Worker) -> Worker:
+    QThreadPool.globalInstance().start(worker)
+    return worker
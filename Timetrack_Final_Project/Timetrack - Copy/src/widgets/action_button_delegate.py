@@ -0,0 +1,180 @@
+# src/widgets/action_button_delegate.py
+from __future__ import annotations
+from typing import Optional, Sequence
+
+from PyQt6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem, QAbstractItemView
+from PyQt6.QtCore import Qt, QEvent, QModelIndex, QRect, QRectF, QPoint, QSize, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QPainter
+
+
+# Button specs are (action key, label, background color)
+VIEW_DETAILS_ACTION = ("view", "View Details", "#a78bfa")
+EDIT_ACTION = ("edit", "Edit", "#a78bfa")
+DEACTIVATE_ACTION = ("deactivate", "Deactivate", "#ef4444")
+EDIT_LEAVE_ACTION = ("leave", "Edit Leave", "#f59e0b")
+
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    """Paints a row of push-button lookalikes inside a cell and reports clicks.
+
+    Rows cost no widgets: buttons are drawn in paint() and hit-tested in editorEvent().
+    The cell's `payload_role` data (employee id by default) is emitted with the action key.
+    Use attach() so hover feedback works (it enables mouse tracking on the view).
+    """
+
+    action_triggered = pyqtSignal(str, object)
+
+    def __init__(self, buttons: Sequence[tuple[str, str, str]], parent=None,
+                 button_width: Optional[int] = None, button_height: int = 32,
+                 font_size: int = 10, spacing: int = 4,
+                 payload_role: int = Qt.ItemDataRole.UserRole):
+        super().__init__(parent)
+        self._buttons = list(buttons)
+        self._button_width = button_width
+        self._button_height = button_height
+        self._font_size = font_size
+        self._spacing = spacing
+        self._payload_role = payload_role
+        self._view: Optional[QAbstractItemView] = None
+        self._viewport = None
+        self._column = -1
+        # (row, column, button index) currently hovered / pressed
+        self._hover: Optional[tuple[int, int, int]] = None
+        self._pressed: Optional[tuple[int, int, int]] = None
+
+    def attach(self, view: QAbstractItemView, column: int) -> None:
+        """Install the delegate on `column` of `view` and track hover on its viewport."""
+        self._view = view
+        self._viewport = view.viewport()
+        self._column = column
+        view.setItemDelegateForColumn(column, self)
+        view.setMouseTracking(True)
+        self._viewport.installEventFilter(self)
+
+    def set_buttons(self, buttons: Sequence[tuple[str, str, str]]) -> None:
+        self._buttons = list(buttons)
+        if self._viewport is not None:
+            self._viewport.update()
+
+    # --- Geometry ---
+
+    def _button_rects(self, cell: QRect) -> list[QRect]:
+        n = len(self._buttons)
+        if n == 0:
+            return []
+        inner = cell.adjusted(2, 2, -2, -2)
+        height = min(self._button_height, inner.height())
+        top = inner.top() + (inner.height() - height) // 2
+        if self._button_width:
+            width = self._button_width
+        else:
+            width = max(0, (inner.width() - self._spacing * (n - 1)) // n)
+        rects = []
+        x = inner.left()
+        for _ in range(n):
+            w = max(0, min(width, inner.right() + 1 - x))
+            rects.append(QRect(x, top, w, height))
+            x += width + self._spacing
+        return rects
+
+    def _button_at(self, cell: QRect, pos: QPoint) -> Optional[int]:
+        for i, rect in enumerate(self._button_rects(cell)):
+            if rect.width() > 0 and rect.contains(pos):
+                return i
+        return None
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        n = len(self._buttons)
+        width = (self._button_width or 90) * n + self._spacing * max(0, n - 1) + 4
+        return QSize(width, self._button_height + 4)
+
+    # --- Painting ---
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget is not None else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        font = QFont(opt.font)
+        font.setPointSize(self._font_size)
+        painter.setFont(font)
+        key = (index.row(), index.column())
+        for i, rect in enumerate(self._button_rects(option.rect)):
+            if rect.width() <= 0:
+                continue
+            _action, label, color = self._buttons[i]
+            bg = QColor(color)
+            if self._pressed == (*key, i):
+                bg = bg.darker(130)
+            elif self._hover == (*key, i):
+                bg = bg.darker(115)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(bg)
+            painter.drawRoundedRect(QRectF(rect), 6, 6)
+            painter.setPen(QColor("white"))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, label)
+        painter.restore()
+
+    # --- Interaction ---
+
+    def _update_cell(self, state: Optional[tuple[int, int, int]]) -> None:
+        if state is None or self._view is None or self._view.model() is None:
+            return
+        idx = self._view.model().index(state[0], state[1])
+        self._viewport.update(self._view.visualRect(idx))
+
+    def _set_hover(self, state: Optional[tuple[int, int, int]]) -> None:
+        if state == self._hover:
+            return
+        old, self._hover = self._hover, state
+        self._update_cell(old)
+        self._update_cell(state)
+        if self._viewport is not None:
+            if state is None:
+                self._viewport.unsetCursor()
+            else:
+                self._viewport.setCursor(Qt.CursorShape.PointingHandCursor)
+
+    def eventFilter(self, obj, event) -> bool:
+        etype = event.type()
+        # Only look at the view for mouse events; other events can arrive while it is being destroyed
+        if obj is not self._viewport:
+            return False
+        if etype == QEvent.Type.MouseMove:
+            pos = event.position().toPoint()
+            idx = self._view.indexAt(pos)
+            state = None
+            if idx.isValid() and idx.column() == self._column:
+                i = self._button_at(self._view.visualRect(idx), pos)
+                if i is not None:
+                    state = (idx.row(), idx.column(), i)
+            self._set_hover(state)
+        elif etype == QEvent.Type.Leave:
+            self._set_hover(None)
+        return False
+
+    def editorEvent(self, event, model, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        etype = event.type()
+        if etype in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonDblClick):
+            if event.button() != Qt.MouseButton.LeftButton:
+                return False
+            i = self._button_at(option.rect, event.position().toPoint())
+            if i is None:
+                return False
+            self._pressed = (index.row(), index.column(), i)
+            self._update_cell(self._pressed)
+            return True
+        if etype == QEvent.Type.MouseButtonRelease:
+            pressed, self._pressed = self._pressed, None
+            if pressed is None:
+                return False
+            self._update_cell(pressed)
+            i = self._button_at(option.rect, event.position().toPoint())
+            if pressed == (index.row(), index.column(), i):
+                self.action_triggered.emit(self._buttons[i][0], index.data(self._payload_role))
+            return True
+        return super().editorEvent(event, model, option, index)
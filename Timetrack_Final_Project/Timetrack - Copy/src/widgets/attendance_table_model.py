@@ -0,0 +1,163 @@
+# src/widgets/attendance_table_model.py
+from __future__ import annotations
+from bisect import bisect_left
+from typing import Any
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+
+from ..utils.tracing import traced
+
+
+ATTENDANCE_HEADERS = ["Employee ID", "Employee Name", "Time In", "Time Out", "Status", "Action"]
+ACTION_COLUMN = 5
+
+# Custom roles: the employee id of a row (used by click handlers) and a typed sort key
+EMPLOYEE_ID_ROLE = Qt.ItemDataRole.UserRole
+SORT_ROLE = Qt.ItemDataRole.UserRole + 1
+
+_FIELDS = ('employee_id', 'full_name', 'check_in', 'check_out', 'status')
+_DEFAULTS = ('', '', '--', '--', '')
+
+
+def _row_key(row: dict) -> tuple:
+    """(employee_id, record_id): an employee with two records today has two rows.
+
+    Also the row order, the same as get_today_attendance's ORDER BY (no record sorts first).
+    """
+    return (row.get('employee_id') or 0, row.get('record_id') or 0)
+
+
+class AttendanceTableModel(QAbstractTableModel):
+    """Today's attendance rows (as returned by get_today_attendance).
+
+    set_rows() diffs each new snapshot against the current one by (employee_id, record_id), so
+    views keep their scroll position and selection across refreshes.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[dict] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(ATTENDANCE_HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            if 0 <= section < len(ATTENDANCE_HEADERS):
+                return ATTENDANCE_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+            return None
+        row = self._rows[index.row()]
+        col = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == ACTION_COLUMN:
+                return "View Details"
+            value = row.get(_FIELDS[col])
+            return str(value) if value not in (None, '') else _DEFAULTS[col]
+        if role == EMPLOYEE_ID_ROLE:
+            return row.get('employee_id')
+        if role == SORT_ROLE:
+            if col == 0:
+                try:
+                    return int(row.get('employee_id') or 0)
+                except (TypeError, ValueError):
+                    return 0
+            if col == ACTION_COLUMN:
+                return 0
+            return str(row.get(_FIELDS[col]) or '').lower()
+        return None
+
+    def employee_id_at(self, row: int):
+        if 0 <= row < len(self._rows):
+            return self._rows[row].get('employee_id')
+        return None
+
+    def row_for_employee(self, employee_id) -> int:
+        """First row of the employee, or -1."""
+        return next((i for i, r in enumerate(self._rows) if r.get('employee_id') == employee_id), -1)
+
+    @traced("populate attendance table", "widget")
+    def set_rows(self, rows: list[dict]) -> None:
+        """Diff a new snapshot against the current rows, keyed by (employee_id, record_id).
+
+        Removed rows (deactivations) are removed, new ones (hires, new punches) are inserted at
+        their sorted position, and only rows whose values changed emit dataChanged, limited to
+        the columns that changed.
+        """
+        new_by_key = {_row_key(r): r for r in rows or []}
+
+        removed = [i for i, r in enumerate(self._rows) if _row_key(r) not in new_by_key]
+        if removed:
+            # Remove contiguous blocks from the bottom up so earlier indexes stay valid
+            for first, last in reversed(_contiguous_ranges(removed)):
+                self.beginRemoveRows(QModelIndex(), first, last)
+                del self._rows[first:last + 1]
+                self.endRemoveRows()
+
+        for i, old in enumerate(self._rows):
+            new = new_by_key[_row_key(old)]
+            changed = [c for c, f in enumerate(_FIELDS) if old.get(f) != new.get(f)]
+            if changed:
+                self._rows[i] = new
+                self.dataChanged.emit(self.index(i, changed[0]), self.index(i, changed[-1]))
+
+        keys = [_row_key(r) for r in self._rows]
+        old_keys = set(keys)
+        added = sorted(((key, r) for key, r in new_by_key.items() if key not in old_keys), key=lambda kr: kr[0])
+        # Rows landing between the same two existing rows go in as one block (the first load is one block)
+        blocks: list[tuple[int, list[dict]]] = []
+        for key, r in added:
+            at = bisect_left(keys, key)
+            if blocks and blocks[-1][0] == at:
+                blocks[-1][1].append(r)
+            else:
+                blocks.append((at, [r]))
+        shift = 0
+        for at, block in blocks:
+            first = at + shift
+            self.beginInsertRows(QModelIndex(), first, first + len(block) - 1)
+            self._rows[first:first] = block
+            self.endInsertRows()
+            shift += len(block)
+
+
+def _contiguous_ranges(indexes: list[int]) -> list[tuple[int, int]]:
+    """[1, 2, 3, 7, 9, 10] -> [(1, 3), (7, 7), (9, 10)] for sorted indexes."""
+    ranges: list[tuple[int, int]] = []
+    for i in indexes:
+        if ranges and ranges[-1][1] == i - 1:
+            ranges[-1] = (ranges[-1][0], i)
+        else:
+            ranges.append((i, i))
+    return ranges
+
+
+class AttendanceFilterProxyModel(QSortFilterProxyModel):
+    """Case-insensitive filter on employee id/name, sorting on SORT_ROLE."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._needle = ""
+        self.setSortRole(SORT_ROLE)
+        self.setDynamicSortFilter(True)
+
+    def set_search_text(self, text: str) -> None:
+        needle = (text or "").strip().lower()
+        if needle == self._needle:
+            return
+        self._needle = needle
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if not self._needle:
+            return True
+        model = self.sourceModel()
+        emp_id = model.index(source_row, 0, source_parent).data(Qt.ItemDataRole.DisplayRole) or ""
+        name = model.index(source_row, 1, source_parent).data(Qt.ItemDataRole.DisplayRole) or ""
+        return self._needle in str(emp_id).lower() or self._needle in str(name).lower()
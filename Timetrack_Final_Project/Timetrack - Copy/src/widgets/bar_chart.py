@@ -0,0 +1,191 @@
+# src/widgets/bar_chart.py
+from __future__ import annotations
+import math
+
+from PyQt6.QtWidgets import QWidget, QToolTip, QSizePolicy
+from PyQt6.QtCore import Qt, QEvent, QRectF, QPointF
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen
+
+
+# (legend label, bar color) for the present / late / absent series, same colors as the matplotlib chart
+SERIES = (
+    ("Present", "#10b981"),
+    ("Late", "#f59e0b"),
+    ("Absent", "#ef4444"),
+)
+BAR_WIDTH = 0.22  # fraction of a department's slot
+BAR_GAP = 0.06
+
+
+def _nice_step(peak: float, ticks: int = 5) -> float:
+    """Round tick step (1, 2 or 5 x 10^k) giving about `ticks` intervals up to `peak`."""
+    raw = max(peak, 1) / ticks
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for factor in (1, 2, 5, 10):
+        if raw <= factor * magnitude:
+            return max(1, factor * magnitude)
+    return 10 * magnitude
+
+
+class QtBarChartWidget(QWidget):
+    """Grouped bar chart painted with QPainter; drop-in for ReportsChartWidget.
+
+    Same plot(labels, present, late, absent, title) API, with a legend, y-axis ticks and
+    per-bar tooltips, but no matplotlib import: it is cheap to create and repaints only
+    when the data changes.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self._labels: tuple = ()
+        self._series: tuple = ((), (), ())
+        self._title = ""
+        # (bar rect, tooltip text) from the last paint, for hit testing
+        self._bar_rects: list[tuple[QRectF, str]] = []
+
+    def plot(self, labels: list[str], present: list[int], late: list[int], absent: list[int], title: str):
+        n = min(len(labels), len(present), len(late), len(absent))
+        labels = tuple(str(label) for label in labels[:n])
+        series = (
+            tuple(int(p or 0) for p in present[:n]),
+            tuple(int(l or 0) for l in late[:n]),
+            tuple(int(a or 0) for a in absent[:n]),
+        )
+        if (labels, series, title) == (self._labels, self._series, self._title):
+            return
+        self._labels, self._series, self._title = labels, series, title
+        self.update()
+
+    # --- Painting ---
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.fillRect(self.rect(), QColor("white"))
+        self._bar_rects = []
+
+        title_font = QFont(self.font())
+        title_font.setPointSize(12)
+        title_font.setBold(True)
+        tick_font = QFont(self.font())
+        tick_font.setPointSize(9)
+        fm = QFontMetrics(tick_font)
+
+        n = len(self._labels)
+        rotate = n > 6
+        label_height = fm.height() + 8
+        if rotate:
+            longest = max((fm.horizontalAdvance(label) for label in self._labels), default=0)
+            label_height = int(longest * math.sin(math.radians(20))) + fm.height() + 8
+        plot = QRectF(self.rect()).adjusted(70, 50, -25, -(label_height + 20))
+        if plot.width() <= 10 or plot.height() <= 10:
+            painter.end()
+            return
+
+        # Title
+        painter.setFont(title_font)
+        painter.setPen(QColor("#1e293b"))
+        painter.drawText(QRectF(0, 10, self.width(), 30), Qt.AlignmentFlag.AlignCenter, self._title)
+
+        # Y axis: gridlines, tick labels and axis title
+        peak = max((max(values) for values in self._series if values), default=0)
+        step = _nice_step(peak * 1.15)
+        top = step * max(1, math.ceil(peak * 1.15 / step))
+        painter.setFont(tick_font)
+        grid_pen = QPen(QColor("#cbd5e1"), 1, Qt.PenStyle.DashLine)
+        value = 0.0
+        while value <= top + 1e-9:
+            y = plot.bottom() - value / top * plot.height()
+            painter.setPen(grid_pen)
+            painter.drawLine(QPointF(plot.left(), y), QPointF(plot.right(), y))
+            painter.setPen(QColor("#475569"))
+            painter.drawText(QRectF(plot.left() - 50, y - 10, 44, 20),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, f"{value:g}")
+            value += step
+        painter.save()
+        painter.translate(16, plot.center().y())
+        painter.rotate(-90)
+        painter.drawText(QRectF(-plot.height() / 2, -10, plot.height(), 20),
+                         Qt.AlignmentFlag.AlignCenter, "Number of Employees")
+        painter.restore()
+
+        painter.setPen(QPen(QColor("#334155"), 1))
+        painter.drawLine(plot.bottomLeft(), plot.bottomRight())
+        painter.drawLine(plot.bottomLeft(), plot.topLeft())
+
+        if n == 0:
+            painter.setPen(QColor("#6b7280"))
+            painter.drawText(plot, Qt.AlignmentFlag.AlignCenter, "No data")
+            painter.end()
+            return
+
+        # Bars, centered in each department's slot
+        slot = plot.width() / n
+        total = len(SERIES) * BAR_WIDTH + (len(SERIES) - 1) * BAR_GAP
+        start = -total / 2.0
+        painter.setPen(Qt.PenStyle.NoPen)
+        for s, ((name, color), values) in enumerate(zip(SERIES, self._series)):
+            fill = QColor(color)
+            fill.setAlphaF(0.9)
+            painter.setBrush(fill)
+            offset = start + s * (BAR_WIDTH + BAR_GAP)
+            for i, v in enumerate(values):
+                x = plot.left() + (i + 0.5 + offset) * slot
+                h = v / top * plot.height()
+                rect = QRectF(x, plot.bottom() - h, BAR_WIDTH * slot, h)
+                painter.drawRect(rect)
+                # Keep zero-height bars hoverable
+                self._bar_rects.append((rect.adjusted(0, -3, 0, 0), f"{self._labels[i]} - {name}: {v}"))
+
+        # X tick labels
+        painter.setPen(QColor("#475569"))
+        for i, label in enumerate(self._labels):
+            cx = plot.left() + (i + 0.5) * slot
+            if rotate:
+                painter.save()
+                painter.translate(cx, plot.bottom() + 8)
+                painter.rotate(-20)
+                width = fm.horizontalAdvance(label)
+                painter.drawText(QRectF(-width, 0, width, fm.height()),
+                                 Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop, label)
+                painter.restore()
+            else:
+                text = fm.elidedText(label, Qt.TextElideMode.ElideRight, int(slot) - 4)
+                painter.drawText(QRectF(cx - slot / 2, plot.bottom() + 6, slot, fm.height()),
+                                 Qt.AlignmentFlag.AlignCenter, text)
+
+        self._paint_legend(painter, plot, fm)
+        painter.end()
+
+    def _paint_legend(self, painter: QPainter, plot: QRectF, fm: QFontMetrics):
+        swatch = 14
+        row_h = max(fm.height(), swatch) + 4
+        width = swatch + 8 + max(fm.horizontalAdvance(name) for name, _ in SERIES) + 16
+        box = QRectF(plot.right() - width - 8, plot.top() + 8, width, row_h * len(SERIES) + 8)
+        painter.setPen(QPen(QColor("#e2e8f0"), 1))
+        painter.setBrush(QColor(255, 255, 255, 230))
+        painter.drawRoundedRect(box, 4, 4)
+        for i, (name, color) in enumerate(SERIES):
+            y = box.top() + 4 + i * row_h
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(color))
+            painter.drawRect(QRectF(box.left() + 8, y + (row_h - swatch) / 2, swatch, swatch))
+            painter.setPen(QColor("#1e293b"))
+            painter.drawText(QRectF(box.left() + 8 + swatch + 6, y, width, row_h),
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, name)
+
+    # --- Tooltips ---
+
+    def event(self, event):
+        if event.type() == QEvent.Type.ToolTip:
+            pos = QPointF(event.pos())
+            for rect, text in self._bar_rects:
+                if rect.contains(pos):
+                    QToolTip.showText(event.globalPos(), text, self)
+                    return True
+            QToolTip.hideText()
+            event.ignore()
+            return True
+        return super().event(event)
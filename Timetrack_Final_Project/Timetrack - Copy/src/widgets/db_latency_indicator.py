@@ -0,0 +1,42 @@
+# src/widgets/db_latency_indicator.py
+from __future__ import annotations
+
+from PyQt6.QtWidgets import QLabel
+
+from ..config import METRICS_INDICATOR_MS
+from ..utils import metrics
+from ..utils.refresh_scheduler import get_refresh_scheduler, PRIORITY_LOW
+
+# (upper bound in ms, dot color): green while queries are fast, amber when slow, red beyond
+LATENCY_LEVELS = ((50.0, "#10b981"), (250.0, "#f59e0b"), (float("inf"), "#ef4444"))
+IDLE_COLOR = "#94a3b8"
+
+
+class DbLatencyIndicator(QLabel):
+    """Small "● DB 12 ms" label for dashboard headers, fed by the metrics registry.
+
+    Shows the moving average of recent statement latency (metrics.db_latency_ms) and turns
+    red with "DB offline" when the last connection attempt failed. Only meaningful while
+    metrics are enabled; refreshed on the shared scheduler.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setToolTip("Average latency of recent database queries")
+        self.setStyleSheet("color: #64748b; background: transparent; font-size: 11px; padding: 0 6px;")
+        self._update()
+        self.job = get_refresh_scheduler().add_job(
+            "db_latency_indicator", self._update, METRICS_INDICATOR_MS, owner=self,
+            priority=PRIORITY_LOW, cost=0,
+        )
+
+    def _update(self) -> None:
+        latency = metrics.db_latency_ms()
+        if metrics.db_online() is False:
+            color, text = LATENCY_LEVELS[-1][1], "DB offline"
+        elif latency is None:
+            color, text = IDLE_COLOR, "DB --"
+        else:
+            color = next(c for bound, c in LATENCY_LEVELS if latency <= bound)
+            text = f"DB {latency:.0f} ms" if latency >= 1 else f"DB {latency:.1f} ms"
+        self.setText(f'<span style="color:{color}">&#9679;</span> {text}')
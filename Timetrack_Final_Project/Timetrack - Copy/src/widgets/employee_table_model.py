@@ -0,0 +1,151 @@
+# src/widgets/employee_table_model.py
+from __future__ import annotations
+from typing import Any, Callable, Optional
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from ..utils.tracing import traced
+
+
+EMPLOYEE_HEADERS = ["Employee ID", "Name", "Position", "Department", "Absences", "Leave Credits", "Actions"]
+EMPLOYEE_ACTION_COLUMN = 6
+
+# Header columns the server-side ordering supports
+SORTABLE_COLUMNS = {0: "id", 1: "name"}
+
+_DISPLAY_KEYS = ('id', 'name', 'position', 'department', 'absences', 'leave_credits')
+
+
+class EmployeeTableModel(QAbstractTableModel):
+    """Lazily paged list of active employees for the Employee Management tab.
+
+    The owner injects the data sources so the model stays free of DB imports:
+    - fetch_page(after, limit, order_by, descending, query) -> list of employee rows (keyset paginated)
+    - fetch_details(employee_ids) -> {employee_id: {'absences', 'leave_credits'}}
+
+    Views pull pages through canFetchMore()/fetchMore() as the user scrolls; details are
+    computed only for the rows of each fetched page. `employee_data` maps id -> row dict for
+    every fetched row (same shape the dashboards' edit/deactivate handlers expect).
+    """
+
+    def __init__(self, fetch_page: Callable[..., list[dict]],
+                 fetch_details: Optional[Callable[[list[int]], dict]] = None,
+                 page_size: int = 50, parent=None):
+        super().__init__(parent)
+        self._fetch_page = fetch_page
+        self._fetch_details = fetch_details
+        self._page_size = max(1, int(page_size))
+        self._rows: list[dict] = []
+        self.employee_data: dict[int, dict] = {}
+        self._after: Optional[tuple] = None
+        self._exhausted = False
+        self._query = ""
+        self._order_by = "name"
+        self._descending = False
+
+    # --- Qt model API ---
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(EMPLOYEE_HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            if 0 <= section < len(EMPLOYEE_HEADERS):
+                return EMPLOYEE_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+            return None
+        emp = self._rows[index.row()]
+        col = index.column()
+        if role == Qt.ItemDataRole.DisplayRole and col < len(_DISPLAY_KEYS):
+            value = emp.get(_DISPLAY_KEYS[col])
+            return "" if value is None else str(value)
+        if role == Qt.ItemDataRole.UserRole:
+            return emp.get('id')
+        return None
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and not self._exhausted
+
+    @traced("populate employee page", "widget")
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid() or self._exhausted:
+            return
+        try:
+            page = self._fetch_page(
+                after=self._after, limit=self._page_size, order_by=self._order_by,
+                descending=self._descending, query=self._query,
+            ) or []
+        except Exception as e:
+            print(f"Failed to fetch employee page: {e}")
+            page = []
+        if len(page) < self._page_size:
+            self._exhausted = True
+        if not page:
+            return
+        last = page[-1]
+        self._after = (last['employee_id'],) if self._order_by == "id" else (last['full_name'], last['employee_id'])
+
+        details: dict = {}
+        if self._fetch_details is not None:
+            try:
+                details = self._fetch_details([emp['employee_id'] for emp in page]) or {}
+            except Exception as e:
+                print(f"Failed to fetch employee details: {e}")
+                details = {}
+
+        new_rows = []
+        for emp in page:
+            emp_id = emp['employee_id']
+            d = details.get(emp_id, {})
+            new_rows.append({
+                'id': emp_id,
+                'name': emp['full_name'],
+                'position': emp.get('position', ''),
+                'department': emp.get('department', ''),
+                'image_path': emp.get('image_path'),
+                'leave_credits': d.get('leave_credits', emp.get('leave_credits', 15)),
+                'absences': int(d.get('absences', 0) or 0),
+            })
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+        self._rows.extend(new_rows)
+        for row in new_rows:
+            self.employee_data[row['id']] = row
+        self.endInsertRows()
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        order_by = SORTABLE_COLUMNS.get(column)
+        if order_by is None:
+            return
+        descending = order == Qt.SortOrder.DescendingOrder
+        if (order_by, descending) == (self._order_by, self._descending):
+            return
+        self._order_by = order_by
+        self._descending = descending
+        self.reload()
+
+    # --- Owner API ---
+
+    def set_filter(self, text: str) -> None:
+        query = (text or "").strip()
+        if query == self._query:
+            return
+        self._query = query
+        self.reload()
+
+    def reload(self) -> None:
+        """Drop all fetched rows and load the first page again."""
+        self.beginResetModel()
+        self._rows = []
+        # Cleared in place: owners keep a reference to this dict
+        self.employee_data.clear()
+        self._after = None
+        self._exhausted = False
+        self.endResetModel()
+        self.fetchMore()
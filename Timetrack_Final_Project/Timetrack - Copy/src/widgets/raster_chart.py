@@ -0,0 +1,128 @@
+# src/widgets/raster_chart.py
+from __future__ import annotations
+from typing import Optional
+
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QImage, QPainter, QColor
+
+from ..utils.workers import Worker, start_worker
+from .reports_chart import draw_report_figure
+
+RESIZE_RENDER_DELAY_MS = 120
+
+
+def render_report_image(labels, series, title, width: int, height: int, dpr: float) -> QImage:
+    """Draw the report figure with the Agg backend into a QImage. Safe to run off the GUI thread:
+    it uses a private Figure/FigureCanvasAgg pair and never touches pyplot or widgets.
+    """
+    from matplotlib.figure import Figure  # type: ignore
+    from matplotlib.backends.backend_agg import FigureCanvasAgg  # type: ignore
+
+    dpi = 100.0 * dpr
+    figure = Figure(figsize=(max(width, 1) / 100.0, max(height, 1) / 100.0), dpi=dpi)
+    canvas = FigureCanvasAgg(figure)
+    draw_report_figure(figure, list(labels), *series, title)
+    canvas.draw()
+    w, h = canvas.get_width_height(physical=True)
+    data = bytes(canvas.buffer_rgba())
+    # copy() detaches the image from `data`, which goes away with this frame
+    image = QImage(data, w, h, QImage.Format.Format_RGBA8888).copy()
+    image.setDevicePixelRatio(dpr)
+    return image
+
+
+class RasterChartWidget(QWidget):
+    """Reports chart rendered by matplotlib/Agg on a worker thread and blitted as an image.
+
+    plot() only records the request. At most one render runs at a time; requests made while
+    it runs are coalesced so only the latest one is drawn next. The previous image stays on
+    screen (scaled on resize) until the new one is ready.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self._image: Optional[QImage] = None
+        self._request = None
+        self._rendered_key = None
+        self._worker: Optional[Worker] = None
+        self._pending = False
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(RESIZE_RENDER_DELAY_MS)
+        self._resize_timer.timeout.connect(self._schedule_render)
+
+    def plot(self, labels: list[str], present: list[int], late: list[int], absent: list[int], title: str):
+        n = min(len(labels), len(present), len(late), len(absent))
+        self._request = (
+            tuple(str(label) for label in labels[:n]),
+            (
+                tuple(int(p or 0) for p in present[:n]),
+                tuple(int(l or 0) for l in late[:n]),
+                tuple(int(a or 0) for a in absent[:n]),
+            ),
+            title,
+        )
+        self._schedule_render()
+
+    # --- Rendering ---
+
+    def _target(self) -> tuple[int, int, float]:
+        return self.width(), self.height(), self.devicePixelRatioF()
+
+    def _schedule_render(self):
+        if self._request is None or self.width() <= 1 or self.height() <= 1:
+            return
+        key = (self._request, self._target())
+        if key == self._rendered_key:
+            return
+        if self._worker is not None:
+            # Picked up with the latest request/size when the running render finishes
+            self._pending = True
+            return
+        labels, series, title = self._request
+        width, height, dpr = self._target()
+        worker = Worker(render_report_image, labels, series, title, width, height, dpr)
+        worker.signals.finished.connect(lambda image, k=key: self._on_rendered(k, image))
+        worker.signals.error.connect(self._on_render_failed)
+        self._worker = start_worker(worker)
+
+    def _on_rendered(self, key, image: QImage):
+        self._worker = None
+        self._image = image
+        self._rendered_key = key
+        self.update()
+        self._render_pending()
+
+    def _on_render_failed(self, message: str):
+        print(f"Chart rendering failed: {message}")
+        self._worker = None
+        self._render_pending()
+
+    def _render_pending(self):
+        if self._pending:
+            self._pending = False
+            self._schedule_render()
+
+    # --- Qt events ---
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("white"))
+        if self._image is not None:
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+            painter.drawImage(self.rect(), self._image)
+        else:
+            painter.setPen(QColor("#6b7280"))
+            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "Rendering chart…")
+        painter.end()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._resize_timer.start()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._schedule_render()
@@ -1,9 +1,16 @@
 # src/widgets/reports_chart.py
 from __future__ import annotations
+import importlib.util
 import os
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from PyQt6.QtCore import Qt
 
+from ..utils.lazy_import import lazy_callable
+
+# Alternative chart implementations, imported only when selected
+QtBarChartWidget = lazy_callable(".bar_chart", "QtBarChartWidget", __package__)
+RasterChartWidget = lazy_callable(".raster_chart", "RasterChartWidget", __package__)
+
 
 MATPLOTLIB_AVAILABLE = False
 
@@ -12,6 +19,77 @@ def _matplotlib_disabled_by_env() -> bool:
     return os.environ.get("Timetrack_DISABLE_CHARTS", "0").strip() in {"1", "true", "True", "yes", "on"}
 
 
+CHART_BACKENDS = ("auto", "qt", "matplotlib", "raster")
+
+
+def _chart_backend_from_env() -> str:
+    backend = os.environ.get("Timetrack_CHART_BACKEND", "auto").strip().lower()
+    return backend if backend in CHART_BACKENDS else "auto"
+
+
+def _matplotlib_installed() -> bool:
+    # find_spec locates the package without importing it
+    return importlib.util.find_spec("matplotlib") is not None
+
+
+def create_reports_chart(parent=None, backend: str | None = None) -> QWidget:
+    """Create the reports chart for `backend` (default: Timetrack_CHART_BACKEND, else "auto").
+
+    "qt" is the QPainter chart (no matplotlib import), "matplotlib" is ReportsChartWidget and
+    "raster" renders with matplotlib's Agg backend on a worker thread. "auto" uses matplotlib
+    when it is installed and not disabled with Timetrack_DISABLE_CHARTS, and the Qt chart
+    otherwise. All backends expose plot(labels, present, late, absent, title).
+    """
+    backend = (backend or _chart_backend_from_env()).lower()
+    if backend == "auto":
+        use_qt = _matplotlib_disabled_by_env() or not _matplotlib_installed()
+        backend = "qt" if use_qt else "matplotlib"
+    if backend == "raster" and _matplotlib_installed() and not _matplotlib_disabled_by_env():
+        return RasterChartWidget(parent)
+    if backend in ("qt", "raster"):
+        return QtBarChartWidget(parent)
+    return ReportsChartWidget(parent)
+
+
+def compute_group_positions(x_vals, n_series=3, bar_width=0.22, gap=0.06):
+    """Compute x positions for each series within a grouped bar chart, centered on x_vals.
+    Returns list of lists: positions for each series.
+    """
+    total = n_series * bar_width + (n_series - 1) * gap
+    start = - (total / 2.0) + (bar_width / 2.0)
+    offsets = [start + i * (bar_width + gap) for i in range(n_series)]
+    series_positions = [[x + off for x in x_vals] for off in offsets]
+    return series_positions
+
+
+def draw_report_figure(figure, labels, present, late, absent, title):
+    """Draw the grouped attendance bars onto a bare matplotlib Figure (no pyplot, no canvas).
+
+    Shared by every matplotlib backend. Returns the axes and the three bar containers.
+    """
+    figure.clear()
+    ax = figure.add_subplot(111)
+    x = list(range(len(labels)))
+    # Use narrower bars and explicit gaps to avoid bars sticking together
+    bar_width = 0.22
+    gap = 0.06
+    x_present, x_late, x_absent = compute_group_positions(x, n_series=3, bar_width=bar_width, gap=gap)
+    bars = (
+        ax.bar(x_present, present, width=bar_width, color="#10b981", label="Present", alpha=0.9),
+        ax.bar(x_late, late, width=bar_width, color="#f59e0b", label="Late", alpha=0.9),
+        ax.bar(x_absent, absent, width=bar_width, color="#ef4444", label="Absent", alpha=0.9),
+    )
+    ax.set_xticks(x)
+    ax.set_xticklabels(labels, rotation=0 if len(labels) <= 6 else 20, ha='right')
+    ax.set_title(title, fontweight='bold')
+    ax.set_ylabel('Number of Employees')
+    ax.grid(True, axis='y', linestyle='--', alpha=0.3)
+    ax.legend()
+    ax.margins(x=0.05)
+    figure.subplots_adjust(left=0.1, bottom=0.2 if len(labels) > 6 else 0.15, right=0.95, top=0.9)
+    return ax, bars
+
+
 class ReportsChartWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -20,6 +98,13 @@ class ReportsChartWidget(QWidget):
 
         self.figure = None
         self.canvas = None
+        # Incremental drawing state (see plot)
+        self._ax = None
+        self._bars = ()
+        self._labels: tuple = ()
+        self._ymax = None
+        self._background = None
+        self._plotted = None
 
         if _matplotlib_disabled_by_env():
             self._create_fallback_widget(layout)
@@ -45,6 +130,7 @@ class ReportsChartWidget(QWidget):
             try:
                 self.figure = self._Figure(figsize=(12, 8))
                 self.canvas = self._FigureCanvas(self.figure)
+                self.canvas.mpl_connect('draw_event', self._on_draw)
                 layout.addWidget(self.canvas)
                 self.load_static_demo_data()
             except Exception:
@@ -61,77 +147,105 @@ class ReportsChartWidget(QWidget):
         lbl.setStyleSheet("color:#6b7280; font-size: 14px; padding: 40px; background: white; border-radius: 8px;")
         layout.addWidget(lbl)
 
-    def _compute_group_positions(self, x_vals, n_series=3, bar_width=0.22, gap=0.06):
-        """Compute x positions for each series within a grouped bar chart, centered on x_vals.
-        Returns list of lists: positions for each series.
-        """
-        total = n_series * bar_width + (n_series - 1) * gap
-        start = - (total / 2.0) + (bar_width / 2.0)
-        offsets = [start + i * (bar_width + gap) for i in range(n_series)]
-        series_positions = [[x + off for x in x_vals] for off in offsets]
-        return series_positions
-
     def load_static_demo_data(self):
         try:
-            if not MATPLOTLIB_AVAILABLE or not self.canvas or not self.figure:
-                return
-            self.figure.clear()
-            ax = self.figure.add_subplot(111)
-            departments = ['IT', 'HR', 'Finance', 'Operations']
-            present = [25, 15, 20, 30]
-            late = [5, 3, 4, 8]
-            absent = [2, 4, 1, 3]
-            x = list(range(len(departments)))
-            # Use narrower bars and explicit gaps to avoid bars sticking together
-            bar_width = 0.22
-            gap = 0.06
-            x_present, x_late, x_absent = self._compute_group_positions(x, n_series=3, bar_width=bar_width, gap=gap)
-            ax.bar(x_present, present, width=bar_width, color="#10b981", label="Present", alpha=0.9)
-            ax.bar(x_late, late, width=bar_width, color="#f59e0b", label="Late", alpha=0.9)
-            ax.bar(x_absent, absent, width=bar_width, color="#ef4444", label="Absent", alpha=0.9)
-            ax.set_xticks(x)
-            ax.set_xticklabels(departments)
-            ax.set_title('Sample Attendance Report', fontweight='bold')
-            ax.set_ylabel('Number of Employees')
-            ax.grid(True, axis='y', linestyle='--', alpha=0.3)
-            ax.legend()
-            ax.margins(x=0.05)
-            self.figure.subplots_adjust(left=0.1, bottom=0.15, right=0.95, top=0.9)
-            self.canvas.draw()
+            self.plot(['IT', 'HR', 'Finance', 'Operations'], [25, 15, 20, 30], [5, 3, 4, 8], [2, 4, 1, 3],
+                      'Sample Attendance Report')
         except Exception as e:
             print(f"Failed to load demo chart data: {e}")
 
     def plot(self, labels: list[str], present: list[int], late: list[int], absent: list[int], title: str):
+        """Show the grouped bars, updating the existing artists in place when possible.
+
+        Nothing is drawn when the data and title are unchanged. The axes are rebuilt only when
+        the department labels change; otherwise bar heights are set in place and only the bars
+        are repainted (blitted over the cached background) unless the y-range has to change.
+        """
         try:
             if not MATPLOTLIB_AVAILABLE or not self.canvas or not self.figure:
                 return
             n = min(len(labels), len(present), len(late), len(absent))
-            labels = labels[:n]
-            present = [int(p or 0) for p in present[:n]]
-            late = [int(l or 0) for l in late[:n]]
-            absent = [int(a or 0) for a in absent[:n]]
-            self.figure.clear()
-            ax = self.figure.add_subplot(111)
-            x = list(range(len(labels)))
-            # Use narrower bars and explicit gaps to avoid bars sticking together
-            bar_width = 0.22 if len(labels) > 0 else 0.22
-            gap = 0.06
-            x_present, x_late, x_absent = self._compute_group_positions(x, n_series=3, bar_width=bar_width, gap=gap)
-            ax.bar(x_present, present, width=bar_width, color="#10b981", label="Present", alpha=0.9)
-            ax.bar(x_late, late, width=bar_width, color="#f59e0b", label="Late", alpha=0.9)
-            ax.bar(x_absent, absent, width=bar_width, color="#ef4444", label="Absent", alpha=0.9)
-            ax.set_xticks(x)
-            ax.set_xticklabels(labels, rotation=0 if len(labels) <= 6 else 20, ha='right')
-            ax.set_title(title, fontweight='bold')
-            ax.set_ylabel('Number of Employees')
-            ax.grid(True, axis='y', linestyle='--', alpha=0.3)
-            ax.legend()
-            ax.margins(x=0.05)
-            self.figure.subplots_adjust(left=0.1, bottom=0.2 if len(labels) > 6 else 0.15, right=0.95, top=0.9)
-            self.canvas.draw()
+            labels = tuple(labels[:n])
+            series = (
+                tuple(int(p or 0) for p in present[:n]),
+                tuple(int(l or 0) for l in late[:n]),
+                tuple(int(a or 0) for a in absent[:n]),
+            )
+            state = (labels, series, title)
+            if state == self._plotted:
+                return
+
+            if self._ax is None or labels != self._labels:
+                self._build_axes(labels)
+            for container, values in zip(self._bars, series):
+                for patch, value in zip(container.patches, values):
+                    patch.set_height(value)
+            full_redraw = self._fit_ylim(max((max(v) for v in series if v), default=0))
+            if title != self._ax.get_title():
+                self._ax.set_title(title, fontweight='bold')
+                full_redraw = True
+            self._plotted = state
+
+            if full_redraw or self._background is None:
+                # Background (axes, ticks, title) changed: recapture it on the next draw
+                self._background = None
+                self.canvas.draw_idle()
+            else:
+                self._blit_bars()
         except Exception as e:
             print(f"Chart plotting failed: {e}")
 
+    def _build_axes(self, labels: tuple):
+        """(Re)create the axes and one bar container per series for this department set.
+
+        Drawn by draw_report_figure with zero heights and no title; plot() sets both.
+        """
+        zeros = [0] * len(labels)
+        ax, self._bars = draw_report_figure(self.figure, labels, zeros, zeros, zeros, "")
+        # Bars are painted separately so value changes can be blitted over the cached background
+        for container in self._bars:
+            for patch in container.patches:
+                patch.set_animated(True)
+        # The legend is repainted after the bars so bars never cover it
+        ax.get_legend().set_animated(True)
+        self._ax = ax
+        self._labels = labels
+        self._ymax = None
+        self._background = None
+
+    def _fit_ylim(self, peak: int) -> bool:
+        """Keep the y-range stable while values fit; return True when it had to change."""
+        top = max(1, peak) * 1.15
+        if self._ymax is not None and peak <= self._ymax and top >= self._ymax * 0.5:
+            return False
+        self._ymax = top
+        self._ax.set_ylim(0, top)
+        return True
+
+    def _on_draw(self, _event):
+        """After a full draw: cache everything but the bars, then paint the bars on top."""
+        if self._ax is None:
+            return
+        if self.canvas.supports_blit:
+            self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_bars()
+
+    def _draw_bars(self):
+        for container in self._bars:
+            for patch in container.patches:
+                self.figure.draw_artist(patch)
+        legend = self._ax.get_legend()
+        if legend is not None:
+            self.figure.draw_artist(legend)
+
+    def _blit_bars(self):
+        if not self.canvas.supports_blit:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_bars()
+        self.canvas.blit(self.figure.bbox)
+
     def closeEvent(self, event):
         try:
             if getattr(self, '_plt', None) is not None and getattr(self, 'figure', None) is not None: